@@ -0,0 +1,167 @@
+"""Offline benchmarks for the LinkedIn SDK against :mod:`mock_linkedin`.
+
+Reports ops/sec, p50/p99 latency and peak traced memory for single calls,
+pagination and media uploads::
+
+    python benchmarks/bench_client.py
+    python benchmarks/bench_client.py --latency-ms 20 --iterations 50 --video-mb 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_linkedin import MockLinkedIn  # noqa: E402
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient  # noqa: E402
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(q * len(ordered)), len(ordered) - 1)
+    return ordered[index]
+
+
+def _peak_memory(op: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        op()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench(name: str, op: Callable[[], object], iterations: int) -> dict:
+    """Run ``op`` ``iterations`` times (after one warm-up) and summarize."""
+    op()
+    samples = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        op()
+        samples.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return {
+        "name": name,
+        "ops_per_sec": iterations / elapsed,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+        "peak_kib": _peak_memory(op) / 1024,
+    }
+
+
+def _write_file(directory: str, name: str, size: int) -> str:
+    path = os.path.join(directory, name)
+    chunk = os.urandom(min(size, 1024 * 1024))
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            f.write(chunk[:remaining])
+            remaining -= len(chunk)
+    return path
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    mock = MockLinkedIn(
+        latency=args.latency_ms / 1000,
+        upload_latency=args.latency_ms / 1000,
+        total_posts=args.posts,
+    )
+    client = LinkedInClient(
+        access_token="bench", person_id="bench", transport=mock.transport()
+    )
+    n = args.iterations
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        image = _write_file(tmp, "image.png", args.image_kb * 1024)
+        video = _write_file(tmp, "video.mp4", args.video_mb * 1024 * 1024)
+        images = [_write_file(tmp, f"img{i}.png", args.image_kb * 1024) for i in range(9)]
+        urns = [f"urn:li:share:{i}" for i in range(100)]
+
+        results.append(bench("get_user_info", client.get_user_info, n))
+        results.append(bench("create_post", lambda: client.create_post("bench"), n))
+        results.append(
+            bench("add_comment", lambda: client.add_comment(urns[0], "nice"), n)
+        )
+        results.append(
+            bench("add_reaction", lambda: client.add_reaction(urns[0], "LIKE"), n)
+        )
+        results.append(
+            bench("get_my_posts(100)", lambda: client.get_my_posts(limit=100), n)
+        )
+        results.append(
+            bench(
+                f"iter_my_posts({args.posts})",
+                lambda: sum(1 for _ in client.iter_my_posts()),
+                max(n // 10, 1),
+            )
+        )
+        results.append(bench("get_posts(100 urns)", lambda: client.get_posts(urns), n))
+        results.append(
+            bench(
+                f"create_post_with_image({args.image_kb} KiB)",
+                lambda: client.create_post_with_image("bench", image),
+                n,
+            )
+        )
+        results.append(
+            bench(
+                "create_post_with_multi_images(9)",
+                lambda: client.create_post_with_multi_images("bench", images),
+                max(n // 5, 1),
+            )
+        )
+        results.append(
+            bench(
+                f"create_post_with_video({args.video_mb} MiB)",
+                lambda: client.create_post_with_video("bench", video),
+                max(n // 10, 1),
+            )
+        )
+
+    async_mock_transport = mock.async_transport()
+
+    async def gather_posts() -> None:
+        async with AsyncLinkedInClient(
+            access_token="bench", person_id="bench", transport=async_mock_transport
+        ) as aclient:
+            await asyncio.gather(*(aclient.create_post("bench") for _ in range(50)))
+
+    results.append(
+        bench("async create_post x50", lambda: asyncio.run(gather_posts()), max(n // 5, 1))
+    )
+
+    client.close()
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock API latency")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=1000, help="Posts in the mock feed")
+    parser.add_argument("--image-kb", type=int, default=512)
+    parser.add_argument("--video-mb", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    print(f"{'benchmark':<40} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>10}")
+    for r in run(args):
+        print(
+            f"{r['name']:<40} {r['ops_per_sec']:>10.1f} {r['p50_ms']:>9.2f} "
+            f"{r['p99_ms']:>9.2f} {r['peak_kib']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
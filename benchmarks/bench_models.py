@@ -0,0 +1,77 @@
+"""Memory held by a post history as raw dicts vs compact :class:`Post` models.
+
+Decodes ``--posts`` posts from JSON (as the client does) and measures, with
+tracemalloc, how much memory stays allocated while they are all kept::
+
+    python benchmarks/bench_models.py
+    python benchmarks/bench_models.py --posts 50000 --commentary 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_linkedin import MockLinkedIn  # noqa: E402
+
+from linkedin_sdk import Post  # noqa: E402
+from linkedin_sdk.codec import _decode_body  # noqa: E402
+
+
+def _retained(build: Callable[[], list]) -> tuple[int, int]:
+    """Return (bytes retained by build's result, peak bytes while building)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, peak = tracemalloc.get_traced_memory()
+        del kept
+        return current, peak
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--commentary", type=int, default=500, help="Characters per post")
+    args = parser.parse_args(argv)
+
+    mock = MockLinkedIn(commentary_size=args.commentary, total_posts=args.posts)
+    pages = [
+        json.dumps(
+            {"elements": [mock._post(n) for n in range(start, min(start + args.page_size, args.posts))]}
+        ).encode()
+        for start in range(0, args.posts, args.page_size)
+    ]
+
+    def as_dicts() -> list:
+        return [post for body in pages for post in _decode_body(body)["elements"]]
+
+    def as_models() -> list:
+        return [
+            Post.from_api(post) for body in pages for post in _decode_body(body)["elements"]
+        ]
+
+    dict_bytes, dict_peak = _retained(as_dicts)
+    model_bytes, model_peak = _retained(as_models)
+    print(f"{args.posts} posts, {args.commentary}-char commentary")
+    print(f"{'representation':<16} {'retained KiB':>13} {'B/post':>8} {'peak KiB':>10}")
+    for name, kept, peak in (
+        ("dict", dict_bytes, dict_peak),
+        ("Post", model_bytes, model_peak),
+    ):
+        print(f"{name:<16} {kept / 1024:>13.0f} {kept / args.posts:>8.0f} {peak / 1024:>10.0f}")
+    print(f"Post models retain {1 - model_bytes / dict_bytes:.0%} less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Cold-start benchmarks: package import and client construction.
+
+Each sample runs in a fresh interpreter so module caches don't hide import
+cost; medians over ``--runs`` samples are reported::
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Timed in the child process; prints one JSON object of millisecond timings.
+_SCENARIOS = {
+    "import linkedin_sdk": "import linkedin_sdk",
+    "LinkedInClient()": (
+        "from linkedin_sdk import LinkedInClient\n"
+        "LinkedInClient(access_token='x', person_id='y', load_env=False)"
+    ),
+    "LinkedInClient().get_auth_url()": (
+        "from linkedin_sdk import LinkedInClient\n"
+        "LinkedInClient(load_env=False).get_auth_url('id', 'https://localhost/cb')"
+    ),
+    "AsyncLinkedInClient()": (
+        "from linkedin_sdk import AsyncLinkedInClient\n"
+        "AsyncLinkedInClient(access_token='x', person_id='y', load_env=False)"
+    ),
+    "LinkedInClient() + first HTTP client": (
+        "from linkedin_sdk import LinkedInClient\n"
+        "LinkedInClient(access_token='x', person_id='y', load_env=False)._http"
+    ),
+}
+
+_CHILD = """\
+import json, time
+t0 = time.perf_counter()
+exec(compile({code!r}, "<bench>", "exec"))
+print(json.dumps({{"ms": (time.perf_counter() - t0) * 1000}}))
+"""
+
+
+def _sample(code: str) -> float:
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    pythonpath = os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+    env = dict(os.environ, PYTHONPATH=pythonpath)
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+    return json.loads(out)["ms"]
+
+
+def run(runs: int) -> list[dict]:
+    results = []
+    for name, code in _SCENARIOS.items():
+        _sample(code)  # warm the OS file cache
+        samples = [_sample(code) for _ in range(runs)]
+        results.append(
+            {
+                "name": name,
+                "p50_ms": statistics.median(samples),
+                "min_ms": min(samples),
+                "max_ms": max(samples),
+            }
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Fresh interpreters per scenario")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<40} {'p50 ms':>9} {'min ms':>9} {'max ms':>9}")
+    for r in run(args.runs):
+        print(f"{r['name']:<40} {r['p50_ms']:>9.2f} {r['min_ms']:>9.2f} {r['max_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""In-process stand-in for the LinkedIn API, served through a custom httpx transport.
+
+Emulates the endpoints the SDK calls (/rest/posts, /rest/images,
+/rest/documents, /rest/videos, /rest/socialActions, /rest/reactions,
+/v2/userinfo and the pre-signed upload host) with configurable latency and
+payload sizes, so the SDK's own overhead can be measured offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import re
+import threading
+import time
+from urllib.parse import parse_qs, unquote
+
+import httpx
+
+UPLOAD_HOST = "upload.mock.linkedin"
+
+_BATCH_IDS_RE = re.compile(r"ids=List\(([^)]*)\)")
+
+
+class MockLinkedIn:
+    """Mock LinkedIn API.
+
+    Args:
+        latency: Seconds each API response is delayed.
+        upload_latency: Seconds each upload PUT is delayed.
+        total_posts: Number of posts returned by the author finder.
+        commentary_size: Characters of commentary per listed post.
+        video_part_size: Bytes per video part in uploadInstructions.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        upload_latency: float = 0.0,
+        total_posts: int = 1000,
+        commentary_size: int = 500,
+        video_part_size: int = 4 * 1024 * 1024,
+    ):
+        self.latency = latency
+        self.upload_latency = upload_latency
+        self.total_posts = total_posts
+        self.commentary_size = commentary_size
+        self.video_part_size = video_part_size
+        self.uploaded_bytes = 0
+        self.request_count = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    # ---- transports -------------------------------------------------------
+
+    def transport(self) -> httpx.BaseTransport:
+        """Transport for :class:`LinkedInClient` (latency blocks the calling thread)."""
+        return _SyncTransport(self)
+
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        """Transport for :class:`AsyncLinkedInClient` (latency awaits asyncio.sleep)."""
+        return _AsyncTransport(self)
+
+    def _delay(self, request: httpx.Request) -> float:
+        return self.upload_latency if request.url.host == UPLOAD_HOST else self.latency
+
+    # ---- routing ----------------------------------------------------------
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.request_count += 1
+        path = request.url.path
+        method = request.method
+        query = request.url.query.decode()
+
+        if path == "/v2/userinfo":
+            return httpx.Response(
+                200,
+                json={"sub": "mock", "name": "Mock Member", "email": "mock@example.com"},
+            )
+        if path == "/rest/posts" and method == "GET":
+            match = _BATCH_IDS_RE.search(request.url.raw_path.decode())
+            if match:
+                return self._batch_get(match.group(1))
+            return self._posts_page(parse_qs(query))
+        if path == "/rest/posts" and method == "POST":
+            return httpx.Response(201, headers={"x-restli-id": self._urn("share")})
+        if path == "/rest/posts" and method == "DELETE":
+            match = _BATCH_IDS_RE.search(request.url.raw_path.decode())
+            ids = [unquote(i) for i in match.group(1).split(",")] if match else []
+            return httpx.Response(
+                200, json={"results": {i: {"status": 204} for i in ids}, "errors": {}}
+            )
+        if path.startswith("/rest/posts/"):
+            return httpx.Response(204 if method == "DELETE" else 200)
+        if path in ("/rest/images", "/rest/documents"):
+            kind = path.rsplit("/", 1)[1][:-1]
+            return httpx.Response(
+                200,
+                json={
+                    "value": {
+                        "uploadUrl": f"https://{UPLOAD_HOST}/{kind}/{next(self._ids)}",
+                        kind: self._urn(kind),
+                    }
+                },
+            )
+        if path == "/rest/videos":
+            if "finalizeUpload" in query:
+                return httpx.Response(200)
+            return self._init_video(request)
+        if path.startswith("/rest/socialActions/"):
+            return httpx.Response(201, headers={"x-restli-id": self._urn("comment")})
+        if path == "/rest/reactions":
+            return httpx.Response(201)
+        return httpx.Response(404, json={"message": f"No mock for {method} {path}"})
+
+    # ---- responses --------------------------------------------------------
+
+    def _urn(self, kind: str) -> str:
+        return f"urn:li:{kind}:{next(self._ids)}"
+
+    def _post(self, n: int) -> dict:
+        return {
+            "id": f"urn:li:share:{n}",
+            "author": "urn:li:person:mock",
+            "commentary": ("lorem ipsum " * (self.commentary_size // 12 + 1))[
+                : self.commentary_size
+            ],
+            "visibility": "PUBLIC",
+            "lifecycleState": "PUBLISHED",
+            "createdAt": 1_700_000_000_000 - n * 60_000,
+            "lastModifiedAt": 1_700_000_000_000 - n * 60_000,
+            "distribution": {"feedDistribution": "MAIN_FEED"},
+        }
+
+    def _posts_page(self, params: dict[str, list[str]]) -> httpx.Response:
+        start = int(params.get("start", ["0"])[0])
+        count = int(params.get("count", ["10"])[0])
+        stop = min(start + count, self.total_posts)
+        return httpx.Response(
+            200,
+            json={
+                "elements": [self._post(n) for n in range(start, stop)],
+                "paging": {"start": start, "count": count, "total": self.total_posts},
+            },
+        )
+
+    def _batch_get(self, raw_ids: str) -> httpx.Response:
+        ids = [unquote(i) for i in raw_ids.split(",")]
+        return httpx.Response(
+            200,
+            json={
+                "results": {i: self._post(int(i.rsplit(":", 1)[1])) for i in ids},
+                "errors": {},
+            },
+        )
+
+    def _init_video(self, request: httpx.Request) -> httpx.Response:
+        size = json.loads(request.content)["initializeUploadRequest"]["fileSizeBytes"]
+        video_id = next(self._ids)
+        instructions = [
+            {
+                "uploadUrl": f"https://{UPLOAD_HOST}/video/{video_id}/{part}",
+                "firstByte": first,
+                "lastByte": min(first + self.video_part_size, size) - 1,
+            }
+            for part, first in enumerate(range(0, size, self.video_part_size))
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "value": {
+                    "video": f"urn:li:video:{video_id}",
+                    "uploadToken": "",
+                    "uploadInstructions": instructions,
+                }
+            },
+        )
+
+    def _upload_response(self, size: int) -> httpx.Response:
+        with self._lock:
+            self.uploaded_bytes += size
+        return httpx.Response(201, headers={"etag": f"etag-{next(self._ids)}"})
+
+
+# httpx.MockTransport reads the whole request body before calling its
+# handler, which would buffer every upload; these transports consume upload
+# streams chunk by chunk so peak-memory numbers reflect the SDK alone.
+
+
+class _SyncTransport(httpx.BaseTransport):
+    def __init__(self, mock: MockLinkedIn):
+        self.mock = mock
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.mock._delay(request)
+        if delay:
+            time.sleep(delay)
+        if request.url.host == UPLOAD_HOST:
+            size = sum(len(chunk) for chunk in request.stream)
+            return self.mock._upload_response(size)
+        request.read()
+        return self.mock.handle(request)
+
+
+class _AsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, mock: MockLinkedIn):
+        self.mock = mock
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.mock._delay(request)
+        if delay:
+            await asyncio.sleep(delay)
+        if request.url.host == UPLOAD_HOST:
+            size = 0
+            async for chunk in request.stream:
+                size += len(chunk)
+            return self.mock._upload_response(size)
+        await request.aread()
+        return self.mock.handle(request)
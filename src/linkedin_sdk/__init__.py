@@ -1,3 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .client import LinkedInClient
+from .cache import DiskCache, MemoryCache, ResponseCache
+from .codec import JSONCodec, get_json_codec, set_json_codec
+from .engagement import EngagementResult
+from .images import ImageProcessor
+from .media_cache import MediaCache
+from .metrics import MetricsRegistry, RequestEvent
+from .post_index import PostIndex
+from .ratelimit import RateLimiter, TokenBucket
+from .tokens import TokenManager
+from .upload_journal import UploadJournal
+
+if TYPE_CHECKING:
+    from .async_client import AsyncLinkedInClient
+    from .client_pool import AccountResult, LinkedInClientPool
+    from .export import PostExporter
+    from .models import MediaUpload, Paging, Post, PostPage, UploadPart
+    from .pipeline import PostSpec, PublishPipeline, PublishResult
+
+# Exports imported on first access, so sync-only users don't pay for
+# asyncio, the pipeline's executors or the response models at import time.
+_LAZY_EXPORTS = {
+    "AsyncLinkedInClient": ".async_client",
+    "AccountResult": ".client_pool",
+    "LinkedInClientPool": ".client_pool",
+    "MediaUpload": ".models",
+    "Paging": ".models",
+    "Post": ".models",
+    "PostPage": ".models",
+    "PostExporter": ".export",
+    "UploadPart": ".models",
+    "PostSpec": ".pipeline",
+    "PublishPipeline": ".pipeline",
+    "PublishResult": ".pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["LinkedInClient"]
+__all__ = [
+    "LinkedInClient",
+    "AsyncLinkedInClient",
+    "AccountResult",
+    "LinkedInClientPool",
+    "DiskCache",
+    "EngagementResult",
+    "ImageProcessor",
+    "JSONCodec",
+    "MediaCache",
+    "MediaUpload",
+    "MemoryCache",
+    "MetricsRegistry",
+    "Paging",
+    "Post",
+    "PostPage",
+    "PostExporter",
+    "PostIndex",
+    "PostSpec",
+    "PublishPipeline",
+    "PublishResult",
+    "RateLimiter",
+    "RequestEvent",
+    "ResponseCache",
+    "TokenBucket",
+    "TokenManager",
+    "UploadJournal",
+    "UploadPart",
+    "get_json_codec",
+    "set_json_codec",
+]
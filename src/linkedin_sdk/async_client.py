@@ -0,0 +1,396 @@
+"""Asynchronous LinkedIn API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, Any
+
+from .posts import AsyncPostsMixin
+from .media import AsyncMediaMixin
+from .engagement import AsyncEngagementMixin
+from .users import AsyncUsersMixin
+from .auth import AsyncAuthMixin, _hybridmethod
+from .convenience import AsyncConvenienceMixin
+from .cache import ResponseCache, _cache_key
+from .codec import _decode_body, _dumps
+from .metrics import RequestEvent, RequestHook
+from .ratelimit import RateLimiter, _endpoint_family
+from .images import ImageProcessor
+from .media_cache import MediaCache
+from .post_index import PostIndex
+from .tokens import TokenManager
+from .upload_journal import UploadJournal
+from .client import (
+    DEFAULT_API_VERSION,
+    DEFAULT_API_POOL_SIZE,
+    DEFAULT_UPLOAD_POOL_SIZE,
+    LINKEDIN_OAUTH_HOST,
+    LINKEDIN_REST_BASE,
+    LINKEDIN_V2_BASE,
+    _BATCH_DELETE_HEADERS,
+    _OAUTH_HEADERS,
+    _BaseClient,
+    _LazyHTTP,
+    _cache_entry,
+    _http2_available,
+    _inflight_key,
+    _pool_limits,
+    _created_http,
+    _raise_for_status,
+    _rest_headers,
+    _upload_headers,
+    _v2_headers,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncLinkedInClient(
+    AsyncPostsMixin,
+    AsyncMediaMixin,
+    AsyncEngagementMixin,
+    AsyncUsersMixin,
+    AsyncAuthMixin,
+    AsyncConvenienceMixin,
+    _BaseClient,
+):
+    """Asyncio Python client for the LinkedIn API v202510.
+
+    Exposes the same methods as :class:`LinkedInClient` as coroutines, so many
+    requests can be kept in flight on a single event loop::
+
+        async with AsyncLinkedInClient() as client:
+            results = await asyncio.gather(
+                *(client.create_post(text) for text in texts)
+            )
+    """
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        person_id: str | None = None,
+        api_version: str = DEFAULT_API_VERSION,
+        upload_pool_size: int = DEFAULT_UPLOAD_POOL_SIZE,
+        api_pool_size: int = DEFAULT_API_POOL_SIZE,
+        http2: bool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        on_request: RequestHook | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        coalesce: bool = True,
+        load_env: bool = True,
+        token_manager: TokenManager | None = None,
+        media_cache: MediaCache | None = None,
+        image_processor: ImageProcessor | None = None,
+        upload_journal: UploadJournal | None = None,
+        post_index: PostIndex | None = None,
+    ):
+        """See :class:`LinkedInClient` for arguments."""
+        if access_token is None and token_manager is not None:
+            access_token = token_manager.access_token
+        super().__init__(access_token, person_id, api_version, load_env)
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.on_request = on_request
+        self._transport = transport
+        self._upload_pool_size = upload_pool_size
+        self._api_pool_size = api_pool_size
+        self._http2 = _http2_available() if http2 is None else http2
+        self.coalesce = coalesce
+        self._inflight: dict[tuple, asyncio.Future[bytes]] = {}
+        self.media_cache = media_cache
+        self.image_processor = image_processor
+        self.upload_journal = upload_journal
+        self.post_index = post_index
+        self.token_manager = token_manager
+        if token_manager is not None:
+            token_manager.attach(self)
+
+    def _build_api_transport(self) -> httpx.AsyncBaseTransport:
+        """Connection pool to api.linkedin.com shared by the REST and v2 clients."""
+        if self._transport is not None:
+            return self._transport
+        import httpx
+
+        return httpx.AsyncHTTPTransport(
+            http2=self._http2, limits=_pool_limits(self._api_pool_size)
+        )
+
+    def _build_http(self) -> httpx.AsyncClient:
+        """REST client for /rest/ endpoints."""
+        import httpx
+
+        return httpx.AsyncClient(
+            base_url=LINKEDIN_REST_BASE,
+            headers=_rest_headers(self.access_token, self.api_version),
+            timeout=60.0,
+            transport=self._api_transport,
+        )
+
+    def _build_http_v2(self) -> httpx.AsyncClient:
+        """V2 client for /v2/ endpoints (userinfo)."""
+        import httpx
+
+        return httpx.AsyncClient(
+            base_url=LINKEDIN_V2_BASE,
+            headers=_v2_headers(self.access_token),
+            timeout=30.0,
+            transport=self._api_transport,
+        )
+
+    def _build_http_oauth(self) -> httpx.AsyncClient:
+        import httpx
+
+        return httpx.AsyncClient(timeout=30.0)
+
+    def _build_http_upload(self) -> httpx.AsyncClient:
+        """Pooled client for PUTs to pre-signed upload URLs."""
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=300.0,
+            limits=_pool_limits(self._upload_pool_size),
+            http2=self._http2,
+            transport=self._transport,
+        )
+
+    _api_transport = _LazyHTTP(_build_api_transport)
+    _http = _LazyHTTP(_build_http)
+    _http_v2 = _LazyHTTP(_build_http_v2)
+    _http_upload = _LazyHTTP(_build_http_upload)
+    # Keep-alive client for OAuth token calls made through this instance. It
+    # is per instance, not per process: an AsyncClient's pooled connections
+    # belong to the event loop that opened them.
+    _http_oauth = _LazyHTTP(_build_http_oauth)
+
+    # ---- low-level helpers ------------------------------------------------
+
+    async def _request(
+        self, http: httpx.AsyncClient, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, applying the rate limiter and retrying throttled (429) responses.
+
+        Successful writes invalidate cached reads of the same endpoint family.
+        """
+        await self._ensure_fresh_token()
+        hook = self.on_request
+        start = time.perf_counter() if hook is not None else 0.0
+        limiter = self.rate_limiter
+        retries = 0
+        if limiter is None:
+            resp = await http.request(method, path, **kwargs)
+        else:
+            resp, retries = await self._request_with_retries(
+                limiter, http, method, path, **kwargs
+            )
+        if hook is not None:
+            hook(
+                RequestEvent(
+                    method=method,
+                    endpoint=_endpoint_family(path),
+                    status_code=resp.status_code,
+                    duration=time.perf_counter() - start,
+                    retries=retries,
+                    request_bytes=len(resp.request.content),
+                    response_bytes=len(resp.content),
+                )
+            )
+        _raise_for_status(resp)
+        if method != "GET" and self.cache is not None:
+            self.cache.invalidate(_endpoint_family(path))
+        return resp
+
+    async def _request_with_retries(
+        self,
+        limiter: RateLimiter,
+        http: httpx.AsyncClient,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> tuple[httpx.Response, int]:
+        """Send with rate limiting; return the final response and the retry count."""
+        attempt = 0
+        while True:
+            await limiter.acquire_async(path)
+            resp = await http.request(method, path, **kwargs)
+            if not limiter.should_retry(resp, attempt):
+                return resp, attempt
+            await asyncio.sleep(limiter.retry_delay(resp, attempt))
+            attempt += 1
+
+    async def _cached_get(
+        self,
+        http: httpx.AsyncClient,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """GET a JSON resource, coalescing identical in-flight reads.
+
+        See :meth:`LinkedInClient._cached_get`. Waiting tasks are shielded
+        from each other's cancellation; if the task doing the fetch is
+        cancelled, the others fetch for themselves.
+        """
+        if not self.coalesce:
+            return _decode_body(await self._fetch_get(http, path, params))
+
+        key = _inflight_key(http, path, params)
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                return _decode_body(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            return _decode_body(await self._fetch_get(http, path, params))
+
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            content = await self._fetch_get(http, path, params)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved by waiters, if any; don't warn when there are none.
+            future.exception()
+            raise
+        else:
+            future.set_result(content)
+        finally:
+            del self._inflight[key]
+        return _decode_body(content)
+
+    async def _fetch_get(
+        self,
+        http: httpx.AsyncClient,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        """GET a resource body, serving and revalidating through ``self.cache``."""
+        cache = self.cache
+        if cache is None:
+            return (await self._request(http, "GET", path, params=params)).content
+
+        tag = _endpoint_family(path)
+        key = _cache_key(tag, str(http.base_url), path, params, self.access_token)
+        entry = cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry.content
+
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+        resp = await self._request(http, "GET", path, params=params, headers=headers)
+        content = entry.content if resp.status_code == 304 and entry else resp.content
+        cache.set(key, _cache_entry(resp, content, tag, cache.ttl))
+        return content
+
+    async def _get(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        return await self._cached_get(self._http, path, params)
+
+    async def _post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """POST to a /rest/ endpoint. Returns the full Response for header access."""
+        return await self._request(
+            self._http, "POST", path, content=_dumps(json or {}), headers=extra_headers
+        )
+
+    async def _delete(self, path: str) -> int:
+        resp = await self._request(self._http, "DELETE", path)
+        return resp.status_code
+
+    async def _batch_delete(self, path: str) -> dict[str, Any]:
+        """Rest.li BATCH_DELETE on a /rest/ collection. Returns the per-id results body."""
+        resp = await self._request(
+            self._http, "DELETE", path, headers=_BATCH_DELETE_HEADERS
+        )
+        return _decode_body(resp.content)
+
+    async def _get_v2(self, path: str) -> dict[str, Any]:
+        return await self._cached_get(self._http_v2, path)
+
+    async def _put_binary(
+        self,
+        url: str,
+        data: bytes | AsyncIterable[bytes],
+        content_type: str,
+        content_length: int | None = None,
+    ) -> httpx.Response:
+        """PUT binary data to an upload URL (S3 pre-signed).
+
+        ``data`` may be a chunk iterator; pass ``content_length`` with it so the
+        body is sent with a fixed length rather than chunked transfer encoding,
+        which pre-signed upload URLs reject.
+        """
+        await self._ensure_fresh_token()
+        headers = _upload_headers(self.access_token, content_type, content_length)
+        hook = self.on_request
+        start = time.perf_counter() if hook is not None else 0.0
+        resp = await self._http_upload.put(url, content=data, headers=headers)
+        if hook is not None:
+            hook(
+                RequestEvent(
+                    method="PUT",
+                    endpoint="upload",
+                    status_code=resp.status_code,
+                    duration=time.perf_counter() - start,
+                    request_bytes=(
+                        content_length
+                        if content_length is not None
+                        else len(data) if isinstance(data, bytes) else 0
+                    ),
+                    response_bytes=len(resp.content),
+                )
+            )
+        resp.raise_for_status()
+        return resp
+
+    @_hybridmethod
+    async def _oauth_post(
+        owner: AsyncLinkedInClient | type[AsyncLinkedInClient],
+        path: str,
+        params: dict[str, str],
+    ) -> dict[str, Any]:
+        """POST form-encoded data to the LinkedIn OAuth endpoint.
+
+        Called on an instance, this reuses the instance's keep-alive OAuth
+        client (closed by :meth:`close`); called on the class, it uses a
+        short-lived client.
+        """
+        url = f"{LINKEDIN_OAUTH_HOST}{path}"
+        if isinstance(owner, AsyncLinkedInClient):
+            resp = await owner._http_oauth.post(url, data=params, headers=_OAUTH_HEADERS)
+        else:
+            import httpx
+
+            async with httpx.AsyncClient(timeout=30.0) as oauth_http:
+                resp = await oauth_http.post(url, data=params, headers=_OAUTH_HEADERS)
+        resp.raise_for_status()
+        return _decode_body(resp.content)
+
+    async def _ensure_fresh_token(self) -> None:
+        """Refresh the token (off the event loop) if the manager says it is due."""
+        manager = self.token_manager
+        if manager is not None and manager.needs_refresh():
+            await asyncio.to_thread(manager.ensure_fresh)
+
+    async def close(self) -> None:
+        if self.token_manager is not None:
+            self.token_manager.detach(self)
+        for http in _created_http(
+            self, "_http", "_http_v2", "_http_upload", "_http_oauth"
+        ):
+            await http.aclose()
+
+    async def __aenter__(self) -> AsyncLinkedInClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -2,10 +2,47 @@
 
 from __future__ import annotations
 
+import functools
+import types
+from collections.abc import Callable
 from typing import Any
 from urllib.parse import urlencode
 
 
+class _hybridmethod:
+    """Like :func:`classmethod`, but binds to the instance when called on one."""
+
+    def __init__(self, func: Callable[..., Any]):
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Callable[..., Any]:
+        return types.MethodType(self.func, objtype if obj is None else obj)
+
+
+def _exchange_code_params(
+    code: str, client_id: str, client_secret: str, redirect_uri: str
+) -> dict[str, str]:
+    return {
+        "grant_type": "authorization_code",
+        "code": code,
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "redirect_uri": redirect_uri,
+    }
+
+
+def _refresh_token_params(
+    refresh_token: str, client_id: str, client_secret: str
+) -> dict[str, str]:
+    return {
+        "grant_type": "refresh_token",
+        "refresh_token": refresh_token,
+        "client_id": client_id,
+        "client_secret": client_secret,
+    }
+
+
 class AuthMixin:
     """Mixin providing OAuth API methods."""
 
@@ -62,13 +99,7 @@ class AuthMixin:
         """
         return cls._oauth_post(
             "/oauth/v2/accessToken",
-            {
-                "grant_type": "authorization_code",
-                "code": code,
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "redirect_uri": redirect_uri,
-            },
+            _exchange_code_params(code, client_id, client_secret, redirect_uri),
         )
 
     @classmethod
@@ -90,10 +121,47 @@ class AuthMixin:
         """
         return cls._oauth_post(
             "/oauth/v2/accessToken",
-            {
-                "grant_type": "refresh_token",
-                "refresh_token": refresh_token,
-                "client_id": client_id,
-                "client_secret": client_secret,
-            },
+            _refresh_token_params(refresh_token, client_id, client_secret),
+        )
+
+
+class AsyncAuthMixin(AuthMixin):
+    """Async counterpart of :class:`AuthMixin`.
+
+    ``get_auth_url`` performs no I/O and is inherited unchanged. The token
+    methods work on the class as on :class:`AuthMixin`; called on a client
+    instance they reuse its keep-alive OAuth connection.
+    """
+
+    @_hybridmethod
+    async def exchange_code(
+        owner,
+        code: str,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+    ) -> dict[str, Any]:
+        """Exchange an authorization code for an access token.
+
+        See :meth:`AuthMixin.exchange_code`.
+        """
+        return await owner._oauth_post(
+            "/oauth/v2/accessToken",
+            _exchange_code_params(code, client_id, client_secret, redirect_uri),
+        )
+
+    @_hybridmethod
+    async def refresh_token(
+        owner,
+        refresh_token: str,
+        client_id: str,
+        client_secret: str,
+    ) -> dict[str, Any]:
+        """Refresh an expired access token.
+
+        See :meth:`AuthMixin.refresh_token`.
+        """
+        return await owner._oauth_post(
+            "/oauth/v2/accessToken",
+            _refresh_token_params(refresh_token, client_id, client_secret),
         )
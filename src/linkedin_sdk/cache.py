@@ -0,0 +1,175 @@
+"""Response caches for read endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body.
+
+    ``content`` holds the raw response bytes so every hit decodes a fresh
+    object and callers cannot mutate the cached copy.
+    """
+
+    content: bytes
+    etag: str
+    expires_at: float
+    tag: str
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+def _cache_key(
+    tag: str,
+    base: str,
+    path: str,
+    params: dict[str, Any] | None,
+    access_token: str | None,
+) -> str:
+    """Build a cache key from the request target and (a hash of) the token.
+
+    Keys are prefixed with ``tag`` so backends can invalidate a family cheaply.
+    """
+    token_hash = hashlib.sha256((access_token or "").encode()).hexdigest()
+    raw = json.dumps([base, path, sorted((params or {}).items()), token_hash])
+    return f"{tag}-{hashlib.sha256(raw.encode()).hexdigest()}"
+
+
+class ResponseCache(ABC):
+    """Base class for response caches.
+
+    Subclasses implement :meth:`get`, :meth:`set`, :meth:`invalidate` and
+    :meth:`clear`. Entries expire ``ttl`` seconds after they are stored;
+    expired entries that carry an ETag are revalidated with If-None-Match.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under ``key``, or ``None``."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``."""
+
+    @abstractmethod
+    def invalidate(self, tag: str) -> None:
+        """Drop every entry stored under ``tag`` (an endpoint family such as ``posts``)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-memory LRU cache with a TTL.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Seconds an entry is served without contacting the API.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tag: str) -> None:
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.tag == tag]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(ResponseCache):
+    """On-disk cache storing one file per entry, shared across processes.
+
+    Args:
+        directory: Directory holding the cache files (created if missing).
+        ttl: Seconds an entry is served without contacting the API.
+    """
+
+    def __init__(self, directory: str, ttl: float = 300.0):
+        super().__init__(ttl)
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(
+            content=raw["content"].encode("utf-8"),
+            etag=raw["etag"],
+            expires_at=raw["expires_at"],
+            tag=raw["tag"],
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "content": entry.content.decode("utf-8"),
+                    "etag": entry.etag,
+                    "expires_at": entry.expires_at,
+                    "tag": entry.tag,
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+
+    def invalidate(self, tag: str) -> None:
+        prefix = f"{tag}-"
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
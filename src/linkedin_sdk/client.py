@@ -3,25 +3,233 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
-import httpx
-from dotenv import load_dotenv
-
 from .posts import PostsMixin
 from .media import MediaMixin
 from .engagement import EngagementMixin
 from .users import UsersMixin
 from .auth import AuthMixin
 from .convenience import ConvenienceMixin
+from .cache import CacheEntry, ResponseCache, _cache_key
+from .codec import _decode_body, _dumps
+from .metrics import RequestEvent, RequestHook
+from .ratelimit import RateLimiter, _endpoint_family
+from .images import ImageProcessor
+from .media_cache import MediaCache
+from .post_index import PostIndex
+from .tokens import TokenManager
+from .upload_journal import UploadJournal
 
-load_dotenv()
+if TYPE_CHECKING:
+    import httpx
 
 LINKEDIN_REST_BASE = "https://api.linkedin.com/rest"
 LINKEDIN_V2_BASE = "https://api.linkedin.com/v2"
 LINKEDIN_OAUTH_HOST = "https://www.linkedin.com"
 DEFAULT_API_VERSION = "202510"
+DEFAULT_UPLOAD_POOL_SIZE = 20
+DEFAULT_API_POOL_SIZE = 10
+
+# Shared keep-alive client for OAuth token calls (created on first use).
+_oauth_http: httpx.Client | None = None
+_oauth_http_lock = threading.Lock()
+
+
+def _pool_limits(pool_size: int) -> httpx.Limits:
+    """Connection limits for a long-lived pooled transport."""
+    import httpx
+
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=60.0,
+    )
+
+
+def _http2_available() -> bool:
+    """Whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_oauth_http() -> httpx.Client:
+    global _oauth_http
+    if _oauth_http is None:
+        with _oauth_http_lock:
+            if _oauth_http is None:
+                import httpx
+
+                _oauth_http = httpx.Client(timeout=30.0)
+    return _oauth_http
+
+
+def _rest_headers(access_token: str | None, api_version: str) -> dict[str, str]:
+    """Default headers for /rest/ endpoints."""
+    headers: dict[str, str] = {
+        "Content-Type": "application/json",
+        "LinkedIn-Version": api_version,
+        "X-Restli-Protocol-Version": "2.0.0",
+    }
+    if access_token:
+        headers["Authorization"] = f"Bearer {access_token}"
+    return headers
+
+
+def _v2_headers(access_token: str | None) -> dict[str, str]:
+    """Default headers for /v2/ endpoints."""
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+    if access_token:
+        headers["Authorization"] = f"Bearer {access_token}"
+    return headers
+
+
+def _upload_headers(
+    access_token: str | None,
+    content_type: str,
+    content_length: int | None = None,
+) -> dict[str, str]:
+    """Headers for a binary PUT to a pre-signed upload URL."""
+    headers = {
+        "Content-Type": content_type,
+    }
+    if content_length is not None:
+        headers["Content-Length"] = str(content_length)
+    if access_token:
+        headers["Authorization"] = f"Bearer {access_token}"
+    return headers
+
+
+_OAUTH_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_BATCH_DELETE_HEADERS = {"X-RestLi-Method": "BATCH_DELETE"}
+
+
+def _raise_for_status(resp: httpx.Response) -> None:
+    """Raise for error statuses; 304 answers our own conditional GETs."""
+    if resp.status_code != 304:
+        resp.raise_for_status()
+
+
+def _cache_entry(
+    resp: httpx.Response, content: bytes, tag: str, ttl: float
+) -> CacheEntry:
+    return CacheEntry(
+        content=content,
+        etag=resp.headers.get("etag", ""),
+        expires_at=time.time() + ttl,
+        tag=tag,
+    )
+
+
+_dotenv_loaded = False
+
+
+def _load_dotenv() -> None:
+    """Load a ``.env`` file into the environment, once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        _dotenv_loaded = True
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+
+class _LazyHTTP:
+    """Attribute holding an HTTP client that is built on first access.
+
+    A non-data descriptor: the built client is stored in the instance
+    ``__dict__`` under the same name, so later reads are plain attribute
+    lookups and the attribute can still be assigned directly.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        self.factory = factory
+        self.lock = threading.Lock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        with self.lock:
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                http = obj.__dict__[self.name] = self.factory(obj)
+                return http
+
+
+def _created_http(obj: Any, *names: str) -> list[Any]:
+    """The HTTP clients among ``names`` that have been built on ``obj``."""
+    return [obj.__dict__[name] for name in names if name in obj.__dict__]
+
+
+def _inflight_key(
+    http: Any, path: str, params: dict[str, Any] | None
+) -> tuple[str, str, tuple[tuple[str, Any], ...]]:
+    """Identity of a GET for request coalescing."""
+    return str(http.base_url), path, tuple(sorted((params or {}).items()))
+
+
+class _BaseClient:
+    """Credential handling shared by the sync and async clients."""
+
+    def __init__(
+        self,
+        access_token: str | None = None,
+        person_id: str | None = None,
+        api_version: str = DEFAULT_API_VERSION,
+        load_env: bool = True,
+    ):
+        if load_env and (access_token is None or person_id is None):
+            _load_dotenv()
+        if access_token is None:
+            access_token = os.environ.get("LINKEDIN_ACCESS_TOKEN")
+        if person_id is None:
+            person_id = os.environ.get("LINKEDIN_PERSON_ID")
+
+        self.access_token = access_token
+        self.person_id = person_id
+        self.api_version = api_version
+
+    @property
+    def person_urn(self) -> str:
+        """Return the full person URN."""
+        if not self.person_id:
+            raise ValueError(
+                "No person_id set. Pass person_id= or set LINKEDIN_PERSON_ID env var."
+            )
+        return f"urn:li:person:{self.person_id}"
+
+    def _set_access_token(self, access_token: str) -> None:
+        """Swap in a new access token, including on already-built API clients.
+
+        Each client's headers are replaced in a single assignment, under the
+        lock that guards its lazy creation, so every request is sent with
+        either the old or the new token.
+        """
+        self.access_token = access_token
+        for name in ("_http", "_http_v2"):
+            with getattr(type(self), name).lock:
+                http = self.__dict__.get(name)
+                if http is not None:
+                    headers = http.headers.copy()
+                    headers["Authorization"] = f"Bearer {access_token}"
+                    http.headers = headers
+
+    @staticmethod
+    def _encode_urn(urn: str) -> str:
+        """URL-encode a LinkedIn URN for use in paths."""
+        return quote(urn, safe="")
 
 
 class LinkedInClient(
@@ -31,6 +239,7 @@ class LinkedInClient(
     UsersMixin,
     AuthMixin,
     ConvenienceMixin,
+    _BaseClient,
 ):
     """Synchronous Python client for the LinkedIn API v202510."""
 
@@ -39,57 +248,259 @@ class LinkedInClient(
         access_token: str | None = None,
         person_id: str | None = None,
         api_version: str = DEFAULT_API_VERSION,
+        upload_pool_size: int = DEFAULT_UPLOAD_POOL_SIZE,
+        api_pool_size: int = DEFAULT_API_POOL_SIZE,
+        http2: bool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        on_request: RequestHook | None = None,
+        transport: httpx.BaseTransport | None = None,
+        coalesce: bool = True,
+        load_env: bool = True,
+        token_manager: TokenManager | None = None,
+        media_cache: MediaCache | None = None,
+        image_processor: ImageProcessor | None = None,
+        upload_journal: UploadJournal | None = None,
+        post_index: PostIndex | None = None,
     ):
-        if access_token is None:
-            access_token = os.environ.get("LINKEDIN_ACCESS_TOKEN")
-        if person_id is None:
-            person_id = os.environ.get("LINKEDIN_PERSON_ID")
+        """Create a client.
 
-        self.access_token = access_token
-        self.person_id = person_id
-        self.api_version = api_version
+        No connections are opened here: each HTTP client is built on its
+        first request, so constructing a client (e.g. only to call
+        :meth:`get_auth_url`) stays cheap.
+
+        Args:
+            access_token: OAuth access token (default: LINKEDIN_ACCESS_TOKEN).
+            person_id: Member ID (default: LINKEDIN_PERSON_ID).
+            api_version: LinkedIn-Version header value.
+            upload_pool_size: Max pooled connections for binary uploads.
+            api_pool_size: Max pooled connections to api.linkedin.com, shared
+                by /rest/ and /v2/ calls.
+            http2: Use HTTP/2 (requires ``httpx[http2]``); by default it is
+                used when the ``h2`` package is installed.
+            rate_limiter: Optional :class:`RateLimiter` applied to API calls;
+                it also enables retrying 429 responses.
+            cache: Optional :class:`ResponseCache` for GET responses.
+            on_request: Optional hook called with a :class:`RequestEvent` after
+                every API call and upload (e.g. a :class:`MetricsRegistry`).
+            transport: Custom httpx transport for all requests (e.g.
+                ``httpx.MockTransport`` in tests and benchmarks).
+            coalesce: Share one request between identical GETs issued
+                concurrently from several threads.
+            load_env: Load a ``.env`` file when credentials fall back to
+                environment variables.
+            token_manager: Optional :class:`TokenManager` that refreshes the
+                access token before it expires (its token is used when
+                ``access_token`` is not given).
+            media_cache: Optional :class:`MediaCache`; media whose content
+                was already uploaded by this member is attached by URN
+                instead of being uploaded again.
+            image_processor: Optional :class:`ImageProcessor` that shrinks
+                images before they are uploaded.
+            upload_journal: Optional :class:`UploadJournal`; multipart video
+                uploads record their progress in it and resume after a
+                failure instead of starting over.
+            post_index: Optional :class:`PostIndex`; listed posts are
+                ingested into it and post writes are reflected in it.
+        """
+        if access_token is None and token_manager is not None:
+            access_token = token_manager.access_token
+        super().__init__(access_token, person_id, api_version, load_env)
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.on_request = on_request
+        self._transport = transport
+        self._upload_pool_size = upload_pool_size
+        self._api_pool_size = api_pool_size
+        self._http2 = _http2_available() if http2 is None else http2
+        self.coalesce = coalesce
+        self._inflight: dict[tuple, Future[bytes]] = {}
+        self._inflight_lock = threading.Lock()
+        self.media_cache = media_cache
+        self.image_processor = image_processor
+        self.upload_journal = upload_journal
+        self.post_index = post_index
+        self.token_manager = token_manager
+        if token_manager is not None:
+            token_manager.attach(self)
+
+    def _build_api_transport(self) -> httpx.BaseTransport:
+        """Connection pool to api.linkedin.com shared by the REST and v2 clients.
+
+        Both clients talk to the same host, so they share connections (and,
+        with HTTP/2, multiplex concurrent calls over them); each client only
+        adds its own base URL and headers to the requests it sends.
+        """
+        if self._transport is not None:
+            return self._transport
+        import httpx
+
+        return httpx.HTTPTransport(
+            http2=self._http2, limits=_pool_limits(self._api_pool_size)
+        )
 
-        # REST client for /rest/ endpoints
-        headers: dict[str, str] = {
-            "Content-Type": "application/json",
-            "LinkedIn-Version": self.api_version,
-            "X-Restli-Protocol-Version": "2.0.0",
-        }
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
+    def _build_http(self) -> httpx.Client:
+        """REST client for /rest/ endpoints."""
+        import httpx
 
-        self._http = httpx.Client(
+        return httpx.Client(
             base_url=LINKEDIN_REST_BASE,
-            headers=headers,
+            headers=_rest_headers(self.access_token, self.api_version),
             timeout=60.0,
+            transport=self._api_transport,
         )
 
-        # V2 client for /v2/ endpoints (userinfo)
-        v2_headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self.access_token:
-            v2_headers["Authorization"] = f"Bearer {self.access_token}"
+    def _build_http_v2(self) -> httpx.Client:
+        """V2 client for /v2/ endpoints (userinfo)."""
+        import httpx
 
-        self._http_v2 = httpx.Client(
+        return httpx.Client(
             base_url=LINKEDIN_V2_BASE,
-            headers=v2_headers,
+            headers=_v2_headers(self.access_token),
             timeout=30.0,
+            transport=self._api_transport,
         )
 
-    @property
-    def person_urn(self) -> str:
-        """Return the full person URN."""
-        if not self.person_id:
-            raise ValueError(
-                "No person_id set. Pass person_id= or set LINKEDIN_PERSON_ID env var."
-            )
-        return f"urn:li:person:{self.person_id}"
+    def _build_http_upload(self) -> httpx.Client:
+        """Pooled client for PUTs to pre-signed upload URLs.
+
+        Batches of uploads reuse warm connections to the upload host.
+        """
+        import httpx
+
+        return httpx.Client(
+            timeout=300.0,
+            limits=_pool_limits(self._upload_pool_size),
+            http2=self._http2,
+            transport=self._transport,
+        )
+
+    _api_transport = _LazyHTTP(_build_api_transport)
+    _http = _LazyHTTP(_build_http)
+    _http_v2 = _LazyHTTP(_build_http_v2)
+    _http_upload = _LazyHTTP(_build_http_upload)
 
     # ---- low-level helpers ------------------------------------------------
 
+    def _request(
+        self, http: httpx.Client, method: str, path: str, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, applying the rate limiter and retrying throttled (429) responses.
+
+        Successful writes invalidate cached reads of the same endpoint family.
+        """
+        if self.token_manager is not None:
+            self.token_manager.ensure_fresh()
+        hook = self.on_request
+        start = time.perf_counter() if hook is not None else 0.0
+        limiter = self.rate_limiter
+        retries = 0
+        if limiter is None:
+            resp = http.request(method, path, **kwargs)
+        else:
+            resp, retries = self._request_with_retries(
+                limiter, http, method, path, **kwargs
+            )
+        if hook is not None:
+            hook(
+                RequestEvent(
+                    method=method,
+                    endpoint=_endpoint_family(path),
+                    status_code=resp.status_code,
+                    duration=time.perf_counter() - start,
+                    retries=retries,
+                    request_bytes=len(resp.request.content),
+                    response_bytes=len(resp.content),
+                )
+            )
+        _raise_for_status(resp)
+        if method != "GET" and self.cache is not None:
+            self.cache.invalidate(_endpoint_family(path))
+        return resp
+
+    def _request_with_retries(
+        self,
+        limiter: RateLimiter,
+        http: httpx.Client,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> tuple[httpx.Response, int]:
+        """Send with rate limiting; return the final response and the retry count."""
+        attempt = 0
+        while True:
+            limiter.acquire(path)
+            resp = http.request(method, path, **kwargs)
+            if not limiter.should_retry(resp, attempt):
+                return resp, attempt
+            time.sleep(limiter.retry_delay(resp, attempt))
+            attempt += 1
+
+    def _cached_get(
+        self,
+        http: httpx.Client,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """GET a JSON resource, coalescing identical in-flight reads.
+
+        While one thread is fetching a resource, other threads asking for the
+        same one wait for its response body instead of sending their own
+        request; each caller decodes its own copy.
+        """
+        if not self.coalesce:
+            return _decode_body(self._fetch_get(http, path, params))
+
+        key = _inflight_key(http, path, params)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return _decode_body(future.result())
+
+        try:
+            content = self._fetch_get(http, path, params)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(content)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return _decode_body(content)
+
+    def _fetch_get(
+        self,
+        http: httpx.Client,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        """GET a resource body, serving and revalidating through ``self.cache``.
+
+        Fresh entries are returned without a request; stale entries with an
+        ETag are revalidated with If-None-Match and reused on 304.
+        """
+        cache = self.cache
+        if cache is None:
+            return self._request(http, "GET", path, params=params).content
+
+        tag = _endpoint_family(path)
+        key = _cache_key(tag, str(http.base_url), path, params, self.access_token)
+        entry = cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry.content
+
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+        resp = self._request(http, "GET", path, params=params, headers=headers)
+        content = entry.content if resp.status_code == 304 and entry else resp.content
+        cache.set(key, _cache_entry(resp, content, tag, cache.ttl))
+        return content
+
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        resp = self._http.get(path, params=params)
-        resp.raise_for_status()
-        return resp.json() if resp.text.strip() else {}
+        return self._cached_get(self._http, path, params)
 
     def _post(
         self,
@@ -98,53 +509,74 @@ class LinkedInClient(
         extra_headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """POST to a /rest/ endpoint. Returns the full Response for header access."""
-        resp = self._http.post(path, json=json or {}, headers=extra_headers)
-        resp.raise_for_status()
-        return resp
+        return self._request(
+            self._http, "POST", path, content=_dumps(json or {}), headers=extra_headers
+        )
 
     def _delete(self, path: str) -> int:
-        resp = self._http.delete(path)
-        resp.raise_for_status()
+        resp = self._request(self._http, "DELETE", path)
         return resp.status_code
 
+    def _batch_delete(self, path: str) -> dict[str, Any]:
+        """Rest.li BATCH_DELETE on a /rest/ collection. Returns the per-id results body."""
+        resp = self._request(
+            self._http, "DELETE", path, headers=_BATCH_DELETE_HEADERS
+        )
+        return _decode_body(resp.content)
+
     def _get_v2(self, path: str) -> dict[str, Any]:
-        resp = self._http_v2.get(path)
-        resp.raise_for_status()
-        return resp.json()
+        return self._cached_get(self._http_v2, path)
 
     def _put_binary(
         self,
         url: str,
-        data: bytes,
+        data: bytes | Iterable[bytes],
         content_type: str,
+        content_length: int | None = None,
     ) -> httpx.Response:
-        """PUT binary data to an upload URL (S3 pre-signed)."""
-        headers = {
-            "Content-Type": content_type,
-        }
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        resp = httpx.put(url, content=data, headers=headers, timeout=300.0)
+        """PUT binary data to an upload URL (S3 pre-signed).
+
+        ``data`` may be a chunk iterator; pass ``content_length`` with it so the
+        body is sent with a fixed length rather than chunked transfer encoding,
+        which pre-signed upload URLs reject.
+        """
+        if self.token_manager is not None:
+            self.token_manager.ensure_fresh()
+        headers = _upload_headers(self.access_token, content_type, content_length)
+        hook = self.on_request
+        start = time.perf_counter() if hook is not None else 0.0
+        resp = self._http_upload.put(url, content=data, headers=headers)
+        if hook is not None:
+            hook(
+                RequestEvent(
+                    method="PUT",
+                    endpoint="upload",
+                    status_code=resp.status_code,
+                    duration=time.perf_counter() - start,
+                    request_bytes=(
+                        content_length
+                        if content_length is not None
+                        else len(data) if isinstance(data, bytes) else 0
+                    ),
+                    response_bytes=len(resp.content),
+                )
+            )
         resp.raise_for_status()
         return resp
 
     @staticmethod
     def _oauth_post(path: str, params: dict[str, str]) -> dict[str, Any]:
         """POST form-encoded data to the LinkedIn OAuth endpoint."""
-        resp = httpx.post(
+        resp = _get_oauth_http().post(
             f"{LINKEDIN_OAUTH_HOST}{path}",
             data=params,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30.0,
+            headers=_OAUTH_HEADERS,
         )
         resp.raise_for_status()
-        return resp.json()
-
-    @staticmethod
-    def _encode_urn(urn: str) -> str:
-        """URL-encode a LinkedIn URN for use in paths."""
-        return quote(urn, safe="")
+        return _decode_body(resp.content)
 
     def close(self) -> None:
-        self._http.close()
-        self._http_v2.close()
+        if self.token_manager is not None:
+            self.token_manager.detach(self)
+        for http in _created_http(self, "_http", "_http_v2", "_http_upload"):
+            http.close()
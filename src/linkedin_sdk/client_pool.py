@@ -0,0 +1,239 @@
+"""Many member accounts behind one connection pool."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import httpx
+
+from .cache import ResponseCache
+from .client import (
+    DEFAULT_API_VERSION,
+    LinkedInClient,
+    _http2_available,
+    _pool_limits,
+)
+from .metrics import RequestHook
+from .ratelimit import RateLimiter
+from .tokens import TokenManager
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 100
+DEFAULT_MAX_WORKERS = 16
+
+
+@dataclass
+class AccountResult:
+    """Outcome of running a task for one account in :meth:`LinkedInClientPool.map`.
+
+    Attributes:
+        person_id: The account the task ran for.
+        result: The task's return value, on success.
+        error: The exception the task raised, on failure.
+    """
+
+    person_id: str
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """View of the pool's transport; closing one account's client leaves it open."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class LinkedInClientPool:
+    """Clients for many member accounts sharing one connection pool.
+
+    Every account gets its own :class:`LinkedInClient` (own token, own
+    per-token rate limiter) but all of them send through a single pooled
+    transport, so hundreds of accounts reuse the same warm connections to
+    LinkedIn and the upload hosts. Work for many accounts runs concurrently
+    on a shared thread pool.
+
+    Example::
+
+        with LinkedInClientPool(default_rate_limit=(1.0, 5)) as pool:
+            for person_id, token in accounts:
+                pool.add_account(person_id, token)
+            pool.for_account("abc123").create_post("Hello")
+            for item in pool.map(lambda client: client.create_post("Launch day")):
+                print(item.person_id, item.result if item.ok else item.error)
+
+    Args:
+        rate_limits: Per-token limits by endpoint family, as for
+            :class:`RateLimiter`; each account gets its own buckets.
+        default_rate_limit: Per-token limit for other families.
+        max_workers: Threads used by :meth:`submit` and :meth:`map`.
+        pool_size: Max pooled connections shared by all accounts.
+        api_version: LinkedIn-Version header value.
+        http2: Use HTTP/2 (default: when the ``h2`` package is installed).
+        cache: Optional :class:`ResponseCache` shared by all accounts (keys
+            include a hash of the token, so accounts never see each other's
+            entries).
+        on_request: Optional hook receiving every account's requests.
+        transport: Custom httpx transport to share instead of the default pool.
+    """
+
+    def __init__(
+        self,
+        rate_limits: dict[str, tuple[float, int]] | None = None,
+        default_rate_limit: tuple[float, int] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        api_version: str = DEFAULT_API_VERSION,
+        http2: bool | None = None,
+        cache: ResponseCache | None = None,
+        on_request: RequestHook | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.rate_limits = rate_limits
+        self.default_rate_limit = default_rate_limit
+        self.max_workers = max_workers
+        self.api_version = api_version
+        self.cache = cache
+        self.on_request = on_request
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                http2=_http2_available() if http2 is None else http2,
+                limits=_pool_limits(pool_size),
+            )
+        self._transport = transport
+        self._shared = _SharedTransport(transport)
+        self._clients: dict[str, LinkedInClient] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    # ---- accounts ---------------------------------------------------------
+
+    def add_account(
+        self,
+        person_id: str,
+        access_token: str | None = None,
+        token_manager: TokenManager | None = None,
+    ) -> LinkedInClient:
+        """Register an account (replacing any previous one with this ID) and return its client.
+
+        Args:
+            person_id: Member ID.
+            access_token: The member's OAuth access token.
+            token_manager: Optional :class:`TokenManager` keeping it fresh.
+        """
+        if self.rate_limits is None and self.default_rate_limit is None:
+            rate_limiter = None
+        else:
+            rate_limiter = RateLimiter(self.rate_limits, self.default_rate_limit)
+        client = LinkedInClient(
+            access_token=access_token,
+            person_id=person_id,
+            api_version=self.api_version,
+            rate_limiter=rate_limiter,
+            cache=self.cache,
+            on_request=self.on_request,
+            transport=self._shared,
+            load_env=False,
+            token_manager=token_manager,
+        )
+        with self._lock:
+            previous = self._clients.get(person_id)
+            self._clients[person_id] = client
+        if previous is not None:
+            previous.close()
+        return client
+
+    def remove_account(self, person_id: str) -> None:
+        with self._lock:
+            client = self._clients.pop(person_id, None)
+        if client is not None:
+            client.close()
+
+    def for_account(self, person_id: str) -> LinkedInClient:
+        """Return the client for a registered account.
+
+        Raises:
+            KeyError: If the account was never added.
+        """
+        try:
+            return self._clients[person_id]
+        except KeyError:
+            raise KeyError(f"No account registered for person_id {person_id!r}") from None
+
+    @property
+    def accounts(self) -> list[str]:
+        return list(self._clients)
+
+    # ---- concurrent dispatch ----------------------------------------------
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="linkedin-pool"
+                )
+            return self._executor
+
+    def submit(self, person_id: str, fn: Callable[[LinkedInClient], T]) -> Future[T]:
+        """Run ``fn(client)`` for one account on the shared thread pool."""
+        client = self.for_account(person_id)
+        return self._pool().submit(fn, client)
+
+    def map(
+        self,
+        fn: Callable[[LinkedInClient], Any],
+        person_ids: Iterable[str] | None = None,
+    ) -> Iterator[AccountResult]:
+        """Run ``fn(client)`` for many accounts concurrently.
+
+        Yields an :class:`AccountResult` per account as each finishes; one
+        account's failure does not stop the others.
+
+        Args:
+            fn: Task taking the account's client.
+            person_ids: Accounts to run for (default: all registered).
+        """
+        ids = self.accounts if person_ids is None else list(person_ids)
+        futures = {self.submit(person_id, fn): person_id for person_id in ids}
+        for future in as_completed(futures):
+            person_id = futures[future]
+            error = future.exception()
+            if error is not None:
+                yield AccountResult(person_id, error=error)
+            else:
+                yield AccountResult(person_id, result=future.result())
+
+    # ---- lifecycle --------------------------------------------------------
+
+    def close(self) -> None:
+        """Close every account's client, the thread pool and the shared transport."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for client in clients:
+            client.close()
+        self._transport.close()
+
+    def __enter__(self) -> LinkedInClientPool:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,117 @@
+"""Pluggable JSON encoding and decoding for request and response bodies."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+
+
+class JSONCodec:
+    """JSON backend built on the standard library.
+
+    Subclass and override :meth:`dumps` / :meth:`loads` to plug in another
+    library. ``dumps`` returns UTF-8 bytes and ``loads`` accepts them, so
+    bodies go to and from the wire without an intermediate ``str``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON backend using ``orjson`` (``pip install orjson``)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.dumps = orjson.dumps  # type: ignore[method-assign]
+        self.loads = orjson.loads  # type: ignore[method-assign]
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON backend using ``msgspec`` (``pip install msgspec``)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder().encode  # type: ignore[method-assign]
+        self.loads = msgspec.json.Decoder().decode  # type: ignore[method-assign]
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+_codec: JSONCodec | None = None
+_codec_lock = threading.Lock()
+
+
+def _default_codec() -> JSONCodec:
+    """The fastest installed backend: orjson, then msgspec, then the stdlib."""
+    for codec_cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_cls()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Return the codec used for request and response bodies (chosen on first use)."""
+    global _codec
+    if _codec is None:
+        with _codec_lock:
+            if _codec is None:
+                _codec = _default_codec()
+    return _codec
+
+
+def set_json_codec(codec: JSONCodec | str | None) -> None:
+    """Select the JSON backend for all clients.
+
+    Args:
+        codec: A :class:`JSONCodec` instance, a backend name (``"orjson"``,
+            ``"msgspec"`` or ``"json"``), or ``None`` to pick the fastest
+            installed backend again.
+
+    Raises:
+        ValueError: For an unknown backend name.
+        ImportError: If the named backend is not installed.
+    """
+    global _codec
+    if isinstance(codec, str):
+        try:
+            codec = _CODECS[codec]()
+        except KeyError:
+            raise ValueError(
+                f"Unknown JSON codec {codec!r}; expected one of {sorted(_CODECS)}"
+            ) from None
+    with _codec_lock:
+        _codec = codec
+
+
+def _dumps(obj: Any) -> bytes:
+    return get_json_codec().dumps(obj)
+
+
+def _decode_body(content: bytes) -> dict[str, Any]:
+    """Decode a JSON response body, treating an empty body as ``{}``.
+
+    Parses the raw bytes once; whitespace-only bodies are detected on the
+    bytes without decoding them to text.
+    """
+    if not content or content.isspace():
+        return {}
+    return get_json_codec().loads(content)
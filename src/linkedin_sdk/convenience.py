@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from .images import ImageProcessor, _aprepared_images, _prepared_images
+from .media import DEFAULT_UPLOAD_CONCURRENCY
+from .media_cache import _file_digest
+from .upload_journal import _journal_key
+
 
 # MIME type maps
 _IMAGE_MIMES = {
@@ -34,11 +42,78 @@ _VIDEO_MIMES = {
 }
 
 
+def _image_digest(image_path: str, processor: ImageProcessor | None) -> str:
+    """Media-cache digest of an image as it will be uploaded.
+
+    Keyed on the source file plus the processing settings, so a cached
+    image is recognized before it is processed.
+    """
+    digest = _file_digest(image_path)
+    if processor is None:
+        return digest
+    return hashlib.sha256(f"{digest}:{processor.cache_tag}".encode()).hexdigest()
+
+
+def _is_client_error(exc: BaseException) -> bool:
+    """Whether ``exc`` is an HTTP 4xx error (as raised by ``raise_for_status``)."""
+    status = getattr(getattr(exc, "response", None), "status_code", 0)
+    return 400 <= status < 500
+
+
 def _get_mime(file_path: str, mime_map: dict[str, str]) -> str:
     ext = os.path.splitext(file_path)[1].lower()
     return mime_map.get(ext, "application/octet-stream")
 
 
+# Content builders shared by the sync and async mixins
+
+
+def _article_content(
+    url: str, title: str | None, description: str | None
+) -> dict[str, Any]:
+    article: dict[str, str] = {"source": url, "title": title or url}
+    if description:
+        article["description"] = description
+    return {"article": article}
+
+
+def _image_content(image_urn: str, alt_text: str | None) -> dict[str, Any]:
+    media: dict[str, str] = {"id": image_urn}
+    if alt_text:
+        media["altText"] = alt_text
+    return {"media": media}
+
+
+def _titled_media_content(media_urn: str, title: str | None, file_path: str) -> dict[str, Any]:
+    return {"media": {"id": media_urn, "title": title or os.path.basename(file_path)}}
+
+
+def _poll_content(question: str, options: list[str], duration: str) -> dict[str, Any]:
+    return {
+        "poll": {
+            "question": question,
+            "options": [{"text": opt} for opt in options],
+            "settings": {
+                "duration": duration,
+                "voteSelectionType": "SINGLE_VOTE",
+                "isVoterVisibleToAuthor": True,
+            },
+        }
+    }
+
+
+def _multi_image_content(
+    image_urns: list[str], alt_texts: list[str] | None
+) -> dict[str, Any]:
+    images = []
+    for i, urn in enumerate(image_urns):
+        img: dict[str, str] = {"id": urn}
+        if alt_texts and i < len(alt_texts) and alt_texts[i]:
+            img["altText"] = alt_texts[i]
+        images.append(img)
+    return {"multiImage": {"images": images}}
+
+
 class ConvenienceMixin:
     """Mixin providing high-level convenience methods."""
 
@@ -62,14 +137,10 @@ class ConvenienceMixin:
         Returns:
             {"postUrn": "...", "statusCode": 201}
         """
-        article: dict[str, str] = {"source": url, "title": title or url}
-        if description:
-            article["description"] = description
-
         return self.create_post(
             commentary=commentary,
             visibility=visibility,
-            content={"article": article},
+            content=_article_content(url, title, description),
         )
 
     def create_post_with_image(
@@ -90,22 +161,14 @@ class ConvenienceMixin:
         Returns:
             {"postUrn": "...", "imageUrn": "...", "statusCode": 201}
         """
-        data = self._read_file(image_path)
-        content_type = _get_mime(image_path, _IMAGE_MIMES)
-
-        upload = self.init_image_upload()
-        self.upload_binary(upload["uploadUrl"], data, content_type)
-
-        media: dict[str, str] = {"id": upload["imageUrn"]}
-        if alt_text:
-            media["altText"] = alt_text
+        image_urn = self._upload_image(image_path)
 
         result = self.create_post(
             commentary=commentary,
             visibility=visibility,
-            content={"media": media},
+            content=_image_content(image_urn, alt_text),
         )
-        result["imageUrn"] = upload["imageUrn"]
+        result["imageUrn"] = image_urn
         return result
 
     def create_post_with_document(
@@ -126,19 +189,14 @@ class ConvenienceMixin:
         Returns:
             {"postUrn": "...", "documentUrn": "...", "statusCode": 201}
         """
-        data = self._read_file(document_path)
-        content_type = _get_mime(document_path, _DOCUMENT_MIMES)
+        document_urn = self._upload_document(document_path)
 
-        upload = self.init_document_upload()
-        self.upload_binary(upload["uploadUrl"], data, content_type)
-
-        doc_title = title or os.path.basename(document_path)
         result = self.create_post(
             commentary=commentary,
             visibility=visibility,
-            content={"media": {"id": upload["documentUrn"], "title": doc_title}},
+            content=_titled_media_content(document_urn, title, document_path),
         )
-        result["documentUrn"] = upload["documentUrn"]
+        result["documentUrn"] = document_urn
         return result
 
     def create_post_with_video(
@@ -147,6 +205,7 @@ class ConvenienceMixin:
         video_path: str,
         title: str | None = None,
         visibility: str = "PUBLIC",
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
     ) -> dict[str, Any]:
         """Create a post with an uploaded video.
 
@@ -155,24 +214,19 @@ class ConvenienceMixin:
             video_path: Path to the video file.
             title: Video title (defaults to filename).
             visibility: Post visibility.
+            concurrency: Maximum number of video parts uploaded in parallel.
 
         Returns:
             {"postUrn": "...", "videoUrn": "...", "statusCode": 201}
         """
-        data = self._read_file(video_path)
-        content_type = _get_mime(video_path, _VIDEO_MIMES)
-
-        upload = self.init_video_upload(len(data))
-        upload_result = self.upload_binary(upload["uploadUrl"], data, content_type)
-        self.finalize_video(upload["videoUrn"], upload_result["etag"])
+        video_urn = self._upload_video(video_path, concurrency)
 
-        video_title = title or os.path.basename(video_path)
         result = self.create_post(
             commentary=commentary,
             visibility=visibility,
-            content={"media": {"id": upload["videoUrn"], "title": video_title}},
+            content=_titled_media_content(video_urn, title, video_path),
         )
-        result["videoUrn"] = upload["videoUrn"]
+        result["videoUrn"] = video_urn
         return result
 
     def create_poll(
@@ -198,17 +252,7 @@ class ConvenienceMixin:
         return self.create_post(
             commentary=commentary,
             visibility=visibility,
-            content={
-                "poll": {
-                    "question": question,
-                    "options": [{"text": opt} for opt in options],
-                    "settings": {
-                        "duration": duration,
-                        "voteSelectionType": "SINGLE_VOTE",
-                        "isVoterVisibleToAuthor": True,
-                    },
-                }
-            },
+            content=_poll_content(question, options, duration),
         )
 
     def create_post_with_multi_images(
@@ -217,6 +261,7 @@ class ConvenienceMixin:
         image_paths: list[str],
         alt_texts: list[str] | None = None,
         visibility: str = "PUBLIC",
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
     ) -> dict[str, Any]:
         """Create a post with multiple images (2-20).
 
@@ -225,34 +270,156 @@ class ConvenienceMixin:
             image_paths: Paths to image files.
             alt_texts: Optional alt texts (matched by index).
             visibility: Post visibility.
+            concurrency: Maximum number of images initialized/uploaded in parallel.
 
         Returns:
             {"postUrn": "...", "imageUrns": [...], "statusCode": 201}
         """
-        image_urns: list[str] = []
-        for i, img_path in enumerate(image_paths):
-            data = self._read_file(img_path)
-            content_type = _get_mime(img_path, _IMAGE_MIMES)
-
-            upload = self.init_image_upload()
-            self.upload_binary(upload["uploadUrl"], data, content_type)
-            image_urns.append(upload["imageUrn"])
-
-        images = []
-        for i, urn in enumerate(image_urns):
-            img: dict[str, str] = {"id": urn}
-            if alt_texts and i < len(alt_texts) and alt_texts[i]:
-                img["altText"] = alt_texts[i]
-            images.append(img)
-
+        image_urns = self._upload_images(image_paths, concurrency)
         result = self.create_post(
             commentary=commentary,
             visibility=visibility,
-            content={"multiImage": {"images": images}},
+            content=_multi_image_content(image_urns, alt_texts),
         )
         result["imageUrns"] = image_urns
         return result
 
+    # ---- upload stages (shared with PublishPipeline) -----------------------
+
+    def _upload_image(self, image_path: str) -> str:
+        """Pre-process (if configured), initialize and upload an image; return its image URN."""
+        return self._upload_images([image_path], concurrency=1)[0]
+
+    def _upload_images(
+        self, image_paths: list[str], concurrency: int = DEFAULT_UPLOAD_CONCURRENCY
+    ) -> list[str]:
+        """Pre-process (if configured) and upload images in parallel; return their URNs in order.
+
+        With a ``media_cache``, images already uploaded (same source bytes and
+        processing settings) are looked up first and neither processed nor
+        uploaded again.
+        """
+        for img_path in image_paths:
+            self._check_file(img_path)
+
+        cache = self.media_cache
+        digests: list[str | None] = [None] * len(image_paths)
+        urns: list[str | None] = [None] * len(image_paths)
+        if cache is not None:
+            for i, img_path in enumerate(image_paths):
+                digests[i] = _image_digest(img_path, self.image_processor)
+                urns[i] = cache.get(digests[i], self.person_urn, "image")
+        missing = [i for i, urn in enumerate(urns) if urn is None]
+        if not missing:
+            return urns  # type: ignore[return-value]
+
+        # Pre-processing (if configured) fans out to worker processes; then
+        # pool.map yields in input order, so image order is preserved.
+        to_process = [image_paths[i] for i in missing]
+        with _prepared_images(self.image_processor, to_process) as upload_paths:
+            if len(upload_paths) <= 1 or concurrency <= 1:
+                uploaded = [self._upload_prepared_image(p) for p in upload_paths]
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    uploaded = list(pool.map(self._upload_prepared_image, upload_paths))
+        for i, urn in zip(missing, uploaded):
+            urns[i] = urn
+            if cache is not None:
+                cache.set(digests[i], self.person_urn, "image", urn)
+        return urns  # type: ignore[return-value]
+
+    def _upload_prepared_image(self, image_path: str) -> str:
+        """Initialize and upload an image file as-is; return its image URN."""
+        upload = self.init_image_upload()
+        self.upload_file(
+            upload["uploadUrl"], image_path, _get_mime(image_path, _IMAGE_MIMES)
+        )
+        return upload["imageUrn"]
+
+    def _upload_document(self, document_path: str) -> str:
+        """Initialize and upload a document; return its document URN."""
+        self._check_file(document_path)
+
+        def upload_document() -> str:
+            upload = self.init_document_upload()
+            self.upload_file(
+                upload["uploadUrl"],
+                document_path,
+                _get_mime(document_path, _DOCUMENT_MIMES),
+            )
+            return upload["documentUrn"]
+
+        return self._dedupe_upload("document", document_path, upload_document)
+
+    def _upload_video(
+        self, video_path: str, concurrency: int = DEFAULT_UPLOAD_CONCURRENCY
+    ) -> str:
+        """Initialize, upload (all parts) and finalize a video; return its video URN."""
+        file_size = self._check_file(video_path)
+
+        def upload_video() -> str:
+            if self.upload_journal is not None:
+                return self._upload_video_journaled(video_path, file_size, concurrency)
+            upload = self.init_video_upload(file_size)
+            etags = self.upload_video_parts(
+                upload["uploadInstructions"],
+                video_path,
+                _get_mime(video_path, _VIDEO_MIMES),
+                concurrency,
+            )
+            self.finalize_video(upload["videoUrn"], etags, upload["uploadToken"])
+            return upload["videoUrn"]
+
+        return self._dedupe_upload("video", video_path, upload_video)
+
+    def _upload_video_journaled(
+        self, video_path: str, file_size: int, concurrency: int
+    ) -> str:
+        """Upload a video through ``self.upload_journal``, resuming a recorded attempt."""
+        journal = self.upload_journal
+        key = _journal_key(self.person_urn, video_path)
+        state = journal.load(key)
+        try:
+            if state is None:
+                state = journal.start(key, self.init_video_upload(file_size))
+            etags = self.upload_video_parts(
+                state["uploadInstructions"],
+                video_path,
+                _get_mime(video_path, _VIDEO_MIMES),
+                concurrency,
+                completed=state["etags"],
+                on_part=lambda index, etag: journal.record_part(key, state, index, etag),
+            )
+            self.finalize_video(state["videoUrn"], etags, state["uploadToken"])
+        except Exception as exc:
+            if _is_client_error(exc):
+                journal.discard(key)
+            raise
+        journal.discard(key)
+        return state["videoUrn"]
+
+    def _dedupe_upload(self, kind: str, file_path: str, upload: Callable[[], str]) -> str:
+        """Return the cached URN for this file's content, or run ``upload`` and cache it.
+
+        Without a ``media_cache`` on the client this is just ``upload()``.
+        """
+        cache = self.media_cache
+        if cache is None:
+            return upload()
+        digest = _file_digest(file_path)
+        urn = cache.get(digest, self.person_urn, kind)
+        if urn is None:
+            urn = upload()
+            cache.set(digest, self.person_urn, kind, urn)
+        return urn
+
+    @staticmethod
+    def _check_file(file_path: str) -> int:
+        """Ensure a file exists and return its size in bytes."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return os.stat(file_path).st_size
+
     @staticmethod
     def _read_file(file_path: str) -> bytes:
         """Read a file and return its bytes."""
@@ -260,3 +427,264 @@ class ConvenienceMixin:
             raise FileNotFoundError(f"File not found: {file_path}")
         with open(file_path, "rb") as f:
             return f.read()
+
+
+class AsyncConvenienceMixin:
+    """Async counterpart of :class:`ConvenienceMixin`."""
+
+    _check_file = staticmethod(ConvenienceMixin._check_file)
+    _read_file = staticmethod(ConvenienceMixin._read_file)
+
+    async def create_post_with_link(
+        self,
+        commentary: str,
+        url: str,
+        title: str | None = None,
+        description: str | None = None,
+        visibility: str = "PUBLIC",
+    ) -> dict[str, Any]:
+        """Create a post with an article link preview.
+
+        See :meth:`ConvenienceMixin.create_post_with_link`.
+        """
+        return await self.create_post(
+            commentary=commentary,
+            visibility=visibility,
+            content=_article_content(url, title, description),
+        )
+
+    async def create_post_with_image(
+        self,
+        commentary: str,
+        image_path: str,
+        alt_text: str | None = None,
+        visibility: str = "PUBLIC",
+    ) -> dict[str, Any]:
+        """Create a post with an uploaded image.
+
+        See :meth:`ConvenienceMixin.create_post_with_image`.
+        """
+        image_urn = await self._upload_image(image_path)
+
+        result = await self.create_post(
+            commentary=commentary,
+            visibility=visibility,
+            content=_image_content(image_urn, alt_text),
+        )
+        result["imageUrn"] = image_urn
+        return result
+
+    async def create_post_with_document(
+        self,
+        commentary: str,
+        document_path: str,
+        title: str | None = None,
+        visibility: str = "PUBLIC",
+    ) -> dict[str, Any]:
+        """Create a post with an uploaded document.
+
+        See :meth:`ConvenienceMixin.create_post_with_document`.
+        """
+        document_urn = await self._upload_document(document_path)
+
+        result = await self.create_post(
+            commentary=commentary,
+            visibility=visibility,
+            content=_titled_media_content(document_urn, title, document_path),
+        )
+        result["documentUrn"] = document_urn
+        return result
+
+    async def create_post_with_video(
+        self,
+        commentary: str,
+        video_path: str,
+        title: str | None = None,
+        visibility: str = "PUBLIC",
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """Create a post with an uploaded video.
+
+        See :meth:`ConvenienceMixin.create_post_with_video`.
+        """
+        video_urn = await self._upload_video(video_path, concurrency)
+
+        result = await self.create_post(
+            commentary=commentary,
+            visibility=visibility,
+            content=_titled_media_content(video_urn, title, video_path),
+        )
+        result["videoUrn"] = video_urn
+        return result
+
+    async def create_poll(
+        self,
+        question: str,
+        options: list[str],
+        commentary: str = "",
+        duration: str = "THREE_DAYS",
+        visibility: str = "PUBLIC",
+    ) -> dict[str, Any]:
+        """Create a poll post.
+
+        See :meth:`ConvenienceMixin.create_poll`.
+        """
+        return await self.create_post(
+            commentary=commentary,
+            visibility=visibility,
+            content=_poll_content(question, options, duration),
+        )
+
+    async def create_post_with_multi_images(
+        self,
+        commentary: str,
+        image_paths: list[str],
+        alt_texts: list[str] | None = None,
+        visibility: str = "PUBLIC",
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> dict[str, Any]:
+        """Create a post with multiple images (2-20).
+
+        See :meth:`ConvenienceMixin.create_post_with_multi_images`.
+        """
+        image_urns = await self._upload_images(image_paths, concurrency)
+        result = await self.create_post(
+            commentary=commentary,
+            visibility=visibility,
+            content=_multi_image_content(image_urns, alt_texts),
+        )
+        result["imageUrns"] = image_urns
+        return result
+
+    # ---- upload stages (shared with PublishPipeline) -----------------------
+
+    async def _upload_image(self, image_path: str) -> str:
+        """Pre-process (if configured), initialize and upload an image; return its image URN."""
+        return (await self._upload_images([image_path], concurrency=1))[0]
+
+    async def _upload_images(
+        self, image_paths: list[str], concurrency: int = DEFAULT_UPLOAD_CONCURRENCY
+    ) -> list[str]:
+        """See :meth:`ConvenienceMixin._upload_images`; hashing runs in worker threads."""
+        for img_path in image_paths:
+            self._check_file(img_path)
+
+        import asyncio
+
+        cache = self.media_cache
+        digests: list[str | None] = [None] * len(image_paths)
+        urns: list[str | None] = [None] * len(image_paths)
+        if cache is not None:
+            digests = list(
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(_image_digest, p, self.image_processor)
+                        for p in image_paths
+                    )
+                )
+            )
+            urns = [cache.get(d, self.person_urn, "image") for d in digests]
+        missing = [i for i, urn in enumerate(urns) if urn is None]
+        if not missing:
+            return urns  # type: ignore[return-value]
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def upload_image(img_path: str) -> str:
+            async with semaphore:
+                return await self._upload_prepared_image(img_path)
+
+        to_process = [image_paths[i] for i in missing]
+        async with _aprepared_images(self.image_processor, to_process) as upload_paths:
+            uploaded = await asyncio.gather(*(upload_image(p) for p in upload_paths))
+        for i, urn in zip(missing, uploaded):
+            urns[i] = urn
+            if cache is not None:
+                cache.set(digests[i], self.person_urn, "image", urn)
+        return urns  # type: ignore[return-value]
+
+    async def _upload_prepared_image(self, image_path: str) -> str:
+        """Initialize and upload an image file as-is; return its image URN."""
+        upload = await self.init_image_upload()
+        await self.upload_file(
+            upload["uploadUrl"], image_path, _get_mime(image_path, _IMAGE_MIMES)
+        )
+        return upload["imageUrn"]
+
+    async def _upload_document(self, document_path: str) -> str:
+        """Initialize and upload a document; return its document URN."""
+        self._check_file(document_path)
+
+        async def upload_document() -> str:
+            upload = await self.init_document_upload()
+            await self.upload_file(
+                upload["uploadUrl"],
+                document_path,
+                _get_mime(document_path, _DOCUMENT_MIMES),
+            )
+            return upload["documentUrn"]
+
+        return await self._dedupe_upload("document", document_path, upload_document)
+
+    async def _upload_video(
+        self, video_path: str, concurrency: int = DEFAULT_UPLOAD_CONCURRENCY
+    ) -> str:
+        """Initialize, upload (all parts) and finalize a video; return its video URN."""
+        file_size = self._check_file(video_path)
+
+        async def upload_video() -> str:
+            if self.upload_journal is not None:
+                return await self._upload_video_journaled(video_path, file_size, concurrency)
+            upload = await self.init_video_upload(file_size)
+            etags = await self.upload_video_parts(
+                upload["uploadInstructions"],
+                video_path,
+                _get_mime(video_path, _VIDEO_MIMES),
+                concurrency,
+            )
+            await self.finalize_video(upload["videoUrn"], etags, upload["uploadToken"])
+            return upload["videoUrn"]
+
+        return await self._dedupe_upload("video", video_path, upload_video)
+
+    async def _upload_video_journaled(
+        self, video_path: str, file_size: int, concurrency: int
+    ) -> str:
+        """See :meth:`ConvenienceMixin._upload_video_journaled`."""
+        journal = self.upload_journal
+        key = _journal_key(self.person_urn, video_path)
+        state = journal.load(key)
+        try:
+            if state is None:
+                state = journal.start(key, await self.init_video_upload(file_size))
+            etags = await self.upload_video_parts(
+                state["uploadInstructions"],
+                video_path,
+                _get_mime(video_path, _VIDEO_MIMES),
+                concurrency,
+                completed=state["etags"],
+                on_part=lambda index, etag: journal.record_part(key, state, index, etag),
+            )
+            await self.finalize_video(state["videoUrn"], etags, state["uploadToken"])
+        except Exception as exc:
+            if _is_client_error(exc):
+                journal.discard(key)
+            raise
+        journal.discard(key)
+        return state["videoUrn"]
+
+    async def _dedupe_upload(
+        self, kind: str, file_path: str, upload: Callable[[], Awaitable[str]]
+    ) -> str:
+        """See :meth:`ConvenienceMixin._dedupe_upload`; hashing runs in a worker thread."""
+        cache = self.media_cache
+        if cache is None:
+            return await upload()
+        import asyncio
+
+        digest = await asyncio.to_thread(_file_digest, file_path)
+        urn = cache.get(digest, self.person_urn, kind)
+        if urn is None:
+            urn = await upload()
+            cache.set(digest, self.person_urn, kind, urn)
+        return urn
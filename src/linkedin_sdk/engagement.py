@@ -2,8 +2,84 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
+# Engagement calls in flight at once in the bulk methods; the client's rate
+# limiter, if any, still paces the requests themselves.
+DEFAULT_ENGAGEMENT_CONCURRENCY = 8
+
+
+@dataclass
+class EngagementResult:
+    """Outcome of one item of :meth:`EngagementMixin.add_comments` / ``add_reactions``.
+
+    Attributes:
+        index: Position of the item in the input list.
+        post_urn: The post the item targets.
+        result: The add_comment / add_reaction return value, on success.
+        error: The exception the call raised, on failure.
+        duplicate_of: Index of the earlier identical item whose call this
+            result is shared with, or ``None`` if the call was made for this item.
+    """
+
+    index: int
+    post_urn: str
+    result: Any = None
+    error: BaseException | None = None
+    duplicate_of: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _comment_body(actor: str, text: str) -> dict[str, Any]:
+    """Build the JSON body for POST /rest/socialActions/{postUrn}/comments."""
+    return {
+        "actor": actor,
+        "message": {"text": text},
+    }
+
+
+def _reaction_body(post_urn: str, reaction_type: str) -> dict[str, Any]:
+    """Build the JSON body for POST /rest/reactions."""
+    return {
+        "root": post_urn,
+        "reactionType": reaction_type,
+    }
+
+
+def _first_occurrences(keys: list[Hashable]) -> list[int]:
+    """Map each position to the position of the first item with the same key."""
+    first: dict[Hashable, int] = {}
+    return [first.setdefault(key, i) for i, key in enumerate(keys)]
+
+
+def _bulk_results(
+    items: list[tuple[str, str]],
+    firsts: list[int],
+    outcomes: dict[int, tuple[Any, BaseException | None]],
+) -> list[EngagementResult]:
+    results = []
+    for i, (post_urn, _) in enumerate(items):
+        result, error = outcomes[firsts[i]]
+        duplicate_of = firsts[i] if firsts[i] != i else None
+        results.append(EngagementResult(i, post_urn, result, error, duplicate_of))
+    return results
+
+
+def _comment_key(item: tuple[str, str]) -> Hashable:
+    return item
+
+
+def _reaction_key(item: tuple[str, str]) -> Hashable:
+    # A member holds one reaction per post: repeats of a post are one target
+    # whatever their reaction type, and the first item's type is used.
+    return item[0]
+
 
 class EngagementMixin:
     """Mixin providing social action API methods."""
@@ -21,10 +97,7 @@ class EngagementMixin:
         encoded = self._encode_urn(post_urn)
         resp = self._post(
             f"/socialActions/{encoded}/comments",
-            json={
-                "actor": self.person_urn,
-                "message": {"text": text},
-            },
+            json=_comment_body(self.person_urn, text),
         )
         return {
             "commentUrn": resp.headers.get("x-restli-id", ""),
@@ -44,9 +117,134 @@ class EngagementMixin:
         actor_urn = self._encode_urn(self.person_urn)
         resp = self._post(
             f"/reactions?actor={actor_urn}",
-            json={
-                "root": post_urn,
-                "reactionType": reaction_type,
-            },
+            json=_reaction_body(post_urn, reaction_type),
+        )
+        return resp.status_code
+
+    def add_comments(
+        self,
+        items: Iterable[tuple[str, str]],
+        concurrency: int = DEFAULT_ENGAGEMENT_CONCURRENCY,
+    ) -> list[EngagementResult]:
+        """Comment on many posts concurrently.
+
+        Identical ``(post_urn, text)`` items are sent once; their duplicates
+        share the first item's result. One failed comment does not stop the
+        others. Requests go through the client's rate limiter, so throughput
+        is bounded by it rather than by per-call latency.
+
+        Args:
+            items: ``(post_urn, text)`` pairs.
+            concurrency: Maximum number of calls in flight at once.
+
+        Returns:
+            One :class:`EngagementResult` per item, in input order.
+        """
+        return self._run_bulk(self.add_comment, list(items), _comment_key, concurrency)
+
+    def add_reactions(
+        self,
+        items: Iterable[tuple[str, str]],
+        concurrency: int = DEFAULT_ENGAGEMENT_CONCURRENCY,
+    ) -> list[EngagementResult]:
+        """React to many posts concurrently.
+
+        A member has one reaction per post, so items repeating a post URN are
+        sent once, with the first item's reaction type; the repeats share its
+        result. One failed reaction does not stop the others.
+
+        Args:
+            items: ``(post_urn, reaction_type)`` pairs.
+            concurrency: Maximum number of calls in flight at once.
+
+        Returns:
+            One :class:`EngagementResult` per item, in input order.
+        """
+        return self._run_bulk(self.add_reaction, list(items), _reaction_key, concurrency)
+
+    def _run_bulk(
+        self,
+        call: Callable[[str, str], Any],
+        items: list[tuple[str, str]],
+        key: Callable[[tuple[str, str]], Hashable],
+        concurrency: int,
+    ) -> list[EngagementResult]:
+        firsts = _first_occurrences([key(item) for item in items])
+        unique = [i for i, first in enumerate(firsts) if first == i]
+
+        def run(i: int) -> tuple[Any, BaseException | None]:
+            try:
+                return call(*items[i]), None
+            except Exception as exc:
+                return None, exc
+
+        if len(unique) <= 1 or concurrency <= 1:
+            outcomes = {i: run(i) for i in unique}
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(unique))) as pool:
+                outcomes = dict(zip(unique, pool.map(run, unique)))
+        return _bulk_results(items, firsts, outcomes)
+
+
+class AsyncEngagementMixin:
+    """Async counterpart of :class:`EngagementMixin`."""
+
+    async def add_comment(self, post_urn: str, text: str) -> dict[str, Any]:
+        """POST /rest/socialActions/{postUrn}/comments — See :meth:`EngagementMixin.add_comment`."""
+        encoded = self._encode_urn(post_urn)
+        resp = await self._post(
+            f"/socialActions/{encoded}/comments",
+            json=_comment_body(self.person_urn, text),
+        )
+        return {
+            "commentUrn": resp.headers.get("x-restli-id", ""),
+            "statusCode": resp.status_code,
+        }
+
+    async def add_reaction(self, post_urn: str, reaction_type: str) -> int:
+        """POST /rest/reactions — See :meth:`EngagementMixin.add_reaction`."""
+        actor_urn = self._encode_urn(self.person_urn)
+        resp = await self._post(
+            f"/reactions?actor={actor_urn}",
+            json=_reaction_body(post_urn, reaction_type),
         )
         return resp.status_code
+
+    async def add_comments(
+        self,
+        items: Iterable[tuple[str, str]],
+        concurrency: int = DEFAULT_ENGAGEMENT_CONCURRENCY,
+    ) -> list[EngagementResult]:
+        """Comment on many posts concurrently — See :meth:`EngagementMixin.add_comments`."""
+        return await self._run_bulk(self.add_comment, list(items), _comment_key, concurrency)
+
+    async def add_reactions(
+        self,
+        items: Iterable[tuple[str, str]],
+        concurrency: int = DEFAULT_ENGAGEMENT_CONCURRENCY,
+    ) -> list[EngagementResult]:
+        """React to many posts concurrently — See :meth:`EngagementMixin.add_reactions`."""
+        return await self._run_bulk(self.add_reaction, list(items), _reaction_key, concurrency)
+
+    async def _run_bulk(
+        self,
+        call: Callable[[str, str], Awaitable[Any]],
+        items: list[tuple[str, str]],
+        key: Callable[[tuple[str, str]], Hashable],
+        concurrency: int,
+    ) -> list[EngagementResult]:
+        import asyncio
+
+        firsts = _first_occurrences([key(item) for item in items])
+        unique = [i for i, first in enumerate(firsts) if first == i]
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def run(i: int) -> tuple[Any, BaseException | None]:
+            async with semaphore:
+                try:
+                    return await call(*items[i]), None
+                except Exception as exc:
+                    return None, exc
+
+        outcomes = dict(zip(unique, await asyncio.gather(*(run(i) for i in unique))))
+        return _bulk_results(items, firsts, outcomes)
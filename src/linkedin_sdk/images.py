@@ -0,0 +1,200 @@
+"""Optional image pre-processing before upload (requires Pillow)."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# Longest edge kept by default; LinkedIn displays feed images well below this,
+# so larger sources only cost upload bytes.
+DEFAULT_MAX_DIMENSION = 2048
+DEFAULT_JPEG_QUALITY = 85
+
+# Upper bound on worker processes when ``processes`` is not given.
+DEFAULT_MAX_PROCESSES = 4
+
+
+def _preprocess_image(
+    src_path: str, out_path_stem: str, max_dimension: int, quality: int
+) -> str:
+    """Downsize, strip metadata and recompress one image.
+
+    Writes ``<out_path_stem>.jpg`` (or ``.png`` for images with transparency)
+    and returns its path, or returns ``src_path`` unchanged when the image
+    cannot be decoded, is animated, or would not get smaller.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        image = Image.open(src_path)
+    except (UnidentifiedImageError, OSError):
+        return src_path
+    with image:
+        if getattr(image, "is_animated", False):
+            return src_path
+        icc_profile = image.info.get("icc_profile")
+        # Apply EXIF orientation before the EXIF block is dropped.
+        processed = ImageOps.exif_transpose(image)
+        resized = max(processed.size) > max_dimension
+        if resized:
+            processed.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+        has_alpha = processed.mode in ("RGBA", "LA") or (
+            processed.mode == "P" and "transparency" in processed.info
+        )
+        save_kwargs = {"icc_profile": icc_profile} if icc_profile else {}
+        if has_alpha:
+            out_path = f"{out_path_stem}.png"
+            processed.save(out_path, "PNG", optimize=True, **save_kwargs)
+        else:
+            out_path = f"{out_path_stem}.jpg"
+            processed.convert("RGB").save(
+                out_path,
+                "JPEG",
+                quality=quality,
+                optimize=True,
+                progressive=True,
+                **save_kwargs,
+            )
+
+    if not resized and os.path.getsize(out_path) >= os.path.getsize(src_path):
+        os.remove(out_path)
+        return src_path
+    return out_path
+
+
+class ImageProcessor:
+    """Shrinks images before upload: downsize, strip metadata, recompress.
+
+    Opaque images are re-encoded as progressive JPEG and images with
+    transparency as optimized PNG; EXIF/XMP metadata is dropped (after
+    applying its orientation) while the color profile is kept. Multi-image
+    posts are processed in parallel on a pool of worker processes, started
+    on first use and kept until :meth:`close`. Workers are started with
+    ``forkserver`` (or ``spawn``), never by forking the calling process,
+    which may be running other threads; scripts therefore need an
+    ``if __name__ == "__main__":`` guard.
+
+    Example::
+
+        client = LinkedInClient(image_processor=ImageProcessor(max_dimension=2048))
+
+    Args:
+        max_dimension: Longest edge, in pixels, after downsizing.
+        quality: JPEG quality (1-95).
+        processes: Worker processes for several images (default: CPU count,
+            at most ``DEFAULT_MAX_PROCESSES``).
+
+    Raises:
+        ImportError: If Pillow is not installed.
+    """
+
+    def __init__(
+        self,
+        max_dimension: int = DEFAULT_MAX_DIMENSION,
+        quality: int = DEFAULT_JPEG_QUALITY,
+        processes: int | None = None,
+    ):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "ImageProcessor requires Pillow: pip install 'ldraney-linkedin-sdk[images]'"
+            ) from None
+        self.max_dimension = max_dimension
+        self.quality = quality
+        self.processes = processes or min(os.cpu_count() or 1, DEFAULT_MAX_PROCESSES)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache_tag(self) -> str:
+        """Identifies the processing settings, for caching processed uploads."""
+        return f"max{self.max_dimension}-q{self.quality}"
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                method = (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn"
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context(method),
+                )
+            return self._executor
+
+    def process(self, image_path: str, out_dir: str) -> str:
+        """Process one image into ``out_dir``; return the path to upload."""
+        return self.process_many([image_path], out_dir)[0]
+
+    def process_many(self, image_paths: list[str], out_dir: str) -> list[str]:
+        """Process images into ``out_dir``, in parallel processes when there are several.
+
+        Returns:
+            The paths to upload, in input order.
+        """
+        stems = [
+            os.path.join(out_dir, f"{i}-{os.path.splitext(os.path.basename(p))[0]}")
+            for i, p in enumerate(image_paths)
+        ]
+        args = [
+            (path, stem, self.max_dimension, self.quality)
+            for path, stem in zip(image_paths, stems)
+        ]
+        if self.processes <= 1 or len(image_paths) <= 1:
+            return [_preprocess_image(*a) for a in args]
+        return list(self._pool().map(_preprocess_image, *zip(*args)))
+
+    def close(self) -> None:
+        """Shut down the worker processes (a later call starts new ones)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> ImageProcessor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@contextmanager
+def _prepared_images(
+    processor: ImageProcessor | None, image_paths: list[str]
+) -> Iterator[list[str]]:
+    """Yield the paths to upload; processed copies live until the block exits."""
+    if processor is None:
+        yield list(image_paths)
+        return
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="linkedin-sdk-") as out_dir:
+        yield processor.process_many(image_paths, out_dir)
+
+
+@asynccontextmanager
+async def _aprepared_images(
+    processor: ImageProcessor | None, image_paths: list[str]
+) -> AsyncIterator[list[str]]:
+    """Async :func:`_prepared_images`; processing runs off the event loop."""
+    if processor is None:
+        yield list(image_paths)
+        return
+    import asyncio
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="linkedin-sdk-") as out_dir:
+        yield await asyncio.to_thread(processor.process_many, image_paths, out_dir)
@@ -2,8 +2,133 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from .codec import _decode_body
+
+# Read size for streamed uploads; peak memory per upload is bounded by this.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Number of video parts uploaded in parallel by upload_video_parts.
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
+
+def _iter_file_chunks(
+    file_path: str,
+    offset: int = 0,
+    length: int | None = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield ``length`` bytes of ``file_path`` starting at ``offset``, chunk by chunk."""
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        remaining = length if length is not None else os.fstat(f.fileno()).st_size - offset
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def _aiter_file_chunks(
+    file_path: str,
+    offset: int = 0,
+    length: int | None = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Async :func:`_iter_file_chunks` for ``httpx.AsyncClient``.
+
+    The open and every read run in a worker thread, so a slow disk does not
+    stall the event loop.
+    """
+    import asyncio
+
+    f = await asyncio.to_thread(open, file_path, "rb")
+    try:
+        if length is None:
+            length = os.fstat(f.fileno()).st_size - offset
+        f.seek(offset)
+        remaining = length
+        while remaining > 0:
+            chunk = await asyncio.to_thread(f.read, min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
+def _init_upload_body(owner: str) -> dict[str, Any]:
+    """Build the JSON body for POST /rest/{images,documents}?action=initializeUpload."""
+    return {"initializeUploadRequest": {"owner": owner}}
+
+
+def _init_video_upload_body(owner: str, file_size_bytes: int) -> dict[str, Any]:
+    """Build the JSON body for POST /rest/videos?action=initializeUpload."""
+    return {
+        "initializeUploadRequest": {
+            "owner": owner,
+            "fileSizeBytes": file_size_bytes,
+            "uploadCaptions": False,
+            "uploadThumbnail": False,
+        }
+    }
+
+
+def _finalize_video_body(
+    video_urn: str, etags: str | list[str], upload_token: str = ""
+) -> dict[str, Any]:
+    """Build the JSON body for POST /rest/videos?action=finalizeUpload."""
+    return {
+        "finalizeUploadRequest": {
+            "video": video_urn,
+            "uploadToken": upload_token,
+            "uploadedPartIds": [etags] if isinstance(etags, str) else list(etags),
+        }
+    }
+
+
+def _parse_init_image(body: dict[str, Any]) -> dict[str, str]:
+    return {
+        "uploadUrl": body["value"]["uploadUrl"],
+        "imageUrn": body["value"]["image"],
+    }
+
+
+def _parse_init_document(body: dict[str, Any]) -> dict[str, str]:
+    return {
+        "uploadUrl": body["value"]["uploadUrl"],
+        "documentUrn": body["value"]["document"],
+    }
+
+
+def _parse_init_video(body: dict[str, Any]) -> dict[str, Any]:
+    instructions = body["value"]["uploadInstructions"]
+    return {
+        "uploadUrl": instructions[0]["uploadUrl"],
+        "videoUrn": body["value"]["video"],
+        "uploadToken": body["value"].get("uploadToken", ""),
+        "uploadInstructions": instructions,
+    }
+
+
+def _part_range(instruction: dict[str, Any]) -> tuple[int, int]:
+    """Return (offset, length) of the file range covered by an upload instruction."""
+    first = instruction["firstByte"]
+    return first, instruction["lastByte"] - first + 1
+
+
+def _upload_result(resp: Any) -> dict[str, Any]:
+    return {
+        "statusCode": resp.status_code,
+        "etag": resp.headers.get("etag", ""),
+    }
+
 
 class MediaMixin:
     """Mixin providing media upload API methods."""
@@ -16,13 +141,9 @@ class MediaMixin:
         """
         resp = self._post(
             "/images?action=initializeUpload",
-            json={"initializeUploadRequest": {"owner": self.person_urn}},
+            json=_init_upload_body(self.person_urn),
         )
-        body = resp.json()
-        return {
-            "uploadUrl": body["value"]["uploadUrl"],
-            "imageUrn": body["value"]["image"],
-        }
+        return _parse_init_image(_decode_body(resp.content))
 
     def init_document_upload(self) -> dict[str, str]:
         """POST /rest/documents?action=initializeUpload — Get a pre-signed upload URL for a document.
@@ -32,39 +153,28 @@ class MediaMixin:
         """
         resp = self._post(
             "/documents?action=initializeUpload",
-            json={"initializeUploadRequest": {"owner": self.person_urn}},
+            json=_init_upload_body(self.person_urn),
         )
-        body = resp.json()
-        return {
-            "uploadUrl": body["value"]["uploadUrl"],
-            "documentUrn": body["value"]["document"],
-        }
+        return _parse_init_document(_decode_body(resp.content))
 
-    def init_video_upload(self, file_size_bytes: int) -> dict[str, str]:
-        """POST /rest/videos?action=initializeUpload — Get a pre-signed upload URL for a video.
+    def init_video_upload(self, file_size_bytes: int) -> dict[str, Any]:
+        """POST /rest/videos?action=initializeUpload — Get pre-signed upload URLs for a video.
+
+        Large videos are split by LinkedIn into several parts, one per entry
+        of ``uploadInstructions``; ``uploadUrl`` is the first part's URL.
 
         Args:
             file_size_bytes: Size of the video file in bytes.
 
         Returns:
-            {"uploadUrl": "...", "videoUrn": "urn:li:video:..."}
+            {"uploadUrl": "...", "videoUrn": "urn:li:video:...", "uploadToken": "...",
+             "uploadInstructions": [{"uploadUrl": "...", "firstByte": 0, "lastByte": ...}, ...]}
         """
         resp = self._post(
             "/videos?action=initializeUpload",
-            json={
-                "initializeUploadRequest": {
-                    "owner": self.person_urn,
-                    "fileSizeBytes": file_size_bytes,
-                    "uploadCaptions": False,
-                    "uploadThumbnail": False,
-                }
-            },
+            json=_init_video_upload_body(self.person_urn, file_size_bytes),
         )
-        body = resp.json()
-        return {
-            "uploadUrl": body["value"]["uploadInstructions"][0]["uploadUrl"],
-            "videoUrn": body["value"]["video"],
-        }
+        return _parse_init_video(_decode_body(resp.content))
 
     def upload_binary(self, upload_url: str, data: bytes, content_type: str) -> dict[str, Any]:
         """PUT binary data to a LinkedIn upload URL.
@@ -78,29 +188,189 @@ class MediaMixin:
             {"statusCode": 200, "etag": "..."} (etag only for video uploads)
         """
         resp = self._put_binary(upload_url, data, content_type)
-        return {
-            "statusCode": resp.status_code,
-            "etag": resp.headers.get("etag", ""),
-        }
+        return _upload_result(resp)
+
+    def upload_file(self, upload_url: str, file_path: str, content_type: str) -> dict[str, Any]:
+        """PUT a file to a LinkedIn upload URL, streaming it from disk.
+
+        Unlike :meth:`upload_binary`, the file is never loaded into memory as a
+        whole, so peak memory stays constant regardless of file size.
+
+        Args:
+            upload_url: Pre-signed upload URL from init_*_upload.
+            file_path: Path to the file to upload.
+            content_type: MIME type of the file.
 
-    def finalize_video(self, video_urn: str, etag: str) -> int:
+        Returns:
+            {"statusCode": 200, "etag": "..."} (etag only for video uploads)
+        """
+        size = os.stat(file_path).st_size
+        resp = self._put_binary(
+            upload_url,
+            _iter_file_chunks(file_path, 0, size),
+            content_type,
+            content_length=size,
+        )
+        return _upload_result(resp)
+
+    def upload_video_parts(
+        self,
+        upload_instructions: list[dict[str, Any]],
+        file_path: str,
+        content_type: str = "application/octet-stream",
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        completed: dict[int, str] | None = None,
+        on_part: Callable[[int, str], None] | None = None,
+    ) -> list[str]:
+        """PUT every part of a multipart video upload, several at a time.
+
+        Each part streams its ``firstByte``..``lastByte`` range of the file.
+
+        Args:
+            upload_instructions: ``uploadInstructions`` from init_video_upload.
+            file_path: Path to the video file.
+            content_type: MIME type sent with each part.
+            concurrency: Maximum number of parts in flight at once.
+            completed: Etags of parts already uploaded, by instruction index;
+                those parts are not sent again.
+            on_part: Called with ``(index, etag)`` as each part finishes, e.g.
+                to journal progress.
+
+        Returns:
+            The part etags, in instruction order (ready for finalize_video).
+        """
+        completed = completed or {}
+
+        def upload_part(index: int) -> str:
+            if index in completed:
+                return completed[index]
+            offset, length = _part_range(upload_instructions[index])
+            resp = self._put_binary(
+                upload_instructions[index]["uploadUrl"],
+                _iter_file_chunks(file_path, offset, length),
+                content_type,
+                content_length=length,
+            )
+            etag = resp.headers.get("etag", "")
+            if on_part is not None:
+                on_part(index, etag)
+            return etag
+
+        indices = range(len(upload_instructions))
+        if len(upload_instructions) - len(completed) <= 1 or concurrency <= 1:
+            return [upload_part(index) for index in indices]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(upload_part, indices))
+
+    def finalize_video(
+        self, video_urn: str, etag: str | list[str], upload_token: str = ""
+    ) -> int:
         """POST /rest/videos?action=finalizeUpload — Finalize a video upload.
 
         Args:
             video_urn: The video URN from init_video_upload.
-            etag: The etag from upload_binary response.
+            etag: The etag from upload_binary, or the list of part etags from
+                upload_video_parts.
+            upload_token: The ``uploadToken`` from init_video_upload.
 
         Returns:
             HTTP status code.
         """
         resp = self._post(
             "/videos?action=finalizeUpload",
-            json={
-                "finalizeUploadRequest": {
-                    "video": video_urn,
-                    "uploadToken": "",
-                    "uploadedPartIds": [etag],
-                }
-            },
+            json=_finalize_video_body(video_urn, etag, upload_token),
+        )
+        return resp.status_code
+
+
+class AsyncMediaMixin:
+    """Async counterpart of :class:`MediaMixin`."""
+
+    async def init_image_upload(self) -> dict[str, str]:
+        """POST /rest/images?action=initializeUpload — See :meth:`MediaMixin.init_image_upload`."""
+        resp = await self._post(
+            "/images?action=initializeUpload",
+            json=_init_upload_body(self.person_urn),
+        )
+        return _parse_init_image(_decode_body(resp.content))
+
+    async def init_document_upload(self) -> dict[str, str]:
+        """POST /rest/documents?action=initializeUpload — See :meth:`MediaMixin.init_document_upload`."""
+        resp = await self._post(
+            "/documents?action=initializeUpload",
+            json=_init_upload_body(self.person_urn),
+        )
+        return _parse_init_document(_decode_body(resp.content))
+
+    async def init_video_upload(self, file_size_bytes: int) -> dict[str, Any]:
+        """POST /rest/videos?action=initializeUpload — See :meth:`MediaMixin.init_video_upload`."""
+        resp = await self._post(
+            "/videos?action=initializeUpload",
+            json=_init_video_upload_body(self.person_urn, file_size_bytes),
+        )
+        return _parse_init_video(_decode_body(resp.content))
+
+    async def upload_binary(
+        self, upload_url: str, data: bytes, content_type: str
+    ) -> dict[str, Any]:
+        """PUT binary data to a LinkedIn upload URL — See :meth:`MediaMixin.upload_binary`."""
+        resp = await self._put_binary(upload_url, data, content_type)
+        return _upload_result(resp)
+
+    async def upload_file(
+        self, upload_url: str, file_path: str, content_type: str
+    ) -> dict[str, Any]:
+        """PUT a file to a LinkedIn upload URL, streaming it from disk — See :meth:`MediaMixin.upload_file`."""
+        size = os.stat(file_path).st_size
+        resp = await self._put_binary(
+            upload_url,
+            _aiter_file_chunks(file_path, 0, size),
+            content_type,
+            content_length=size,
+        )
+        return _upload_result(resp)
+
+    async def upload_video_parts(
+        self,
+        upload_instructions: list[dict[str, Any]],
+        file_path: str,
+        content_type: str = "application/octet-stream",
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        completed: dict[int, str] | None = None,
+        on_part: Callable[[int, str], None] | None = None,
+    ) -> list[str]:
+        """PUT every part of a multipart video upload — See :meth:`MediaMixin.upload_video_parts`."""
+        import asyncio
+
+        completed = completed or {}
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def upload_part(index: int) -> str:
+            if index in completed:
+                return completed[index]
+            offset, length = _part_range(upload_instructions[index])
+            async with semaphore:
+                resp = await self._put_binary(
+                    upload_instructions[index]["uploadUrl"],
+                    _aiter_file_chunks(file_path, offset, length),
+                    content_type,
+                    content_length=length,
+                )
+            etag = resp.headers.get("etag", "")
+            if on_part is not None:
+                on_part(index, etag)
+            return etag
+
+        return list(
+            await asyncio.gather(*(upload_part(i) for i in range(len(upload_instructions))))
+        )
+
+    async def finalize_video(
+        self, video_urn: str, etag: str | list[str], upload_token: str = ""
+    ) -> int:
+        """POST /rest/videos?action=finalizeUpload — See :meth:`MediaMixin.finalize_video`."""
+        resp = await self._post(
+            "/videos?action=finalizeUpload",
+            json=_finalize_video_body(video_urn, etag, upload_token),
         )
         return resp.status_code
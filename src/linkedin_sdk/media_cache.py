@@ -0,0 +1,107 @@
+"""Content-addressed cache of uploaded media URNs."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+
+from .media import _iter_file_chunks
+
+# Default lifetime of a cached URN: 30 days.
+DEFAULT_MEDIA_TTL = 30 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media (
+    digest TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    urn TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (digest, owner, kind)
+)
+"""
+
+
+def _file_digest(file_path: str) -> str:
+    """SHA-256 of a file, read chunk by chunk so memory stays bounded."""
+    digest = hashlib.sha256()
+    for chunk in _iter_file_chunks(file_path):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MediaCache:
+    """Persistent map from (content hash, owner URN, media kind) to an uploaded URN.
+
+    With a cache attached to the client, ``create_post_with_image`` and the
+    other media helpers hash the file (streaming) and, if the same bytes were
+    already uploaded by the same owner, attach the stored URN instead of
+    uploading again. Backed by SQLite, so it can be shared by processes.
+
+    Example::
+
+        client = LinkedInClient(media_cache=MediaCache("~/.cache/linkedin-media.db"))
+
+    Args:
+        path: SQLite database file (created if missing), or ``":memory:"``.
+        ttl: Seconds a URN is reused after its upload (``None``: forever).
+    """
+
+    def __init__(self, path: str, ttl: float | None = DEFAULT_MEDIA_TTL):
+        import sqlite3
+
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        self.ttl = ttl
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def get(self, digest: str, owner: str, kind: str) -> str | None:
+        """Return the cached URN for this content, or ``None`` if absent or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT urn, created_at FROM media WHERE digest = ? AND owner = ? AND kind = ?",
+                (digest, owner, kind),
+            ).fetchone()
+        if row is None:
+            return None
+        urn, created_at = row
+        if self.ttl is not None and time.time() - created_at >= self.ttl:
+            return None
+        return urn
+
+    def set(self, digest: str, owner: str, kind: str, urn: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO media (digest, owner, kind, urn, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, owner, kind, urn, time.time()),
+            )
+
+    def invalidate(self, urn: str) -> None:
+        """Forget a URN, e.g. after LinkedIn rejected it as unknown."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM media WHERE urn = ?", (urn,))
+
+    def purge_expired(self) -> int:
+        """Delete expired rows; return how many were removed."""
+        if self.ttl is None:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM media WHERE created_at <= ?", (time.time() - self.ttl,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM media")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,152 @@
+"""Per-request instrumentation."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+# Latency histogram bucket upper bounds, in seconds.
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """A completed HTTP request, as passed to ``on_request`` hooks.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: Endpoint family (``posts``, ``images``, ``userinfo``, ...),
+            or ``upload`` for PUTs to pre-signed upload URLs.
+        status_code: Final HTTP status code.
+        duration: Wall time in seconds, including rate-limit waits and retries.
+        retries: Number of throttled (429) attempts that were retried.
+        request_bytes: Size of the request body.
+        response_bytes: Size of the response body.
+    """
+
+    method: str
+    endpoint: str
+    status_code: int
+    duration: float
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile: the upper bound of the bucket holding it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip((*LATENCY_BUCKETS, float("inf")), self.counts)),
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("latency", "statuses", "retries", "request_bytes", "response_bytes")
+
+    def __init__(self) -> None:
+        self.latency = _Histogram()
+        self.statuses: dict[int, int] = {}
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class MetricsRegistry:
+    """Thread-safe aggregator usable directly as an ``on_request`` hook.
+
+    Example::
+
+        metrics = MetricsRegistry()
+        client = LinkedInClient(on_request=metrics)
+        ...
+        print(metrics.snapshot()["posts"]["latency"]["p99"])
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.record(event)
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self._endpoints[event.endpoint] = _EndpointStats()
+            stats.latency.observe(event.duration)
+            stats.statuses[event.status_code] = stats.statuses.get(event.status_code, 0) + 1
+            stats.retries += event.retries
+            stats.request_bytes += event.request_bytes
+            stats.response_bytes += event.response_bytes
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-endpoint metrics.
+
+        Returns:
+            {endpoint: {"latency": {"count", "sum", "max", "p50", "p99", "buckets"},
+                        "statuses": {200: n, ...}, "retries": n,
+                        "request_bytes": n, "response_bytes": n,
+                        "request_bytes_per_second": x}}
+
+            ``request_bytes_per_second`` is the upload throughput for the
+            ``upload`` endpoint.
+        """
+        with self._lock:
+            snapshot = {}
+            for endpoint, stats in self._endpoints.items():
+                latency = stats.latency.snapshot()
+                snapshot[endpoint] = {
+                    "latency": latency,
+                    "statuses": dict(stats.statuses),
+                    "retries": stats.retries,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "request_bytes_per_second": (
+                        stats.request_bytes / latency["sum"] if latency["sum"] else 0.0
+                    ),
+                }
+            return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,150 @@
+"""Compact typed models for post listings and upload results.
+
+The client returns plain dicts by default. These slotted dataclasses are an
+opt-in, lower-memory representation for holding many posts at once: no
+per-instance ``__dict__``, and values that repeat across posts (author,
+visibility, lifecycle state) are interned so every post shares one string.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+
+def _shared(value: str | None) -> str:
+    return sys.intern(value) if value else ""
+
+
+@dataclass(slots=True)
+class Post:
+    """A post, as listed by ``get_my_posts`` / ``iter_my_posts``.
+
+    Attributes:
+        id: Post URN.
+        author: Author URN.
+        commentary: Post text.
+        visibility: PUBLIC, CONNECTIONS, LOGGED_IN or CONTAINER.
+        lifecycle_state: e.g. PUBLISHED, DRAFT.
+        created_at: Creation time, in epoch milliseconds.
+        last_modified_at: Last modification time, in epoch milliseconds.
+        published_at: Publication time, in epoch milliseconds.
+        content: Raw content dict (media, article, multiImage, poll), if any.
+        is_reshare_disabled: Whether the author disabled resharing.
+    """
+
+    id: str
+    author: str = ""
+    commentary: str = ""
+    visibility: str = ""
+    lifecycle_state: str = ""
+    created_at: int | None = None
+    last_modified_at: int | None = None
+    published_at: int | None = None
+    content: dict[str, Any] | None = None
+    is_reshare_disabled: bool = False
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Post:
+        """Build a post from an element of a ``/rest/posts`` response."""
+        return cls(
+            id=data.get("id", ""),
+            author=_shared(data.get("author")),
+            commentary=data.get("commentary", ""),
+            visibility=_shared(data.get("visibility")),
+            lifecycle_state=_shared(data.get("lifecycleState")),
+            created_at=data.get("createdAt"),
+            last_modified_at=data.get("lastModifiedAt"),
+            published_at=data.get("publishedAt"),
+            content=data.get("content") or None,
+            is_reshare_disabled=bool(data.get("isReshareDisabledByAuthor", False)),
+        )
+
+    @property
+    def content_type(self) -> str | None:
+        """Kind of attached content (``media``, ``article``, ...), or ``None`` for text posts."""
+        if not self.content:
+            return None
+        return next(iter(self.content))
+
+
+@dataclass(slots=True)
+class Paging:
+    """Paging block of a list response."""
+
+    start: int = 0
+    count: int = 0
+    total: int | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Paging:
+        return cls(data.get("start", 0), data.get("count", 0), data.get("total"))
+
+
+class PostPage:
+    """One page of ``get_my_posts`` results, decoding posts lazily.
+
+    Holds the decoded JSON elements and builds a :class:`Post` only for the
+    elements you access, so iterating a page and keeping a few posts does not
+    materialize the rest.
+    """
+
+    __slots__ = ("_elements", "paging")
+
+    def __init__(self, elements: list[dict[str, Any]], paging: Paging):
+        self._elements = elements
+        self.paging = paging
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> PostPage:
+        """Wrap a ``get_my_posts`` response (``{"elements": [...], "paging": {...}}``)."""
+        return cls(data.get("elements", []), Paging.from_api(data.get("paging", {})))
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __getitem__(self, index: int) -> Post:
+        return Post.from_api(self._elements[index])
+
+    def __iter__(self) -> Iterator[Post]:
+        return map(Post.from_api, self._elements)
+
+    def __repr__(self) -> str:
+        return f"PostPage({len(self)} posts, paging={self.paging!r})"
+
+
+@dataclass(slots=True)
+class UploadPart:
+    """One part of a multipart video upload."""
+
+    upload_url: str
+    first_byte: int
+    last_byte: int
+
+
+@dataclass(slots=True)
+class MediaUpload:
+    """Result of ``init_image_upload`` / ``init_document_upload`` / ``init_video_upload``.
+
+    Attributes:
+        urn: The image, document or video URN.
+        upload_url: Single-PUT upload URL (images and documents).
+        upload_token: Token to pass to ``finalize_video`` (videos).
+        parts: Multipart upload instructions (videos).
+    """
+
+    urn: str
+    upload_url: str = ""
+    upload_token: str = ""
+    parts: tuple[UploadPart, ...] = ()
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> MediaUpload:
+        urn = data.get("imageUrn") or data.get("documentUrn") or data.get("videoUrn") or ""
+        parts = tuple(
+            UploadPart(part["uploadUrl"], part["firstByte"], part["lastByte"])
+            for part in data.get("uploadInstructions", ())
+        )
+        return cls(urn, data.get("uploadUrl", ""), data.get("uploadToken", ""), parts)
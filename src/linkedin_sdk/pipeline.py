@@ -0,0 +1,193 @@
+"""Bounded-concurrency bulk publishing."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from .convenience import (
+    ConvenienceMixin,
+    _image_content,
+    _multi_image_content,
+    _titled_media_content,
+)
+from .media import DEFAULT_UPLOAD_CONCURRENCY
+
+
+@dataclass
+class PostSpec:
+    """One post to publish.
+
+    Set at most one media field; with none, ``content`` is sent as-is.
+
+    Attributes:
+        commentary: Post text.
+        visibility: Post visibility.
+        image_path: Single image to upload.
+        image_paths: Images for a multi-image post.
+        alt_text: Alt text for ``image_path``.
+        alt_texts: Alt texts for ``image_paths`` (matched by index).
+        document_path: Document to upload.
+        video_path: Video to upload.
+        title: Document/video title (defaults to filename).
+        content: Raw content dict for posts without uploaded media.
+    """
+
+    commentary: str
+    visibility: str = "PUBLIC"
+    image_path: str | None = None
+    image_paths: list[str] | None = None
+    alt_text: str | None = None
+    alt_texts: list[str] | None = None
+    document_path: str | None = None
+    video_path: str | None = None
+    title: str | None = None
+    content: dict[str, Any] | None = None
+
+    @property
+    def has_media(self) -> bool:
+        return bool(
+            self.image_path or self.image_paths or self.document_path or self.video_path
+        )
+
+
+@dataclass
+class PublishResult:
+    """Outcome of publishing one :class:`PostSpec`.
+
+    Attributes:
+        index: Position of the spec in the input stream.
+        spec: The spec that was published.
+        result: create_post result plus media URNs, on success.
+        error: The exception raised by any stage, on failure.
+    """
+
+    index: int
+    spec: PostSpec
+    result: dict[str, Any] = field(default_factory=dict)
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PublishPipeline:
+    """Publish many posts, overlapping media uploads with post creation.
+
+    Each spec goes through an upload stage (init -> upload -> finalize, on a
+    pool of ``upload_concurrency`` workers) and a create stage (create_post,
+    on a pool of ``create_concurrency`` workers), so the upload of post k+1
+    runs while post k is being created. Specs are pulled from the input
+    lazily, keeping at most ``max_in_flight`` in progress.
+
+    Example::
+
+        pipeline = PublishPipeline(client, upload_concurrency=4, create_concurrency=2)
+        for item in pipeline.run(PostSpec(text, image_path=p) for text, p in rows):
+            print(item.index, item.result if item.ok else item.error)
+
+    Args:
+        client: A client built on :class:`ConvenienceMixin` (e.g. LinkedInClient).
+        upload_concurrency: Specs whose media is uploaded in parallel.
+        create_concurrency: create_post calls in parallel.
+        part_concurrency: Parallel parts per multipart video upload, and
+            parallel images per multi-image post.
+        max_in_flight: Specs in progress at once (default: twice the workers).
+    """
+
+    def __init__(
+        self,
+        client: ConvenienceMixin,
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        create_concurrency: int = 2,
+        part_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        max_in_flight: int | None = None,
+    ):
+        self.client = client
+        self.upload_concurrency = max(upload_concurrency, 1)
+        self.create_concurrency = max(create_concurrency, 1)
+        self.part_concurrency = part_concurrency
+        self.max_in_flight = max_in_flight or 2 * (
+            self.upload_concurrency + self.create_concurrency
+        )
+
+    def _upload_stage(self, spec: PostSpec) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Upload the spec's media; return (content, media URNs for the result)."""
+        client = self.client
+        if spec.image_path:
+            urn = client._upload_image(spec.image_path)
+            return _image_content(urn, spec.alt_text), {"imageUrn": urn}
+        if spec.image_paths:
+            urns = client._upload_images(spec.image_paths, self.part_concurrency)
+            return _multi_image_content(urns, spec.alt_texts), {"imageUrns": urns}
+        if spec.document_path:
+            urn = client._upload_document(spec.document_path)
+            content = _titled_media_content(urn, spec.title, spec.document_path)
+            return content, {"documentUrn": urn}
+        if spec.video_path:
+            urn = client._upload_video(spec.video_path, self.part_concurrency)
+            content = _titled_media_content(urn, spec.title, spec.video_path)
+            return content, {"videoUrn": urn}
+        return spec.content, {}
+
+    def _create_stage(
+        self, spec: PostSpec, content: dict[str, Any] | None, extras: dict[str, Any]
+    ) -> dict[str, Any]:
+        result = self.client.create_post(
+            commentary=spec.commentary,
+            visibility=spec.visibility,
+            content=content,
+        )
+        result.update(extras)
+        return result
+
+    def run(self, specs: Iterable[PostSpec]) -> Iterator[PublishResult]:
+        """Publish ``specs`` and yield a :class:`PublishResult` per post as each completes.
+
+        A failure in either stage is reported on that post's result and does
+        not stop the rest of the batch.
+        """
+        upload_pool = ThreadPoolExecutor(max_workers=self.upload_concurrency)
+        create_pool = ThreadPoolExecutor(max_workers=self.create_concurrency)
+        pending: dict[Future, tuple[str, int, PostSpec]] = {}
+        spec_iter = enumerate(specs)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    try:
+                        index, spec = next(spec_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if spec.has_media:
+                        future = upload_pool.submit(self._upload_stage, spec)
+                        pending[future] = ("upload", index, spec)
+                    else:
+                        future = create_pool.submit(
+                            self._create_stage, spec, spec.content, {}
+                        )
+                        pending[future] = ("create", index, spec)
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, index, spec = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        yield PublishResult(index, spec, error=error)
+                    elif stage == "upload":
+                        content, extras = future.result()
+                        future = create_pool.submit(
+                            self._create_stage, spec, content, extras
+                        )
+                        pending[future] = ("create", index, spec)
+                    else:
+                        yield PublishResult(index, spec, result=future.result())
+        finally:
+            upload_pool.shutdown(wait=False, cancel_futures=True)
+            create_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,221 @@
+"""Local SQLite index of a member's posts."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    author TEXT NOT NULL,
+    visibility TEXT,
+    lifecycle_state TEXT,
+    content_type TEXT,
+    created_at INTEGER,
+    last_modified_at INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_author ON posts (author, created_at);
+CREATE INDEX IF NOT EXISTS posts_created ON posts (created_at);
+CREATE INDEX IF NOT EXISTS posts_lifecycle ON posts (lifecycle_state, created_at);
+CREATE INDEX IF NOT EXISTS posts_content_type ON posts (content_type, created_at);
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO posts (id, author, visibility, lifecycle_state, "
+    "content_type, created_at, last_modified_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+# Kinds of single-media content, from the ``urn:li:<kind>:...`` media URN.
+_MEDIA_KINDS = frozenset({"image", "video", "document"})
+
+
+def _content_type(post: dict[str, Any]) -> str | None:
+    """Kind of attached content, or ``None`` for text posts.
+
+    Single media is told apart by its URN (``image``, ``video``,
+    ``document``); other content uses its key (``article``, ``multiImage``,
+    ``poll``, ...).
+    """
+    content = post.get("content")
+    if not content:
+        return None
+    kind = next(iter(content))
+    if kind == "media":
+        urn_parts = str(content["media"].get("id", "")).split(":")
+        if len(urn_parts) > 2 and urn_parts[2] in _MEDIA_KINDS:
+            return urn_parts[2]
+    return kind
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _row(post: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        post["id"],
+        post.get("author", ""),
+        post.get("visibility"),
+        post.get("lifecycleState"),
+        _content_type(post),
+        post.get("createdAt"),
+        post.get("lastModifiedAt"),
+        json.dumps(post),
+    )
+
+
+class PostIndex:
+    """Queryable local copy of posts, kept in SQLite.
+
+    With an index attached to the client, every ``get_my_posts`` page is
+    ingested, and ``create_post``, ``update_post``, ``delete_post`` and
+    ``delete_posts`` write through, so dashboards can filter posts by author,
+    date, lifecycle state or content type locally instead of paging the API.
+    Those columns are indexed.
+
+    Example::
+
+        index = PostIndex("~/.cache/linkedin-posts.db")
+        client = LinkedInClient(post_index=index)
+        for _ in client.iter_my_posts():  # fills the index
+            pass
+        videos = index.query(content_type="video", since=start_of_month_ms)
+
+    Args:
+        path: SQLite database file (created if missing), or ``":memory:"``.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            # Indexes written before media kinds were told apart say "media".
+            stale = self._conn.execute(
+                "SELECT data FROM posts WHERE content_type = 'media'"
+            ).fetchall()
+            self._conn.executemany(_UPSERT, [_row(json.loads(data)) for (data,) in stale])
+
+    # ---- writes -----------------------------------------------------------
+
+    def ingest(self, posts: Iterable[dict[str, Any]]) -> int:
+        """Insert or replace posts (``/rest/posts`` elements); return how many were stored."""
+        rows = [_row(post) for post in posts if post.get("id")]
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def update(self, post_urn: str, fields: dict[str, Any]) -> None:
+        """Apply a partial update (API field names) to an indexed post, if present."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT data FROM posts WHERE id = ?", (post_urn,)
+            ).fetchone()
+            if row is None:
+                return
+            post = json.loads(row[0])
+            post.update(fields)
+            self._conn.execute(_UPSERT, _row(post))
+
+    def remove(self, post_urns: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM posts WHERE id = ?", [(urn,) for urn in post_urns]
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM posts")
+
+    # ---- reads ------------------------------------------------------------
+
+    def get(self, post_urn: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM posts WHERE id = ?", (post_urn,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        author: str | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        lifecycle_state: str | None = None,
+        content_type: str | None = None,
+        visibility: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return indexed posts matching every given filter, newest first.
+
+        Args:
+            author: Author URN.
+            since: Earliest ``createdAt`` (epoch milliseconds, inclusive).
+            until: Latest ``createdAt`` (epoch milliseconds, exclusive).
+            lifecycle_state: e.g. PUBLISHED.
+            content_type: Content kind (``image``, ``video``, ``document``,
+                ``article``, ``multiImage``, ``poll``, ...); ``""`` selects
+                text-only posts.
+            visibility: e.g. PUBLIC.
+            limit: Maximum number of posts.
+
+        Returns:
+            Post dicts, as returned by the API.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("author", author),
+            ("lifecycle_state", lifecycle_state),
+            ("visibility", visibility),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if content_type == "":
+            clauses.append("content_type IS NULL")
+        elif content_type is not None:
+            clauses.append("content_type = ?")
+            params.append(content_type)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        sql = "SELECT data FROM posts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _created_post(post_urn: str, body: dict[str, Any]) -> dict[str, Any]:
+    """The post dict to index for a create_post request body."""
+    now = _now_ms()
+    return {"id": post_urn, **body, "createdAt": now, "lastModifiedAt": now}
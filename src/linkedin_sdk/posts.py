@@ -2,7 +2,127 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from .post_index import _created_post, _now_ms
+
+if TYPE_CHECKING:
+    from .models import Post, PostPage
+
+# Largest page size accepted by GET /rest/posts?q=author.
+MAX_POSTS_PAGE_SIZE = 100
+
+# Number of URNs sent per Rest.li BATCH_GET / BATCH_DELETE request.
+MAX_POSTS_BATCH_SIZE = 50
+
+
+def _create_post_body(
+    author: str,
+    commentary: str,
+    visibility: str,
+    content: dict[str, Any] | None,
+    is_reshare_disabled: bool,
+) -> dict[str, Any]:
+    """Build the JSON body for POST /rest/posts."""
+    body: dict[str, Any] = {
+        "author": author,
+        "commentary": commentary,
+        "visibility": visibility,
+        "distribution": {"feedDistribution": "MAIN_FEED"},
+        "lifecycleState": "PUBLISHED",
+    }
+    if content:
+        body["content"] = content
+    if is_reshare_disabled:
+        body["isReshareDisabledByAuthor"] = True
+    return body
+
+
+def _my_posts_path(
+    encoded_author: str, limit: int, offset: int, sort_by: str | None = None
+) -> str:
+    """Build the path for GET /rest/posts?q=author."""
+    path = f"/posts?author={encoded_author}&q=author&start={offset}&count={limit}"
+    if sort_by:
+        path += f"&sortBy={sort_by}"
+    return path
+
+
+def _next_link(paging: dict[str, Any]) -> str | None:
+    """Return the href of the paging block's ``rel=next`` link, if there is one."""
+    for link in paging.get("links") or ():
+        if link.get("rel") == "next":
+            return link.get("href", "")
+    return None
+
+
+def _next_offset(page: dict[str, Any], offset: int, page_size: int) -> int | None:
+    """Return the start of the page after ``page``, or None if it was the last one.
+
+    The paging block decides when it is present: LinkedIn may return short
+    pages before the end, so a short page only ends the listing when the
+    response carries neither ``total`` nor a ``next`` link.
+    """
+    count = len(page.get("elements", []))
+    if count == 0:
+        return None
+    next_offset = offset + count
+    paging = page.get("paging") or {}
+    total = paging.get("total")
+    if total is not None:
+        return next_offset if next_offset < total else None
+    next_link = _next_link(paging)
+    if next_link is not None:
+        start = parse_qs(urlsplit(next_link).query).get("start")
+        return int(start[0]) if start and int(start[0]) > offset else next_offset
+    if count < page_size:
+        return None
+    return next_offset
+
+
+def _batch_chunks(urns: list[str], batch_size: int) -> list[list[str]]:
+    """De-duplicate ``urns`` (keeping order) and split them into batches."""
+    unique = list(dict.fromkeys(urns))
+    size = max(batch_size, 1)
+    return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+
+def _batch_ids_path(encoded_urns: list[str]) -> str:
+    """Build a Rest.li 2.0 batch path: /posts?ids=List(urn1,urn2,...)."""
+    return f"/posts?ids=List({','.join(encoded_urns)})"
+
+
+def _merge_batch_get(body: dict[str, Any], merged: dict[str, Any]) -> None:
+    merged["results"].update(body.get("results", {}))
+    merged["errors"].update(body.get("errors", {}))
+
+
+def _merge_batch_delete(body: dict[str, Any], merged: dict[str, Any]) -> None:
+    for urn, item in body.get("results", {}).items():
+        merged["results"][urn] = item.get("status", 204)
+    merged["errors"].update(body.get("errors", {}))
+
+
+def _update_post_body(
+    commentary: str | None,
+    content_call_to_action_label: str | None,
+    content_landing_page: str | None,
+) -> dict[str, Any]:
+    """Build the PARTIAL_UPDATE patch body for POST /rest/posts/{postUrn}."""
+    set_fields: dict[str, str] = {}
+    if commentary is not None:
+        set_fields["commentary"] = commentary
+    if content_call_to_action_label is not None:
+        set_fields["contentCallToActionLabel"] = content_call_to_action_label
+    if content_landing_page is not None:
+        set_fields["contentLandingPage"] = content_landing_page
+    return {"patch": {"$set": set_fields}}
+
+
+_PARTIAL_UPDATE_HEADERS = {"X-RestLi-Method": "PARTIAL_UPDATE"}
 
 
 class PostsMixin:
@@ -26,21 +146,15 @@ class PostsMixin:
         Returns:
             {"postUrn": "urn:li:share:...", "statusCode": 201}
         """
-        body: dict[str, Any] = {
-            "author": self.person_urn,
-            "commentary": commentary,
-            "visibility": visibility,
-            "distribution": {"feedDistribution": "MAIN_FEED"},
-            "lifecycleState": "PUBLISHED",
-        }
-        if content:
-            body["content"] = content
-        if is_reshare_disabled:
-            body["isReshareDisabledByAuthor"] = True
-
+        body = _create_post_body(
+            self.person_urn, commentary, visibility, content, is_reshare_disabled
+        )
         resp = self._post("/posts", json=body)
+        post_urn = resp.headers.get("x-restli-id", "")
+        if self.post_index is not None and post_urn:
+            self.post_index.ingest([_created_post(post_urn, body)])
         return {
-            "postUrn": resp.headers.get("x-restli-id", ""),
+            "postUrn": post_urn,
             "statusCode": resp.status_code,
         }
 
@@ -48,20 +162,129 @@ class PostsMixin:
         self,
         limit: int = 10,
         offset: int = 0,
-    ) -> dict[str, Any]:
+        models: bool = False,
+        sort_by: str | None = None,
+    ) -> dict[str, Any] | PostPage:
         """GET /rest/posts?q=author — Get the authenticated user's posts.
 
         Args:
             limit: Number of posts to return (max 100).
             offset: Pagination offset.
+            models: Return a :class:`PostPage` of compact :class:`Post`
+                models instead of the raw dict.
+            sort_by: ``LAST_MODIFIED`` (the API default when omitted) or
+                ``CREATED``; both list newest first.
 
         Returns:
             {"elements": [...], "paging": {...}}
         """
         encoded_urn = self._encode_urn(self.person_urn)
-        return self._get(
-            f"/posts?author={encoded_urn}&q=author&start={offset}&count={limit}"
-        )
+        page = self._get(_my_posts_path(encoded_urn, limit, offset, sort_by))
+        if self.post_index is not None:
+            self.post_index.ingest(page.get("elements", []))
+        if models:
+            from .models import PostPage
+
+            return PostPage.from_api(page)
+        return page
+
+    def iter_my_posts(
+        self,
+        page_size: int = MAX_POSTS_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        models: bool = False,
+        sort_by: str | None = None,
+    ) -> Iterator[dict[str, Any] | Post]:
+        """Iterate over all of the authenticated user's posts, one at a time.
+
+        Walks the pages of :meth:`get_my_posts`. With ``prefetch`` the next
+        page is requested in a background thread while the current one is
+        being consumed.
+
+        Args:
+            page_size: Posts requested per page (max 100).
+            offset: Pagination offset to start from.
+            prefetch: Fetch the next page ahead of time.
+            models: Yield compact :class:`Post` models instead of dicts; each
+                is built as it is yielded.
+            sort_by: Order of the listing, as for :meth:`get_my_posts`.
+
+        Yields:
+            Post dicts, in the order returned by the API.
+        """
+        if models:
+            from .models import Post
+
+            posts = self.iter_my_posts(page_size, offset, prefetch, sort_by=sort_by)
+            yield from map(Post.from_api, posts)
+            return
+        if not prefetch:
+            next_offset: int | None = offset
+            while next_offset is not None:
+                page = self.get_my_posts(limit=page_size, offset=next_offset, sort_by=sort_by)
+                yield from page.get("elements", [])
+                next_offset = _next_offset(page, next_offset, page_size)
+            return
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = self.get_my_posts(limit=page_size, offset=offset, sort_by=sort_by)
+            while True:
+                next_offset = _next_offset(page, offset, page_size)
+                future = None
+                if next_offset is not None:
+                    future = pool.submit(
+                        self.get_my_posts, page_size, next_offset, sort_by=sort_by
+                    )
+                yield from page.get("elements", [])
+                if future is None:
+                    return
+                page, offset = future.result(), next_offset
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_posts(
+        self, post_urns: list[str], batch_size: int = MAX_POSTS_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """GET /rest/posts?ids=List(...) — Fetch several posts by URN (BATCH_GET).
+
+        URNs are de-duplicated and sent ``batch_size`` at a time.
+
+        Args:
+            post_urns: URNs of the posts to fetch.
+            batch_size: URNs per request.
+
+        Returns:
+            {"results": {postUrn: {...post...}}, "errors": {postUrn: {"status": 404, ...}}}
+        """
+        merged: dict[str, Any] = {"results": {}, "errors": {}}
+        for chunk in _batch_chunks(post_urns, batch_size):
+            path = _batch_ids_path([self._encode_urn(urn) for urn in chunk])
+            _merge_batch_get(self._get(path), merged)
+        return merged
+
+    def delete_posts(
+        self, post_urns: list[str], batch_size: int = MAX_POSTS_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """DELETE /rest/posts?ids=List(...) — Delete several posts (BATCH_DELETE).
+
+        URNs are de-duplicated and sent ``batch_size`` at a time.
+
+        Args:
+            post_urns: URNs of the posts to delete.
+            batch_size: URNs per request.
+
+        Returns:
+            {"results": {postUrn: 204}, "errors": {postUrn: {"status": 404, ...}}}
+        """
+        merged: dict[str, Any] = {"results": {}, "errors": {}}
+        for chunk in _batch_chunks(post_urns, batch_size):
+            path = _batch_ids_path([self._encode_urn(urn) for urn in chunk])
+            _merge_batch_delete(self._batch_delete(path), merged)
+        if self.post_index is not None:
+            self.post_index.remove(merged["results"])
+        return merged
 
     def delete_post(self, post_urn: str) -> int:
         """DELETE /rest/posts/{postUrn} — Delete a post.
@@ -73,7 +296,10 @@ class PostsMixin:
             HTTP status code (204 on success).
         """
         encoded = self._encode_urn(post_urn)
-        return self._delete(f"/posts/{encoded}")
+        status = self._delete(f"/posts/{encoded}")
+        if self.post_index is not None:
+            self.post_index.remove([post_urn])
+        return status
 
     def update_post(
         self,
@@ -93,18 +319,176 @@ class PostsMixin:
         Returns:
             HTTP status code.
         """
-        set_fields: dict[str, str] = {}
-        if commentary is not None:
-            set_fields["commentary"] = commentary
-        if content_call_to_action_label is not None:
-            set_fields["contentCallToActionLabel"] = content_call_to_action_label
-        if content_landing_page is not None:
-            set_fields["contentLandingPage"] = content_landing_page
-
         encoded = self._encode_urn(post_urn)
+        patch = _update_post_body(
+            commentary, content_call_to_action_label, content_landing_page
+        )
         resp = self._post(
-            f"/posts/{encoded}",
-            json={"patch": {"$set": set_fields}},
-            extra_headers={"X-RestLi-Method": "PARTIAL_UPDATE"},
+            f"/posts/{encoded}", json=patch, extra_headers=_PARTIAL_UPDATE_HEADERS
+        )
+        if self.post_index is not None:
+            fields = {**patch["patch"]["$set"], "lastModifiedAt": _now_ms()}
+            self.post_index.update(post_urn, fields)
+        return resp.status_code
+
+
+class AsyncPostsMixin:
+    """Async counterpart of :class:`PostsMixin`."""
+
+    async def create_post(
+        self,
+        commentary: str,
+        visibility: str = "PUBLIC",
+        content: dict[str, Any] | None = None,
+        is_reshare_disabled: bool = False,
+    ) -> dict[str, Any]:
+        """POST /rest/posts — Create a new LinkedIn post.
+
+        See :meth:`PostsMixin.create_post`.
+        """
+        body = _create_post_body(
+            self.person_urn, commentary, visibility, content, is_reshare_disabled
+        )
+        resp = await self._post("/posts", json=body)
+        post_urn = resp.headers.get("x-restli-id", "")
+        if self.post_index is not None and post_urn:
+            self.post_index.ingest([_created_post(post_urn, body)])
+        return {
+            "postUrn": post_urn,
+            "statusCode": resp.status_code,
+        }
+
+    async def get_my_posts(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        models: bool = False,
+        sort_by: str | None = None,
+    ) -> dict[str, Any] | PostPage:
+        """GET /rest/posts?q=author — Get the authenticated user's posts.
+
+        See :meth:`PostsMixin.get_my_posts`.
+        """
+        encoded_urn = self._encode_urn(self.person_urn)
+        page = await self._get(_my_posts_path(encoded_urn, limit, offset, sort_by))
+        if self.post_index is not None:
+            self.post_index.ingest(page.get("elements", []))
+        if models:
+            from .models import PostPage
+
+            return PostPage.from_api(page)
+        return page
+
+    async def iter_my_posts(
+        self,
+        page_size: int = MAX_POSTS_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        models: bool = False,
+        sort_by: str | None = None,
+    ) -> AsyncIterator[dict[str, Any] | Post]:
+        """Iterate over all of the authenticated user's posts, one at a time.
+
+        See :meth:`PostsMixin.iter_my_posts`; the prefetch runs as a task.
+        """
+        import asyncio
+
+        from .models import Post
+
+        task: asyncio.Task | None = None
+        try:
+            page = await self.get_my_posts(limit=page_size, offset=offset, sort_by=sort_by)
+            while True:
+                next_offset = _next_offset(page, offset, page_size)
+                task = None
+                if next_offset is not None and prefetch:
+                    task = asyncio.ensure_future(
+                        self.get_my_posts(limit=page_size, offset=next_offset, sort_by=sort_by)
+                    )
+                for post in page.get("elements", []):
+                    yield Post.from_api(post) if models else post
+                if next_offset is None:
+                    return
+                if task is None:
+                    page = await self.get_my_posts(
+                        limit=page_size, offset=next_offset, sort_by=sort_by
+                    )
+                else:
+                    page = await task
+                    task = None
+                offset = next_offset
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def get_posts(
+        self, post_urns: list[str], batch_size: int = MAX_POSTS_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """GET /rest/posts?ids=List(...) — See :meth:`PostsMixin.get_posts`.
+
+        Batches are requested concurrently.
+        """
+        import asyncio
+
+        paths = [
+            _batch_ids_path([self._encode_urn(urn) for urn in chunk])
+            for chunk in _batch_chunks(post_urns, batch_size)
+        ]
+        merged: dict[str, Any] = {"results": {}, "errors": {}}
+        for body in await asyncio.gather(*(self._get(path) for path in paths)):
+            _merge_batch_get(body, merged)
+        return merged
+
+    async def delete_posts(
+        self, post_urns: list[str], batch_size: int = MAX_POSTS_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """DELETE /rest/posts?ids=List(...) — See :meth:`PostsMixin.delete_posts`.
+
+        Batches are sent concurrently.
+        """
+        import asyncio
+
+        paths = [
+            _batch_ids_path([self._encode_urn(urn) for urn in chunk])
+            for chunk in _batch_chunks(post_urns, batch_size)
+        ]
+        merged: dict[str, Any] = {"results": {}, "errors": {}}
+        for body in await asyncio.gather(*(self._batch_delete(path) for path in paths)):
+            _merge_batch_delete(body, merged)
+        if self.post_index is not None:
+            self.post_index.remove(merged["results"])
+        return merged
+
+    async def delete_post(self, post_urn: str) -> int:
+        """DELETE /rest/posts/{postUrn} — Delete a post.
+
+        See :meth:`PostsMixin.delete_post`.
+        """
+        encoded = self._encode_urn(post_urn)
+        status = await self._delete(f"/posts/{encoded}")
+        if self.post_index is not None:
+            self.post_index.remove([post_urn])
+        return status
+
+    async def update_post(
+        self,
+        post_urn: str,
+        commentary: str | None = None,
+        content_call_to_action_label: str | None = None,
+        content_landing_page: str | None = None,
+    ) -> int:
+        """POST /rest/posts/{postUrn} — Partial update a post.
+
+        See :meth:`PostsMixin.update_post`.
+        """
+        encoded = self._encode_urn(post_urn)
+        patch = _update_post_body(
+            commentary, content_call_to_action_label, content_landing_page
+        )
+        resp = await self._post(
+            f"/posts/{encoded}", json=patch, extra_headers=_PARTIAL_UPDATE_HEADERS
         )
+        if self.post_index is not None:
+            fields = {**patch["patch"]["$set"], "lastModifiedAt": _now_ms()}
+            self.post_index.update(post_urn, fields)
         return resp.status_code
@@ -0,0 +1,155 @@
+"""Client-side rate limiting and 429 retry scheduling."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any
+
+
+def _endpoint_family(path: str) -> str:
+    """Return the endpoint family of a request path.
+
+    The family is the first path segment, e.g. ``/posts?author=...`` ->
+    ``posts``, ``/socialActions/urn%3A.../comments`` -> ``socialActions``.
+    """
+    segment = path.lstrip("/").split("/", 1)[0]
+    return segment.split("?", 1)[0]
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests/second with bursts of ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            import asyncio
+
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Per-endpoint-family token buckets plus the retry policy for HTTP 429.
+
+    Example::
+
+        limiter = RateLimiter(
+            {"posts": (1.0, 5), "socialActions": (2.0, 5), "reactions": (2.0, 5),
+             "images": (5.0, 10), "videos": (5.0, 10)},
+            default=(10.0, 10),
+        )
+        client = LinkedInClient(rate_limiter=limiter)
+
+    Args:
+        limits: Map of endpoint family (first path segment, e.g. ``posts``,
+            ``socialActions``, ``reactions``, ``images``, ``videos``) to a
+            ``(requests_per_second, burst)`` pair.
+        default: Limit for families not listed in ``limits`` (None = unlimited).
+        max_retries: How many times a 429 response is retried before it is raised.
+        backoff_base: Base delay in seconds for exponential backoff when the
+            response has no Retry-After header.
+        max_backoff: Upper bound for any single retry delay.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, int]] | None = None,
+        default: tuple[float, int] | None = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self._buckets = {
+            family: TokenBucket(rate, burst)
+            for family, (rate, burst) in (limits or {}).items()
+        }
+        self._default = default
+        self._default_lock = threading.Lock()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+
+    def bucket_for(self, path: str) -> TokenBucket | None:
+        """Return the bucket governing ``path``, or None if it is unlimited."""
+        family = _endpoint_family(path)
+        bucket = self._buckets.get(family)
+        if bucket is None and self._default is not None:
+            with self._default_lock:
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    bucket = self._buckets[family] = TokenBucket(*self._default)
+        return bucket
+
+    def acquire(self, path: str) -> None:
+        bucket = self.bucket_for(path)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, path: str) -> None:
+        bucket = self.bucket_for(path)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def should_retry(self, response: Any, attempt: int) -> bool:
+        """Whether a response should be retried (``attempt`` retries done so far)."""
+        return response.status_code == 429 and attempt < self.max_retries
+
+    def retry_delay(self, response: Any, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt + 1``.
+
+        Honors Retry-After (plus up to 10% jitter so throttled workers do not
+        retry in lockstep); otherwise uses exponential backoff with full jitter.
+        """
+        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, retry_after * 0.1)
+        else:
+            delay = random.uniform(0, self.backoff_base * 2**attempt)
+        return min(delay, self.max_backoff)
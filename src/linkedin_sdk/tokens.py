@@ -0,0 +1,212 @@
+"""Proactive OAuth access-token refresh."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Protocol
+
+# Refresh this many seconds before the access token expires.
+DEFAULT_REFRESH_MARGIN = 300.0
+
+# Wait before retrying a failed background refresh.
+_RETRY_AFTER_FAILURE = 30.0
+
+
+class _TokenHolder(Protocol):
+    def _set_access_token(self, access_token: str) -> None: ...
+
+
+class TokenManager:
+    """Keeps the access token of one or more clients fresh.
+
+    Tracks the token's expiry from ``expires_in`` and refreshes it with the
+    refresh token shortly before it runs out — on a background thread when
+    ``background`` is set, and otherwise (or additionally) right before a
+    request that would use a token inside the refresh margin. Concurrent
+    refreshes are single-flighted: one caller hits the OAuth endpoint and the
+    others wait for and reuse its result. Attached clients get the new
+    ``Authorization`` header swapped in as soon as a refresh completes.
+
+    Example::
+
+        tokens = LinkedInClient.exchange_code(code, client_id, secret, redirect_uri)
+        manager = TokenManager.from_token_response(tokens, client_id, secret)
+        client = LinkedInClient(person_id=person_id, token_manager=manager)
+
+    Args:
+        client_id: LinkedIn app client ID.
+        client_secret: LinkedIn app client secret.
+        refresh_token: Refresh token used to obtain new access tokens.
+        access_token: Current access token.
+        expires_at: Unix time the access token expires (``None`` if unknown;
+            the token is then only refreshed via :meth:`refresh`).
+        refresh_margin: Seconds before expiry at which to refresh.
+        background: Refresh on a daemon thread while clients are attached.
+        on_refresh: Called with every token response, e.g. to persist the
+            new tokens.
+        refresh: Callable ``(refresh_token, client_id, client_secret) ->
+            token response``; defaults to :meth:`LinkedInClient.refresh_token`.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        access_token: str | None = None,
+        expires_at: float | None = None,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        background: bool = True,
+        on_refresh: Callable[[dict[str, Any]], None] | None = None,
+        refresh: Callable[[str, str, str], dict[str, Any]] | None = None,
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.access_token = access_token
+        self.expires_at = expires_at
+        self.refresh_margin = refresh_margin
+        self.background = background
+        self.on_refresh = on_refresh
+        self._refresh_fn = refresh
+        self._lock = threading.Lock()
+        self._clients: list[_TokenHolder] = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.last_error: BaseException | None = None
+
+    @classmethod
+    def from_token_response(
+        cls,
+        response: dict[str, Any],
+        client_id: str,
+        client_secret: str,
+        **kwargs: Any,
+    ) -> TokenManager:
+        """Build a manager from an :meth:`exchange_code` / :meth:`refresh_token` result.
+
+        Raises:
+            ValueError: If the response carries no refresh token.
+        """
+        if not response.get("refresh_token"):
+            raise ValueError(
+                "Token response has no refresh_token; the app must have "
+                "programmatic refresh tokens enabled."
+            )
+        manager = cls(client_id, client_secret, response["refresh_token"], **kwargs)
+        manager._apply(response)
+        return manager
+
+    # ---- token state ------------------------------------------------------
+
+    def _apply(self, response: dict[str, Any]) -> None:
+        self.access_token = response["access_token"]
+        if response.get("refresh_token"):
+            self.refresh_token = response["refresh_token"]
+        expires_in = response.get("expires_in")
+        self.expires_at = time.time() + float(expires_in) if expires_in else None
+
+    def refresh_due(self) -> float | None:
+        """Unix time at which the token should be refreshed, if known."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - self.refresh_margin
+
+    def needs_refresh(self) -> bool:
+        due = self.refresh_due()
+        return due is not None and time.time() >= due
+
+    def refresh(self, force: bool = True) -> str:
+        """Refresh the access token and push it to attached clients.
+
+        Single-flighted: callers arriving while a refresh is running wait for
+        it and return its token instead of starting another one.
+
+        Args:
+            force: Refresh even if the token is not yet due. Ignored for
+                callers that waited on an in-flight refresh.
+
+        Returns:
+            The current access token.
+        """
+        seen = self.access_token
+        with self._lock:
+            if self.access_token != seen or not (force or self.needs_refresh()):
+                return self.access_token  # type: ignore[return-value]
+            refresh_fn = self._refresh_fn
+            if refresh_fn is None:
+                from .client import LinkedInClient
+
+                refresh_fn = LinkedInClient.refresh_token
+            response = refresh_fn(self.refresh_token, self.client_id, self.client_secret)
+            self._apply(response)
+            for client in self._clients:
+                client._set_access_token(self.access_token)  # type: ignore[arg-type]
+        if self.on_refresh is not None:
+            self.on_refresh(response)
+        self._wake.set()
+        return self.access_token  # type: ignore[return-value]
+
+    def ensure_fresh(self) -> None:
+        """Refresh first if the token is inside the refresh margin (cheap otherwise)."""
+        if self.needs_refresh():
+            self.refresh(force=False)
+
+    # ---- clients and background refresh -----------------------------------
+
+    def attach(self, client: _TokenHolder) -> None:
+        """Keep ``client``'s token in sync with this manager."""
+        with self._lock:
+            self._clients.append(client)
+        if self.background:
+            self.start()
+
+    def detach(self, client: _TokenHolder) -> None:
+        """Stop updating ``client``; the background thread stops with the last one."""
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            remaining = bool(self._clients)
+        if not remaining:
+            self.stop()
+
+    def start(self) -> None:
+        """Start the background refresh thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="linkedin-token-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            due = self.refresh_due()
+            if due is None:
+                self._wake.wait()
+                continue
+            delay = due - time.time()
+            if delay > 0:
+                self._wake.wait(delay)
+                continue
+            try:
+                self.refresh(force=False)
+                self.last_error = None
+            except Exception as exc:  # retried here; on-demand refreshes raise it
+                self.last_error = exc
+                self._stop.wait(_RETRY_AFTER_FAILURE)
@@ -0,0 +1,105 @@
+"""On-disk journal making multipart video uploads resumable."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+
+# Journals older than this are discarded: the pre-signed part URLs they hold
+# will have expired.
+DEFAULT_JOURNAL_MAX_AGE = 24 * 3600.0
+
+
+def _journal_key(owner: str, file_path: str) -> str:
+    """Identify an upload by owner and file identity (path, size, mtime)."""
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    raw = json.dumps([owner, path, st.st_size, st.st_mtime_ns])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class UploadJournal:
+    """Records the progress of multipart video uploads so they can resume.
+
+    For each upload the journal keeps the video URN, upload token, upload
+    instructions and the etag of every part as it completes. When the same
+    file is uploaded again by the same owner (unchanged size and mtime), the
+    upload resumes: finished parts are skipped and the video is finalized
+    without calling ``init_video_upload`` again. The entry is removed once
+    the video is finalized, or when LinkedIn rejects the journaled upload
+    (a 4xx response, e.g. expired part URLs) so the next attempt starts over.
+
+    Example::
+
+        client = LinkedInClient(upload_journal=UploadJournal("~/.cache/linkedin-uploads"))
+        client.create_post_with_video("Keynote", "keynote.mp4")  # fails midway
+        client.create_post_with_video("Keynote", "keynote.mp4")  # resumes
+
+    Args:
+        directory: Directory holding one JSON file per upload (created if missing).
+        max_age: Seconds after which an unfinished upload is restarted from
+            scratch rather than resumed.
+    """
+
+    def __init__(self, directory: str, max_age: float = DEFAULT_JOURNAL_MAX_AGE):
+        self.directory = os.path.expanduser(directory)
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _write(self, key: str, state: dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return a resumable upload's state, or ``None`` if absent or too old.
+
+        Returns:
+            {"videoUrn": "...", "uploadToken": "...", "uploadInstructions": [...],
+             "etags": {part_index: etag}, "created_at": ...}
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - state.get("created_at", 0) >= self.max_age:
+            self.discard(key)
+            return None
+        state["etags"] = {int(i): etag for i, etag in state.get("etags", {}).items()}
+        return state
+
+    def start(self, key: str, upload: dict[str, Any]) -> dict[str, Any]:
+        """Journal a freshly initialized upload (an ``init_video_upload`` result)."""
+        state = {
+            "videoUrn": upload["videoUrn"],
+            "uploadToken": upload["uploadToken"],
+            "uploadInstructions": upload["uploadInstructions"],
+            "etags": {},
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self._write(key, state)
+        return state
+
+    def record_part(self, key: str, state: dict[str, Any], index: int, etag: str) -> None:
+        """Persist a completed part (safe to call from concurrent part uploads)."""
+        with self._lock:
+            state["etags"][index] = etag
+            self._write(key, state)
+
+    def discard(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
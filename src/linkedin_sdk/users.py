@@ -15,3 +15,11 @@ class UsersMixin:
             {"sub": "...", "name": "...", "email": "...", "picture": "...", ...}
         """
         return self._get_v2("/userinfo")
+
+
+class AsyncUsersMixin:
+    """Async counterpart of :class:`UsersMixin`."""
+
+    async def get_user_info(self) -> dict[str, Any]:
+        """GET /v2/userinfo — See :meth:`UsersMixin.get_user_info`."""
+        return await self._get_v2("/userinfo")
@@ -0,0 +1,156 @@
+"""Unit tests for the async client (mock transport, no network needed)."""
+
+import asyncio
+import json
+
+import httpx
+
+from linkedin_sdk import AsyncLinkedInClient
+from linkedin_sdk.client import LINKEDIN_REST_BASE, LINKEDIN_V2_BASE
+
+
+def _mock_client(handler) -> AsyncLinkedInClient:
+    client = AsyncLinkedInClient(access_token="tok", person_id="abc")
+    transport = httpx.MockTransport(handler)
+    client._http = httpx.AsyncClient(
+        base_url=LINKEDIN_REST_BASE, headers=client._http.headers, transport=transport
+    )
+    client._http_v2 = httpx.AsyncClient(
+        base_url=LINKEDIN_V2_BASE, headers=client._http_v2.headers, transport=transport
+    )
+    return client
+
+
+def test_create_post_payload_matches_sync():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["path"] = request.url.path
+        seen["body"] = json.loads(request.content)
+        seen["auth"] = request.headers["Authorization"]
+        return httpx.Response(201, headers={"x-restli-id": "urn:li:share:1"})
+
+    async def run():
+        async with _mock_client(handler) as client:
+            return await client.create_post("hello", visibility="CONNECTIONS")
+
+    result = asyncio.run(run())
+    assert result == {"postUrn": "urn:li:share:1", "statusCode": 201}
+    assert seen["path"] == "/rest/posts"
+    assert seen["auth"] == "Bearer tok"
+    assert seen["body"]["author"] == "urn:li:person:abc"
+    assert seen["body"]["visibility"] == "CONNECTIONS"
+    assert seen["body"]["lifecycleState"] == "PUBLISHED"
+
+
+def test_get_user_info_uses_v2():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v2/userinfo"
+        return httpx.Response(200, json={"sub": "abc"})
+
+    async def run():
+        async with _mock_client(handler) as client:
+            return await client.get_user_info()
+
+    assert asyncio.run(run()) == {"sub": "abc"}
+
+
+def test_concurrent_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(204)
+
+    async def run():
+        async with _mock_client(handler) as client:
+            return await asyncio.gather(
+                *(client.delete_post(f"urn:li:share:{i}") for i in range(10))
+            )
+
+    assert asyncio.run(run()) == [204] * 10
+
+
+def test_get_auth_url_is_sync():
+    url = AsyncLinkedInClient.get_auth_url(
+        client_id="id", redirect_uri="http://localhost/cb"
+    )
+    assert "client_id=id" in url
+
+
+
+class _TokenServer:
+    """Local HTTP/1.1 keep-alive server answering token requests; tracks open sockets."""
+
+    def __init__(self):
+        import http.server
+        import threading
+
+        server = self
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.open = 0
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.opened += 1
+                    server.open += 1
+
+            def finish(self):
+                super().finish()
+                with server.lock:
+                    server.open -= 1
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = json.dumps({"access_token": "new", "expires_in": 60}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def wait_closed(self, timeout=2.0):
+        import time
+
+        deadline = time.monotonic() + timeout
+        while self.open and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.open
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_oauth_connections_are_reused_per_client_and_closed(monkeypatch):
+    from linkedin_sdk import async_client
+
+    server = _TokenServer()
+    monkeypatch.setattr(async_client, "LINKEDIN_OAUTH_HOST", server.url)
+    try:
+        async def through_instance():
+            async with AsyncLinkedInClient(access_token="tok", person_id="abc") as client:
+                for _ in range(3):
+                    tokens = await client.refresh_token("rt", "id", "secret")
+                    assert tokens["access_token"] == "new"
+
+        asyncio.run(through_instance())
+        assert server.opened == 1
+        assert server.wait_closed() == 0
+
+        for _ in range(3):
+            asyncio.run(AsyncLinkedInClient.refresh_token("rt", "id", "secret"))
+        assert server.opened == 4
+        assert server.wait_closed() == 0
+    finally:
+        server.stop()
@@ -0,0 +1,109 @@
+"""Unit tests for bulk comments and reactions (no network needed)."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient, RateLimiter
+
+
+def _handler(calls, fail_post=None, delay=0.0):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def handler(request):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        body = request.content.decode()
+        calls.append((request.url.path, body))
+        if fail_post and fail_post in str(request.url):
+            return httpx.Response(403, json={"message": "forbidden"})
+        return httpx.Response(201, headers={"x-restli-id": f"urn:li:comment:{len(calls)}"})
+
+    return handler, state
+
+
+def test_add_comments_concurrent_with_per_item_results():
+    calls = []
+    handler, state = _handler(calls, fail_post="bad", delay=0.02)
+    client = LinkedInClient(access_token="tok", person_id="abc", transport=httpx.MockTransport(handler))
+
+    items = [(f"urn:li:share:{i}", "Congrats!") for i in range(6)] + [("urn:li:share:bad", "Hi")]
+    results = client.add_comments(items, concurrency=4)
+
+    assert [r.index for r in results] == list(range(7))
+    assert all(r.ok for r in results[:6])
+    assert results[0].result["statusCode"] == 201
+    assert not results[6].ok
+    assert isinstance(results[6].error, httpx.HTTPStatusError)
+    assert len(calls) == 7
+    assert 1 < state["peak"] <= 4
+
+
+def test_duplicate_items_are_sent_once():
+    calls = []
+    handler, _ = _handler(calls)
+    client = LinkedInClient(access_token="tok", person_id="abc", transport=httpx.MockTransport(handler))
+
+    comments = client.add_comments(
+        [("urn:li:share:1", "Nice"), ("urn:li:share:1", "Nice"), ("urn:li:share:1", "Great")]
+    )
+    assert len(calls) == 2
+    assert comments[1].duplicate_of == 0
+    assert comments[1].result is comments[0].result
+    assert comments[2].duplicate_of is None
+
+    calls.clear()
+    reactions = client.add_reactions(
+        [("urn:li:share:1", "LIKE"), ("urn:li:share:2", "PRAISE"), ("urn:li:share:1", "EMPATHY")]
+    )
+    assert len(calls) == 2
+    assert '"LIKE"' in calls[0][1] or '"LIKE"' in calls[1][1]
+    assert not any('"EMPATHY"' in body for _, body in calls)
+    assert [r.duplicate_of for r in reactions] == [None, None, 0]
+    assert [r.result for r in reactions] == [201, 201, 201]
+
+
+def test_bulk_calls_go_through_rate_limiter():
+    calls = []
+    handler, _ = _handler(calls)
+    limiter = RateLimiter(default=(50.0, 1))
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", rate_limiter=limiter,
+        transport=httpx.MockTransport(handler),
+    )
+    start = time.monotonic()
+    results = client.add_reactions([(f"urn:li:share:{i}", "LIKE") for i in range(6)])
+    assert all(r.ok for r in results)
+    assert time.monotonic() - start >= 5 / 50.0 * 0.9
+
+
+def test_async_add_reactions():
+    calls = []
+
+    def handler(request):
+        calls.append(request.content.decode())
+        if "bad" in request.content.decode():
+            return httpx.Response(422, json={"message": "invalid"})
+        return httpx.Response(201)
+
+    async def run():
+        client = AsyncLinkedInClient(
+            access_token="tok", person_id="abc", transport=httpx.MockTransport(handler)
+        )
+        return await client.add_reactions(
+            [("urn:li:share:1", "LIKE"), ("urn:li:share:bad", "LIKE"), ("urn:li:share:1", "LIKE")],
+            concurrency=2,
+        )
+
+    results = asyncio.run(run())
+    assert len(calls) == 2
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[2].duplicate_of == 0
+    assert results[0].result == 201
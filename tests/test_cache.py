@@ -0,0 +1,109 @@
+"""Unit tests for the response cache (mock transport, no network needed)."""
+
+import httpx
+import pytest
+
+from linkedin_sdk import DiskCache, LinkedInClient, MemoryCache, ResponseCache
+from linkedin_sdk.cache import CacheEntry
+
+
+def _mock_client(handler, cache) -> LinkedInClient:
+    client = LinkedInClient(access_token="tok", person_id="abc", cache=cache)
+    transport = httpx.MockTransport(handler)
+    client._http = httpx.Client(base_url="https://api.linkedin.com/rest", transport=transport)
+    client._http_v2 = httpx.Client(base_url="https://api.linkedin.com/v2", transport=transport)
+    return client
+
+
+def test_fresh_entry_served_locally():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"sub": "abc"})
+
+    client = _mock_client(handler, MemoryCache(ttl=60))
+    first = client.get_user_info()
+    first["sub"] = "mutated"
+    assert client.get_user_info() == {"sub": "abc"}
+    assert len(calls) == 1
+
+
+def test_stale_entry_revalidated_with_etag():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"sub": "abc"}, headers={"ETag": '"v1"'})
+
+    client = _mock_client(handler, MemoryCache(ttl=0))
+    assert client.get_user_info() == {"sub": "abc"}
+    assert client.get_user_info() == {"sub": "abc"}
+    assert len(calls) == 2
+    assert "If-None-Match" not in calls[0].headers
+    assert calls[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_post_writes_invalidate_post_reads():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "GET":
+            return httpx.Response(200, json={"elements": [], "paging": {}})
+        return httpx.Response(201, headers={"x-restli-id": "urn:li:share:1"})
+
+    client = _mock_client(handler, MemoryCache(ttl=60))
+    client.get_my_posts()
+    client.get_my_posts()
+    client.create_post("hello")
+    client.get_my_posts()
+    assert calls == ["GET", "POST", "GET"]
+
+
+def test_cache_key_includes_token():
+    def handler(request):
+        return httpx.Response(200, json={"auth": request.headers.get("Authorization")})
+
+    cache = MemoryCache(ttl=60)
+    a = _mock_client(handler, cache)
+    b = _mock_client(handler, cache)
+    b.access_token = "other"
+    a.get_user_info()
+    b.get_user_info()
+    assert len(cache._entries) == 2
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(maxsize=2)
+    for key in ("posts-a", "posts-b", "posts-c"):
+        cache.set(key, CacheEntry(b"{}", "", 0, "posts"))
+    assert cache.get("posts-a") is None
+    assert cache.get("posts-c") is not None
+
+
+def test_disk_cache_roundtrip_and_invalidate(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=60)
+    cache.set("posts-1", CacheEntry(b'{"a": 1}', '"e"', 123.0, "posts"))
+    cache.set("userinfo-1", CacheEntry(b"{}", "", 123.0, "userinfo"))
+    assert cache.get("posts-1") == CacheEntry(b'{"a": 1}', '"e"', 123.0, "posts")
+    cache.invalidate("posts")
+    assert cache.get("posts-1") is None
+    assert cache.get("userinfo-1") is not None
+
+
+def test_incomplete_cache_subclass_fails_at_construction():
+    class NoClear(ResponseCache):
+        def get(self, key):
+            return None
+
+        def set(self, key, entry):
+            pass
+
+        def invalidate(self, tag):
+            pass
+
+    with pytest.raises(TypeError, match="clear"):
+        NoClear()
@@ -0,0 +1,82 @@
+"""Unit tests for the low-level client helpers (mock transport, no network needed)."""
+
+import httpx
+
+from linkedin_sdk import LinkedInClient
+
+
+def test_put_binary_reuses_pooled_upload_client():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(201, headers={"etag": "e1"})
+
+    client = LinkedInClient(access_token="tok", person_id="abc", upload_pool_size=2)
+    client._http_upload = httpx.Client(transport=httpx.MockTransport(handler))
+
+    for _ in range(3):
+        result = client.upload_binary("https://upload.example/x", b"data", "image/png")
+        assert result == {"statusCode": 201, "etag": "e1"}
+
+    assert len(calls) == 3
+    assert calls[0].headers["Content-Type"] == "image/png"
+    assert calls[0].headers["Authorization"] == "Bearer tok"
+
+    client.close()
+    assert client._http_upload.is_closed
+
+
+def test_http_clients_are_created_on_first_use():
+    client = LinkedInClient(access_token="tok", person_id="abc", load_env=False)
+    assert "_http" not in vars(client)
+    assert client.get_auth_url("id", "https://localhost/cb").startswith("https://")
+    assert "_http" not in vars(client)
+
+    http = client._http
+    assert client._http is http
+    assert http.headers["Authorization"] == "Bearer tok"
+    assert "_http_upload" not in vars(client)
+
+    client.close()
+    assert http.is_closed
+    assert "_http_v2" not in vars(client)
+
+
+def test_load_env_false_skips_dotenv(monkeypatch):
+    from linkedin_sdk import client as client_module
+
+    monkeypatch.setattr(client_module, "_dotenv_loaded", False)
+    monkeypatch.delenv("LINKEDIN_ACCESS_TOKEN", raising=False)
+    LinkedInClient(person_id="abc", load_env=False)
+    assert client_module._dotenv_loaded is False
+
+
+def test_rest_and_v2_clients_share_one_connection_pool():
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", api_pool_size=3, http2=False, load_env=False
+    )
+    transport = client._api_transport
+    assert isinstance(transport, httpx.HTTPTransport)
+    assert client._http._transport is transport
+    assert client._http_v2._transport is transport
+    assert client._http.headers["LinkedIn-Version"]
+    assert "LinkedIn-Version" not in client._http_v2.headers
+    assert transport._pool._max_connections == 3
+    client.close()
+
+
+def test_custom_transport_is_shared_by_api_clients():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers.get("LinkedIn-Version")))
+        return httpx.Response(200, json={})
+
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", transport=httpx.MockTransport(handler)
+    )
+    client._get("/posts")
+    client._get_v2("/userinfo")
+    assert seen == [("/rest/posts", "202510"), ("/v2/userinfo", None)]
+    client.close()
@@ -0,0 +1,76 @@
+"""Unit tests for LinkedInClientPool (mock transport, no network needed)."""
+
+import threading
+
+import httpx
+import pytest
+
+from linkedin_sdk import LinkedInClientPool
+
+
+def _recording_transport(seen):
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            seen.append(request.headers["Authorization"])
+        return httpx.Response(201, headers={"x-restli-id": "urn:li:share:1"})
+
+    return httpx.MockTransport(handler)
+
+
+def test_accounts_share_transport_with_their_own_tokens():
+    seen = []
+    with LinkedInClientPool(transport=_recording_transport(seen)) as pool:
+        pool.add_account("a", "tok-a")
+        pool.add_account("b", "tok-b")
+        assert pool.accounts == ["a", "b"]
+
+        result = pool.for_account("b").create_post("hi")
+        assert result["postUrn"] == "urn:li:share:1"
+        assert seen == ["Bearer tok-b"]
+
+        a, b = pool.for_account("a"), pool.for_account("b")
+        assert a._http._transport is b._http._transport
+        assert a.person_urn == "urn:li:person:a"
+
+
+def test_per_account_rate_limiters():
+    with LinkedInClientPool(
+        default_rate_limit=(1.0, 1), transport=_recording_transport([])
+    ) as pool:
+        a = pool.add_account("a", "tok-a")
+        b = pool.add_account("b", "tok-b")
+        assert a.rate_limiter is not None
+        assert a.rate_limiter is not b.rate_limiter
+
+
+def test_map_runs_accounts_concurrently_and_reports_errors():
+    seen = []
+    with LinkedInClientPool(max_workers=4, transport=_recording_transport(seen)) as pool:
+        for person_id in "abcd":
+            pool.add_account(person_id, f"tok-{person_id}")
+
+        def task(client):
+            if client.person_id == "c":
+                raise RuntimeError("boom")
+            return client.create_post("hello")["postUrn"]
+
+        results = {item.person_id: item for item in pool.map(task)}
+        assert sorted(results) == ["a", "b", "c", "d"]
+        assert not results["c"].ok
+        assert isinstance(results["c"].error, RuntimeError)
+        assert results["a"].result == "urn:li:share:1"
+        assert sorted(seen) == ["Bearer tok-a", "Bearer tok-b", "Bearer tok-d"]
+
+
+def test_closing_one_account_keeps_pool_usable():
+    seen = []
+    with LinkedInClientPool(transport=_recording_transport(seen)) as pool:
+        pool.add_account("a", "tok-a")
+        pool.add_account("b", "tok-b")
+        pool.remove_account("a")
+        pool.for_account("b").create_post("still works")
+        assert seen == ["Bearer tok-b"]
+        with pytest.raises(KeyError):
+            pool.for_account("a")
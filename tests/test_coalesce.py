@@ -0,0 +1,137 @@
+"""Unit tests for single-flight GET coalescing (mock transport, no network needed)."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient
+
+
+def _slow_handler(calls, delay=0.05, status=200):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        time.sleep(delay)
+        return httpx.Response(status, json={"sub": "abc", "n": len(calls)})
+
+    return handler
+
+
+def _run_threads(target, n):
+    results = [None] * n
+    errors = [None] * n
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as exc:
+            errors[i] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def test_identical_concurrent_gets_share_one_request():
+    calls = []
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", transport=httpx.MockTransport(_slow_handler(calls))
+    )
+    results, errors = _run_threads(client.get_user_info, 8)
+    assert errors == [None] * 8
+    assert len(calls) == 1
+    assert all(r == {"sub": "abc", "n": 1} for r in results)
+    # Each caller gets its own decoded object.
+    assert len({id(r) for r in results}) == 8
+
+    client.get_user_info()
+    assert len(calls) == 2
+    client.close()
+
+
+def test_different_targets_are_not_coalesced():
+    calls = []
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", transport=httpx.MockTransport(_slow_handler(calls))
+    )
+    _run_threads(lambda: client._get("/posts", {"q": "author"}), 3)
+    _run_threads(lambda: client._get("/posts", {"q": "other"}), 1)
+    assert len(calls) == 2
+    client.close()
+
+
+def test_errors_are_shared_with_waiters():
+    calls = []
+    client = LinkedInClient(
+        access_token="tok",
+        person_id="abc",
+        transport=httpx.MockTransport(_slow_handler(calls, status=500)),
+    )
+    _, errors = _run_threads(client.get_user_info, 4)
+    assert len(calls) == 1
+    assert all(isinstance(e, httpx.HTTPStatusError) for e in errors)
+    client.close()
+
+
+def test_coalesce_false_sends_every_request():
+    calls = []
+    client = LinkedInClient(
+        access_token="tok",
+        person_id="abc",
+        transport=httpx.MockTransport(_slow_handler(calls, delay=0.01)),
+        coalesce=False,
+    )
+    _run_threads(client.get_user_info, 4)
+    assert len(calls) == 4
+    client.close()
+
+
+def _async_client(calls, gate):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await gate.wait()
+        return httpx.Response(200, json={"sub": "abc"})
+
+    return AsyncLinkedInClient(
+        access_token="tok", person_id="abc", transport=httpx.MockTransport(handler)
+    )
+
+
+def test_async_identical_gets_share_one_request():
+    async def main():
+        calls = []
+        gate = asyncio.Event()
+        async with _async_client(calls, gate) as client:
+            tasks = [asyncio.ensure_future(client.get_user_info()) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            gate.set()
+            results = await asyncio.gather(*tasks)
+        assert len(calls) == 1
+        assert results == [{"sub": "abc"}] * 5
+
+    asyncio.run(main())
+
+
+def test_async_leader_cancellation_lets_waiters_fetch():
+    async def main():
+        calls = []
+        gate = asyncio.Event()
+        async with _async_client(calls, gate) as client:
+            leader = asyncio.ensure_future(client.get_user_info())
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(client.get_user_info())
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            gate.set()
+            assert await follower == {"sub": "abc"}
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+        assert len(calls) == 2
+
+    asyncio.run(main())
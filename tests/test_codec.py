@@ -0,0 +1,88 @@
+"""Unit tests for the pluggable JSON codec (no network needed)."""
+
+import json
+
+import httpx
+import pytest
+
+from linkedin_sdk import JSONCodec, LinkedInClient, get_json_codec, set_json_codec
+from linkedin_sdk.codec import _decode_body
+
+
+@pytest.fixture(autouse=True)
+def _restore_codec():
+    yield
+    set_json_codec(None)
+
+
+def test_default_codec_prefers_installed_fast_backend():
+    set_json_codec(None)
+    expected = "json"
+    for name in ("msgspec", "orjson"):
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        expected = name
+    assert get_json_codec().name == expected
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_round_trip_bytes(name):
+    pytest.importorskip(name)
+    set_json_codec(name)
+    codec = get_json_codec()
+    obj = {"commentary": "héllo ✓", "n": [1, 2.5, None, True]}
+    data = codec.dumps(obj)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == obj
+    assert codec.loads(data) == obj
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError):
+        set_json_codec("yaml")
+
+
+def test_decode_body_empty_and_whitespace():
+    assert _decode_body(b"") == {}
+    assert _decode_body(b" \r\n") == {}
+    assert _decode_body(b'{"a": 1}') == {"a": 1}
+
+
+def test_custom_codec_encodes_requests_and_decodes_responses():
+    calls = []
+
+    class RecordingCodec(JSONCodec):
+        name = "recording"
+
+        def dumps(self, obj):
+            calls.append("dumps")
+            return super().dumps(obj)
+
+        def loads(self, data):
+            calls.append("loads")
+            return super().loads(data)
+
+    set_json_codec(RecordingCodec())
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.method == "POST":
+            return httpx.Response(
+                200, json={"value": {"uploadUrl": "https://u", "image": "urn:li:image:1"}}
+            )
+        return httpx.Response(200, json={"elements": [], "paging": {}})
+
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", transport=httpx.MockTransport(handler)
+    )
+    assert client.init_image_upload()["imageUrn"] == "urn:li:image:1"
+    assert client.get_my_posts() == {"elements": [], "paging": {}}
+    assert calls == ["dumps", "loads", "loads"]
+    assert json.loads(seen[0].content)["initializeUploadRequest"]["owner"] == (
+        "urn:li:person:abc"
+    )
+    assert seen[0].headers["Content-Type"] == "application/json"
+    client.close()
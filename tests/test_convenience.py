@@ -47,3 +47,66 @@ def test_read_file_success():
             assert data == b"test content"
         finally:
             os.unlink(f.name)
+
+
+def test_check_file_returns_size():
+    from linkedin_sdk.convenience import ConvenienceMixin
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+        f.write(b"x" * 1234)
+    try:
+        assert ConvenienceMixin._check_file(f.name) == 1234
+    finally:
+        os.unlink(f.name)
+    with pytest.raises(FileNotFoundError):
+        ConvenienceMixin._check_file("/nonexistent/video.mp4")
+
+
+def test_multi_images_preserve_order(tmp_path):
+    import itertools
+    import threading
+    import time
+
+    from linkedin_sdk import LinkedInClient
+
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"img{i}.png"
+        p.write_bytes(b"png")
+        paths.append(str(p))
+
+    counter = itertools.count()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class FakeClient(LinkedInClient):
+        def init_image_upload(self):
+            n = next(counter)
+            return {"uploadUrl": f"https://upload.example/{n}", "imageUrn": f"urn:li:image:{n}"}
+
+        def upload_file(self, upload_url, file_path, content_type):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02 if file_path.endswith("img0.png") else 0.005)
+            with lock:
+                active -= 1
+            self.uploaded[upload_url.replace("https://upload.example/", "urn:li:image:")] = file_path
+            return {"statusCode": 201, "etag": ""}
+
+        def create_post(self, commentary, visibility="PUBLIC", content=None, is_reshare_disabled=False):
+            self.content = content
+            return {"postUrn": "urn:li:share:1", "statusCode": 201}
+
+    client = FakeClient(access_token="tok", person_id="abc")
+    client.uploaded = {}
+    result = client.create_post_with_multi_images(
+        "carousel", paths, alt_texts=["first"], concurrency=3
+    )
+
+    assert [client.uploaded[urn] for urn in result["imageUrns"]] == paths
+    images = client.content["multiImage"]["images"]
+    assert [img["id"] for img in images] == result["imageUrns"]
+    assert images[0]["altText"] == "first"
+    assert 1 < peak <= 3
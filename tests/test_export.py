@@ -0,0 +1,125 @@
+"""Unit tests for PostExporter (no network needed)."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from linkedin_sdk import LinkedInClient, PostExporter
+
+
+class FakeFeed:
+    """Post listing honoring ``sortBy``, newest first; records the pages requested.
+
+    Like the API, it orders by last modification unless ``sortBy=CREATED``.
+    """
+
+    def __init__(self, total):
+        self.posts = []
+        self.clock = 1_000
+        self.requests = []
+        self.fail_at = None
+        self.publish(total)
+
+    def publish(self, n=1):
+        for _ in range(n):
+            self.clock += 1
+            self.posts.append(
+                {
+                    "id": f"urn:li:share:{len(self.posts)}",
+                    "commentary": f"post {len(self.posts)}",
+                    "createdAt": self.clock,
+                    "lastModifiedAt": self.clock,
+                }
+            )
+
+    def edit(self, n):
+        self.clock += 1
+        self.posts[n]["lastModifiedAt"] = self.clock
+
+    def handler(self, request):
+        start = int(request.url.params["start"])
+        count = int(request.url.params["count"])
+        self.requests.append(start)
+        if self.fail_at is not None and start >= self.fail_at:
+            return httpx.Response(500, json={"message": "boom"})
+        field = "createdAt" if request.url.params.get("sortBy") == "CREATED" else "lastModifiedAt"
+        ordered = sorted(self.posts, key=lambda post: post[field], reverse=True)
+        return httpx.Response(
+            200,
+            json={
+                "elements": ordered[start:start + count],
+                "paging": {"start": start, "count": count, "total": len(self.posts)},
+            },
+        )
+
+
+def _client(feed):
+    return LinkedInClient(
+        access_token="tok", person_id="abc", transport=httpx.MockTransport(feed.handler), coalesce=False
+    )
+
+
+def _read(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line)["id"] for line in f]
+
+
+@pytest.mark.parametrize("name", ["posts.ndjson", "posts.ndjson.gz"])
+def test_incremental_export_stops_at_checkpoint(tmp_path, name):
+    feed = FakeFeed(total=25)
+    path = str(tmp_path / name)
+    exporter = PostExporter(_client(feed), path, page_size=10)
+
+    assert exporter.run() == 25
+    assert _read(path) == [f"urn:li:share:{n}" for n in range(24, -1, -1)]
+    assert exporter.load_checkpoint()["newestId"] == "urn:li:share:24"
+
+    feed.requests.clear()
+    assert exporter.run() == 0
+    assert feed.requests == [0]
+
+    feed.publish(3)
+    feed.requests.clear()
+    assert exporter.run() == 3
+    assert feed.requests == [0]
+    assert _read(path)[-3:] == ["urn:li:share:27", "urn:li:share:26", "urn:li:share:25"]
+    assert len(_read(path)) == 28
+    assert exporter.load_checkpoint()["newestId"] == "urn:li:share:27"
+
+
+def test_failed_run_leaves_export_and_checkpoint_untouched(tmp_path):
+    feed = FakeFeed(total=5)
+    path = str(tmp_path / "posts.ndjson")
+    exporter = PostExporter(_client(feed), path, page_size=10)
+    exporter.run()
+
+    feed.publish(15)
+    feed.fail_at = 10
+    with pytest.raises(httpx.HTTPStatusError):
+        exporter.run()
+    assert len(_read(path)) == 5
+    assert exporter.load_checkpoint()["newestId"] == "urn:li:share:4"
+    assert [p for p in tmp_path.iterdir() if p.suffix == ".part"] == []
+
+    feed.fail_at = None
+    assert exporter.run() == 15
+    assert len(_read(path)) == 20
+
+
+def test_edited_old_post_does_not_hide_new_posts(tmp_path):
+    feed = FakeFeed(total=15)
+    path = str(tmp_path / "posts.ndjson")
+    exporter = PostExporter(_client(feed), path, page_size=10)
+    exporter.run()
+
+    feed.publish()
+    feed.edit(3)
+    assert exporter.run() == 1
+    assert _read(path)[-1] == "urn:li:share:15"
+
+    feed.publish()
+    assert exporter.run() == 1
+    assert len(_read(path)) == 17
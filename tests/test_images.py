@@ -0,0 +1,157 @@
+"""Unit tests for image pre-processing (no network needed)."""
+
+import itertools
+import os
+
+import pytest
+
+from linkedin_sdk import LinkedInClient
+
+
+class RecordingProcessor:
+    """Stand-in for ImageProcessor that 'shrinks' by writing a tiny copy."""
+
+    def __init__(self, cache_tag="max2048-q85"):
+        self.batches = []
+        self.cache_tag = cache_tag
+
+    def process_many(self, image_paths, out_dir):
+        self.batches.append(list(image_paths))
+        out = []
+        for i, path in enumerate(image_paths):
+            target = os.path.join(out_dir, f"{i}-small.jpg")
+            with open(target, "wb") as f:
+                f.write(b"small")
+            out.append(target)
+        return out
+
+
+def _client(processor, media_cache=None):
+    counter = itertools.count(1)
+    uploaded = []
+
+    class FakeClient(LinkedInClient):
+        def init_image_upload(self):
+            n = next(counter)
+            return {"uploadUrl": f"https://upload.example/{n}", "imageUrn": f"urn:li:image:{n}"}
+
+        def upload_file(self, upload_url, file_path, content_type):
+            with open(file_path, "rb") as f:
+                uploaded.append((file_path, f.read(), content_type))
+            return {"statusCode": 201, "etag": ""}
+
+        def create_post(self, commentary, visibility="PUBLIC", content=None):
+            return {"postUrn": "urn:li:share:1", "statusCode": 201}
+
+    client = FakeClient(
+        access_token="tok", person_id="abc", image_processor=processor, media_cache=media_cache
+    )
+    return client, uploaded
+
+
+def test_multi_image_post_uploads_processed_copies_in_one_batch(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"img{i}.png"
+        path.write_bytes(b"big" * 1000)
+        paths.append(str(path))
+
+    processor = RecordingProcessor()
+    client, uploaded = _client(processor)
+    result = client.create_post_with_multi_images("hi", paths)
+
+    assert processor.batches == [paths]
+    assert sorted(result["imageUrns"]) == ["urn:li:image:1", "urn:li:image:2", "urn:li:image:3"]
+    assert [body for _, body, _ in uploaded] == [b"small"] * 3
+    assert all(ctype == "image/jpeg" for _, _, ctype in uploaded)
+    # Processed copies are temporary.
+    assert not any(os.path.exists(p) for p, _, _ in uploaded)
+
+
+def test_media_cache_is_checked_before_processing(tmp_path):
+    from linkedin_sdk import MediaCache
+
+    paths = []
+    for name in ("a.png", "b.png"):
+        path = tmp_path / name
+        path.write_bytes(name.encode() * 100)
+        paths.append(str(path))
+
+    cache = MediaCache(":memory:")
+    processor = RecordingProcessor()
+    client, uploaded = _client(processor, cache)
+    first = client._upload_images(paths)
+    assert client._upload_image(paths[1]) == first[1]
+    assert client._upload_images(paths) == first
+    assert processor.batches == [paths]
+    assert len(uploaded) == 2
+
+    # Other processing settings produce different bytes: process and upload again.
+    smaller = RecordingProcessor(cache_tag="max1024-q85")
+    client, uploaded = _client(smaller, cache)
+    client._upload_image(paths[0])
+    assert smaller.batches == [[paths[0]]]
+
+
+def test_without_processor_original_file_is_uploaded(tmp_path):
+    path = tmp_path / "img.png"
+    path.write_bytes(b"original")
+    client, uploaded = _client(None)
+    client.create_post_with_image("hi", str(path))
+    assert uploaded == [(str(path), b"original", "image/png")]
+
+
+def test_preprocess_downsizes_and_strips_metadata(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from linkedin_sdk import ImageProcessor
+
+    src = tmp_path / "photo.png"
+    image = Image.effect_noise((3000, 1500), 64).convert("RGB")
+    exif = Image.Exif()
+    exif[0x010F] = "Camera Maker"
+    image.save(src, "PNG", exif=exif)
+
+    out = ImageProcessor(max_dimension=1200).process(str(src), str(tmp_path))
+    assert out.endswith(".jpg")
+    assert os.path.getsize(out) < os.path.getsize(src)
+    with Image.open(out) as processed:
+        assert processed.size == (1200, 600)
+        assert not processed.getexif()
+
+
+def test_preprocess_keeps_transparency_and_skips_non_images(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from linkedin_sdk import ImageProcessor
+
+    src = tmp_path / "logo.png"
+    Image.new("RGBA", (4000, 4000), (255, 0, 0, 128)).save(src)
+    text = tmp_path / "notes.png"
+    text.write_bytes(b"not an image")
+
+    processor = ImageProcessor(max_dimension=1000, processes=2)
+    out_logo, out_text = processor.process_many([str(src), str(text)], str(tmp_path))
+    assert out_logo.endswith(".png")
+    with Image.open(out_logo) as processed:
+        assert processed.mode == "RGBA"
+        assert processed.size == (1000, 1000)
+    assert out_text == str(text)
+
+
+def test_process_many_reuses_one_bounded_non_fork_pool(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from linkedin_sdk import ImageProcessor
+
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"photo{i}.jpg"
+        Image.new("RGB", (3000, 1500), (0, 90, 200)).save(path, quality=95)
+        paths.append(str(path))
+
+    with ImageProcessor(max_dimension=500, processes=2) as processor:
+        processor.process_many(paths, str(tmp_path))
+        pool = processor._executor
+        processor.process_many(paths, str(tmp_path))
+        assert processor._executor is pool
+        assert pool._max_workers == 2
+        assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+    assert processor._executor is None
@@ -16,3 +16,101 @@ def test_init_image_upload(client: LinkedInClient):
     assert "imageUrn" in result
     assert result["uploadUrl"].startswith("https://")
     assert "urn:li:image:" in result["imageUrn"]
+
+
+def test_iter_file_chunks_range(tmp_path):
+    """Chunked reads cover exactly the requested byte range."""
+    from linkedin_sdk.media import _iter_file_chunks
+
+    path = tmp_path / "blob.bin"
+    path.write_bytes(bytes(range(256)) * 40)
+
+    chunks = list(_iter_file_chunks(str(path), offset=100, length=5000, chunk_size=1024))
+    assert [len(c) for c in chunks] == [1024, 1024, 1024, 1024, 904]
+    assert b"".join(chunks) == path.read_bytes()[100:5100]
+    assert b"".join(_iter_file_chunks(str(path))) == path.read_bytes()
+
+
+def test_aiter_file_chunks_reads_off_the_event_loop(tmp_path, monkeypatch):
+    """Async chunked reads match the sync ones and never read on the loop thread."""
+    import asyncio
+    import threading
+
+    from linkedin_sdk import media
+
+    path = tmp_path / "blob.bin"
+    path.write_bytes(bytes(range(256)) * 40)
+    read_threads = set()
+    real_open = open
+
+    class TrackingFile:
+        def __init__(self, f):
+            self.f = f
+
+        def read(self, n):
+            read_threads.add(threading.get_ident())
+            return self.f.read(n)
+
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+
+    monkeypatch.setattr(media, "open", lambda *a: TrackingFile(real_open(*a)), raising=False)
+
+    async def collect():
+        loop_thread = threading.get_ident()
+        chunks = [c async for c in media._aiter_file_chunks(str(path), 100, 5000, 1024)]
+        return loop_thread, chunks
+
+    loop_thread, chunks = asyncio.run(collect())
+    assert [len(c) for c in chunks] == [1024, 1024, 1024, 1024, 904]
+    assert b"".join(chunks) == path.read_bytes()[100:5100]
+    assert read_threads and loop_thread not in read_threads
+
+
+def test_upload_video_parts_in_order(tmp_path):
+    """Every instruction's byte range is uploaded and etags keep instruction order."""
+    import threading
+    import time
+
+    import httpx
+
+    path = tmp_path / "video.mp4"
+    payload = bytes(range(256)) * 100
+    path.write_bytes(payload)
+    part_size = 5000
+    instructions = [
+        {
+            "uploadUrl": f"https://upload.example/{i}",
+            "firstByte": first,
+            "lastByte": min(first + part_size, len(payload)) - 1,
+        }
+        for i, first in enumerate(range(0, len(payload), part_size))
+    ]
+    received: dict[str, bytes] = {}
+    lock = threading.Lock()
+
+    class FakeClient(LinkedInClient):
+        def _put_binary(self, url, data, content_type, content_length=None):
+            body = b"".join(data)
+            assert len(body) == content_length
+            time.sleep(0.01 * (6 - int(url.rsplit("/", 1)[1])))
+            with lock:
+                received[url] = body
+            return httpx.Response(200, headers={"etag": f"etag-{url[-1]}"})
+
+    client = FakeClient(access_token="tok", person_id="abc")
+    etags = client.upload_video_parts(instructions, str(path), concurrency=3)
+
+    assert etags == [f"etag-{i}" for i in range(len(instructions))]
+    assert b"".join(received[i["uploadUrl"]] for i in instructions) == payload
+
+
+def test_finalize_video_body_accepts_part_list():
+    from linkedin_sdk.media import _finalize_video_body
+
+    body = _finalize_video_body("urn:li:video:1", ["a", "b"], "tok")
+    assert body["finalizeUploadRequest"]["uploadedPartIds"] == ["a", "b"]
+    assert body["finalizeUploadRequest"]["uploadToken"] == "tok"
+    assert _finalize_video_body("urn:li:video:1", "a")["finalizeUploadRequest"][
+        "uploadedPartIds"
+    ] == ["a"]
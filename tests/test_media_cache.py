@@ -0,0 +1,90 @@
+"""Unit tests for MediaCache (no network needed)."""
+
+import asyncio
+import hashlib
+import itertools
+import time
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient, MediaCache
+from linkedin_sdk.media_cache import _file_digest
+
+
+def test_file_digest_streams_whole_file(tmp_path):
+    path = tmp_path / "big.bin"
+    data = b"x" * (3 * 1024 * 1024 + 17)
+    path.write_bytes(data)
+    assert _file_digest(str(path)) == hashlib.sha256(data).hexdigest()
+
+
+def test_get_set_expiry_and_persistence(tmp_path):
+    db = str(tmp_path / "media.db")
+    cache = MediaCache(db, ttl=60)
+    cache.set("d1", "urn:li:person:a", "image", "urn:li:image:1")
+    assert cache.get("d1", "urn:li:person:a", "image") == "urn:li:image:1"
+    assert cache.get("d1", "urn:li:person:b", "image") is None
+    assert cache.get("d1", "urn:li:person:a", "document") is None
+    cache.close()
+
+    reopened = MediaCache(db, ttl=0.01)
+    time.sleep(0.02)
+    assert reopened.get("d1", "urn:li:person:a", "image") is None
+    assert reopened.purge_expired() == 1
+    reopened.close()
+
+
+def _counting_client(cache):
+    counter = itertools.count(1)
+    uploads = []
+
+    class FakeClient(LinkedInClient):
+        def init_image_upload(self):
+            n = next(counter)
+            return {"uploadUrl": f"https://upload.example/{n}", "imageUrn": f"urn:li:image:{n}"}
+
+        def upload_file(self, upload_url, file_path, content_type):
+            uploads.append(file_path)
+            return {"statusCode": 201, "etag": ""}
+
+    return FakeClient(access_token="tok", person_id="abc", media_cache=cache), uploads
+
+
+def test_repeated_content_is_uploaded_once(tmp_path):
+    first = tmp_path / "logo.png"
+    copy = tmp_path / "logo-copy.png"
+    other = tmp_path / "banner.png"
+    first.write_bytes(b"logo")
+    copy.write_bytes(b"logo")
+    other.write_bytes(b"banner")
+
+    client, uploads = _counting_client(MediaCache(":memory:"))
+    assert client._upload_image(str(first)) == "urn:li:image:1"
+    assert client._upload_image(str(copy)) == "urn:li:image:1"
+    assert client._upload_image(str(other)) == "urn:li:image:2"
+    assert uploads == [str(first), str(other)]
+
+
+def test_async_repeated_content_is_uploaded_once(tmp_path):
+    path = tmp_path / "logo.png"
+    path.write_bytes(b"logo")
+
+    counter = itertools.count(1)
+    uploads = []
+
+    class FakeClient(AsyncLinkedInClient):
+        async def init_image_upload(self):
+            n = next(counter)
+            return {"uploadUrl": f"https://upload.example/{n}", "imageUrn": f"urn:li:image:{n}"}
+
+        async def upload_file(self, upload_url, file_path, content_type):
+            uploads.append(file_path)
+            return {"statusCode": 201, "etag": ""}
+
+    client = FakeClient(
+        access_token="tok", person_id="abc", media_cache=MediaCache(":memory:")
+    )
+
+    async def main():
+        return [await client._upload_image(str(path)) for _ in range(3)]
+
+    assert asyncio.run(main()) == ["urn:li:image:1"] * 3
+    assert uploads == [str(path)]
@@ -0,0 +1,52 @@
+"""Unit tests for request instrumentation (mock transport, no network needed)."""
+
+import httpx
+
+from linkedin_sdk import LinkedInClient, MetricsRegistry, RateLimiter, RequestEvent
+
+
+def test_histogram_quantiles():
+    metrics = MetricsRegistry()
+    for ms in range(1, 101):
+        metrics(RequestEvent("GET", "posts", 200, ms / 1000))
+    latency = metrics.snapshot()["posts"]["latency"]
+    assert latency["count"] == 100
+    assert latency["p50"] == 0.05
+    assert latency["p99"] == 0.1
+    assert sum(latency["buckets"].values()) == 100
+
+
+def test_client_reports_requests_and_uploads():
+    statuses = iter([429, 201])
+
+    def handler(request):
+        if request.url.host == "upload.example":
+            return httpx.Response(201, headers={"etag": "e"})
+        return httpx.Response(
+            next(statuses),
+            headers={"Retry-After": "0", "x-restli-id": "urn:li:share:1"},
+        )
+
+    metrics = MetricsRegistry()
+    events = []
+
+    def hook(event):
+        events.append(event)
+        metrics(event)
+
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", rate_limiter=RateLimiter(), on_request=hook
+    )
+    transport = httpx.MockTransport(handler)
+    client._http = httpx.Client(base_url="https://api.linkedin.com/rest", transport=transport)
+    client._http_upload = httpx.Client(transport=transport)
+
+    client.create_post("hello")
+    client.upload_binary("https://upload.example/x", b"12345", "image/png")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["posts"]["statuses"] == {201: 1}
+    assert snapshot["posts"]["retries"] == 1
+    assert snapshot["posts"]["request_bytes"] == events[0].request_bytes > 0
+    assert snapshot["upload"]["request_bytes"] == 5
+    assert snapshot["upload"]["request_bytes_per_second"] > 0
@@ -0,0 +1,97 @@
+"""Unit tests for the compact response models (no network needed)."""
+
+import asyncio
+
+import httpx
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient, MediaUpload, Post, PostPage
+
+
+def _post(n, **extra):
+    return {
+        "id": f"urn:li:share:{n}",
+        "author": "urn:li:person:abc",
+        "commentary": f"post {n}",
+        "visibility": "PUBLIC",
+        "lifecycleState": "PUBLISHED",
+        "createdAt": 1_700_000_000_000 + n,
+        "lastModifiedAt": 1_700_000_000_000 + n,
+        "distribution": {"feedDistribution": "MAIN_FEED"},
+        **extra,
+    }
+
+
+def _transport(total=5):
+    def handler(request):
+        start = int(request.url.params["start"])
+        count = int(request.url.params["count"])
+        elements = [_post(n) for n in range(start, min(start + count, total))]
+        return httpx.Response(
+            200,
+            json={"elements": elements, "paging": {"start": start, "count": count, "total": total}},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_post_from_api_is_slotted_and_interns_shared_values():
+    a = Post.from_api(_post(1, content={"article": {"source": "https://example.com"}}))
+    b = Post.from_api(_post(2))
+    assert not hasattr(a, "__dict__")
+    assert a.id == "urn:li:share:1"
+    assert a.lifecycle_state == "PUBLISHED"
+    assert a.created_at == 1_700_000_000_001
+    assert a.content_type == "article"
+    assert b.content_type is None
+    assert a.author is b.author
+
+
+def test_get_my_posts_models_decodes_lazily():
+    client = LinkedInClient(access_token="tok", person_id="abc", transport=_transport())
+    page = client.get_my_posts(limit=3, models=True)
+    assert isinstance(page, PostPage)
+    assert len(page) == 3
+    assert page.paging.total == 5
+    assert page[1].commentary == "post 1"
+    assert [p.id for p in page] == [f"urn:li:share:{n}" for n in range(3)]
+    assert isinstance(client.get_my_posts(limit=3), dict)
+
+
+def test_iter_my_posts_models():
+    client = LinkedInClient(access_token="tok", person_id="abc", transport=_transport())
+    for prefetch in (True, False):
+        posts = list(client.iter_my_posts(page_size=2, prefetch=prefetch, models=True))
+        assert all(isinstance(p, Post) for p in posts)
+        assert [p.id for p in posts] == [f"urn:li:share:{n}" for n in range(5)]
+
+
+def test_async_iter_my_posts_models():
+    async def run():
+        client = AsyncLinkedInClient(access_token="tok", person_id="abc", transport=_transport())
+        page = await client.get_my_posts(limit=2, models=True)
+        posts = [p async for p in client.iter_my_posts(page_size=2, models=True)]
+        return page, posts
+
+    page, posts = asyncio.run(run())
+    assert [p.id for p in page] == ["urn:li:share:0", "urn:li:share:1"]
+    assert [p.commentary for p in posts] == [f"post {n}" for n in range(5)]
+
+
+def test_media_upload_from_init_results():
+    image = MediaUpload.from_api({"uploadUrl": "https://u/1", "imageUrn": "urn:li:image:1"})
+    assert (image.urn, image.upload_url, image.parts) == ("urn:li:image:1", "https://u/1", ())
+
+    video = MediaUpload.from_api(
+        {
+            "uploadUrl": "https://u/p0",
+            "videoUrn": "urn:li:video:1",
+            "uploadToken": "t",
+            "uploadInstructions": [
+                {"uploadUrl": "https://u/p0", "firstByte": 0, "lastByte": 9},
+                {"uploadUrl": "https://u/p1", "firstByte": 10, "lastByte": 14},
+            ],
+        }
+    )
+    assert video.urn == "urn:li:video:1"
+    assert video.upload_token == "t"
+    assert [(p.first_byte, p.last_byte) for p in video.parts] == [(0, 9), (10, 14)]
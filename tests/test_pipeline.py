@@ -0,0 +1,100 @@
+"""Unit tests for the bulk publishing pipeline (fake client, no network needed)."""
+
+import threading
+import time
+
+from linkedin_sdk import LinkedInClient, PostSpec, PublishPipeline
+
+
+class FakeClient(LinkedInClient):
+    def __init__(self):
+        super().__init__(access_token="tok", person_id="abc")
+        self.lock = threading.Lock()
+        self.uploads_active = 0
+        self.uploads_peak = 0
+        self.created = []
+
+    def _upload_image(self, image_path):
+        with self.lock:
+            self.uploads_active += 1
+            self.uploads_peak = max(self.uploads_peak, self.uploads_active)
+        time.sleep(0.02)
+        with self.lock:
+            self.uploads_active -= 1
+        if "bad" in image_path:
+            raise FileNotFoundError(image_path)
+        return f"urn:li:image:{image_path}"
+
+    def create_post(self, commentary, visibility="PUBLIC", content=None, is_reshare_disabled=False):
+        time.sleep(0.01)
+        with self.lock:
+            self.created.append((commentary, content))
+        return {"postUrn": f"urn:li:share:{commentary}", "statusCode": 201}
+
+
+def test_pipeline_publishes_all_and_reports_errors():
+    client = FakeClient()
+    specs = [PostSpec(str(i), image_path=f"img{i}.png") for i in range(8)]
+    specs.append(PostSpec("bad", image_path="bad.png"))
+    specs.append(PostSpec("text-only"))
+
+    results = list(PublishPipeline(client, upload_concurrency=3).run(iter(specs)))
+
+    assert sorted(r.index for r in results) == list(range(10))
+    failed = [r for r in results if not r.ok]
+    assert [r.spec.commentary for r in failed] == ["bad"]
+    assert isinstance(failed[0].error, FileNotFoundError)
+    ok = {r.spec.commentary: r.result for r in results if r.ok}
+    assert ok["3"] == {
+        "postUrn": "urn:li:share:3",
+        "statusCode": 201,
+        "imageUrn": "urn:li:image:img3.png",
+    }
+    assert ok["text-only"]["postUrn"] == "urn:li:share:text-only"
+    assert 1 < client.uploads_peak <= 3
+
+
+def test_pipeline_overlaps_uploads_and_creates():
+    client = FakeClient()
+    specs = [PostSpec(str(i), image_path=f"img{i}.png") for i in range(12)]
+
+    start = time.monotonic()
+    results = list(PublishPipeline(client, upload_concurrency=4, create_concurrency=2).run(specs))
+    elapsed = time.monotonic() - start
+
+    assert all(r.ok for r in results)
+    # Serially this is 12 * (0.02 + 0.01) = 0.36s.
+    assert elapsed < 0.3
+
+
+class BatchProcessor:
+    """Stands in for ImageProcessor; records each batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def process_many(self, image_paths, out_dir):
+        self.batches.append(list(image_paths))
+        return [f"{path}.processed" for path in image_paths]
+
+
+def test_multi_image_spec_uploads_in_parallel_after_one_batch(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"img{i}.png"
+        path.write_bytes(b"png")
+        paths.append(str(path))
+
+    class MultiImageClient(FakeClient):
+        def _upload_prepared_image(self, image_path):
+            return FakeClient._upload_image(self, image_path)
+
+    client = MultiImageClient()
+    client.image_processor = BatchProcessor()
+    pipeline = PublishPipeline(client, part_concurrency=4)
+    (result,) = pipeline.run([PostSpec("gallery", image_paths=paths)])
+
+    assert result.ok
+    assert result.result["imageUrns"] == [f"urn:li:image:{p}.processed" for p in paths]
+    assert client.image_processor.batches == [paths]
+    assert 1 < client.uploads_peak <= 4
@@ -0,0 +1,149 @@
+"""Unit tests for PostIndex (no network needed)."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient, PostIndex
+
+
+def _post(n, author="urn:li:person:abc", **extra):
+    return {
+        "id": f"urn:li:share:{n}",
+        "author": author,
+        "commentary": f"post {n}",
+        "visibility": "PUBLIC",
+        "lifecycleState": "PUBLISHED",
+        "createdAt": 1_000 + n,
+        **extra,
+    }
+
+
+def test_query_filters_and_orders_newest_first():
+    index = PostIndex(":memory:")
+    index.ingest(
+        [
+            _post(1),
+            _post(2, content={"media": {"id": "urn:li:video:1"}}),
+            _post(3, author="urn:li:person:other", visibility="CONNECTIONS"),
+            _post(4, lifecycleState="DRAFT", content={"article": {"source": "https://x"}}),
+            _post(5, content={"media": {"id": "urn:li:image:1", "altText": "logo"}}),
+            {"commentary": "no id, skipped"},
+        ]
+    )
+    assert len(index) == 5
+    ids = lambda posts: [p["id"].rsplit(":", 1)[1] for p in posts]  # noqa: E731
+    assert ids(index.query()) == ["5", "4", "3", "2", "1"]
+    assert ids(index.query(author="urn:li:person:abc", lifecycle_state="PUBLISHED")) == ["5", "2", "1"]
+    assert ids(index.query(content_type="video")) == ["2"]
+    assert ids(index.query(content_type="image")) == ["5"]
+    assert ids(index.query(content_type="")) == ["3", "1"]
+    assert ids(index.query(visibility="CONNECTIONS")) == ["3"]
+    assert ids(index.query(since=1_002, until=1_004)) == ["3", "2"]
+    assert ids(index.query(limit=1)) == ["5"]
+
+    index.ingest([_post(1, commentary="edited")])
+    assert len(index) == 5
+    assert index.get("urn:li:share:1")["commentary"] == "edited"
+
+
+def test_indexes_exist(tmp_path):
+    index = PostIndex(str(tmp_path / "posts.db"))
+    plan = index._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM posts WHERE lifecycle_state = ? ORDER BY created_at DESC",
+        ("PUBLISHED",),
+    ).fetchall()
+    assert "posts_lifecycle" in str(plan)
+    names = {row[0] for row in index._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"posts_author", "posts_created", "posts_lifecycle", "posts_content_type"} <= names
+
+
+def _handler(request):
+    if request.method == "GET":
+        return httpx.Response(200, json={"elements": [_post(1), _post(2)], "paging": {}})
+    if request.method == "DELETE":
+        return httpx.Response(204)
+    if request.url.path == "/rest/posts":
+        return httpx.Response(201, headers={"x-restli-id": "urn:li:share:9"})
+    return httpx.Response(200)
+
+
+def test_client_ingests_pages_and_writes_through():
+    index = PostIndex(":memory:")
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", post_index=index,
+        transport=httpx.MockTransport(_handler),
+    )
+    client.get_my_posts()
+    assert len(index) == 2
+
+    client.create_post("Hello", visibility="CONNECTIONS")
+    created = index.get("urn:li:share:9")
+    assert created["commentary"] == "Hello"
+    assert created["visibility"] == "CONNECTIONS"
+    assert created["author"] == "urn:li:person:abc"
+
+    client.update_post("urn:li:share:9", commentary="Hello, world")
+    assert index.get("urn:li:share:9")["commentary"] == "Hello, world"
+    client.update_post("urn:li:share:404", commentary="not indexed")
+    assert index.get("urn:li:share:404") is None
+
+    client.delete_post("urn:li:share:1")
+    assert index.get("urn:li:share:1") is None
+    assert [p["id"] for p in index.query()] == ["urn:li:share:9", "urn:li:share:2"]
+
+
+def test_failed_write_leaves_index_untouched():
+    index = PostIndex(":memory:")
+    index.ingest([_post(1)])
+
+    def handler(request):
+        return httpx.Response(403, json={"message": "forbidden"})
+
+    client = LinkedInClient(
+        access_token="tok", person_id="abc", post_index=index,
+        transport=httpx.MockTransport(handler),
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        client.delete_post("urn:li:share:1")
+    with pytest.raises(httpx.HTTPStatusError):
+        client.update_post("urn:li:share:1", commentary="x")
+    assert index.get("urn:li:share:1")["commentary"] == "post 1"
+
+
+def test_async_client_writes_through():
+    index = PostIndex(":memory:")
+
+    def handler(request):
+        if request.method == "GET":
+            return _handler(request)
+        if request.method == "DELETE":
+            results = {"urn:li:share:1": {"status": 204}}
+            return httpx.Response(200, content=json.dumps({"results": results}))
+        return _handler(request)
+
+    async def run():
+        client = AsyncLinkedInClient(
+            access_token="tok", person_id="abc", post_index=index,
+            transport=httpx.MockTransport(handler),
+        )
+        await client.get_my_posts()
+        await client.create_post("Hi")
+        await client.delete_posts(["urn:li:share:1"])
+
+    asyncio.run(run())
+    assert sorted(p["id"] for p in index.query()) == ["urn:li:share:2", "urn:li:share:9"]
+
+
+def test_reopening_reclassifies_generic_media_rows(tmp_path):
+    path = str(tmp_path / "posts.db")
+    index = PostIndex(path)
+    index.ingest([_post(1, content={"media": {"id": "urn:li:document:7"}})])
+    with index._conn:
+        index._conn.execute("UPDATE posts SET content_type = 'media'")
+    index.close()
+
+    reopened = PostIndex(path)
+    assert [p["id"] for p in reopened.query(content_type="document")] == ["urn:li:share:1"]
@@ -28,3 +28,127 @@ def test_create_post_with_link(client: LinkedInClient, cleanup_urns: list[str]):
     )
     assert result["postUrn"]
     cleanup_urns.append(result["postUrn"])
+
+
+def _paged_posts(total: int):
+    posts = [{"id": f"urn:li:share:{i}"} for i in range(total)]
+
+    def page(limit: int, offset: int) -> dict:
+        return {
+            "elements": posts[offset:offset + limit],
+            "paging": {"start": offset, "count": limit, "total": total},
+        }
+
+    return posts, page
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_my_posts_walks_all_pages(prefetch: bool):
+    posts, page = _paged_posts(25)
+    calls = []
+
+    class FakeClient(LinkedInClient):
+        def get_my_posts(self, limit=10, offset=0, sort_by=None):
+            calls.append(offset)
+            return page(limit, offset)
+
+    client = FakeClient(access_token="tok", person_id="abc")
+    assert list(client.iter_my_posts(page_size=10, prefetch=prefetch)) == posts
+    assert sorted(calls) == [0, 10, 20]
+
+
+def test_iter_my_posts_stops_on_short_page_without_total():
+    class FakeClient(LinkedInClient):
+        def get_my_posts(self, limit=10, offset=0, sort_by=None):
+            n = 10 if offset == 0 else 3
+            return {"elements": [{"id": offset + i} for i in range(n)], "paging": {}}
+
+    client = FakeClient(access_token="tok", person_id="abc")
+    assert len(list(client.iter_my_posts(page_size=10))) == 13
+
+
+def test_async_iter_my_posts():
+    import asyncio
+
+    from linkedin_sdk import AsyncLinkedInClient
+
+    posts, page = _paged_posts(21)
+
+    class FakeClient(AsyncLinkedInClient):
+        async def get_my_posts(self, limit=10, offset=0, sort_by=None):
+            await asyncio.sleep(0)
+            return page(limit, offset)
+
+    async def run():
+        client = FakeClient(access_token="tok", person_id="abc")
+        return [post async for post in client.iter_my_posts(page_size=5)]
+
+    assert asyncio.run(run()) == posts
+
+
+def test_batch_get_and_delete_chunk_and_map_results():
+    import httpx
+    from urllib.parse import unquote
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        raw = request.url.raw_path.decode()
+        ids = [unquote(i) for i in raw.split("List(", 1)[1].rstrip(")").split(",")]
+        missing = {i for i in ids if i.endswith(":404")}
+        if request.method == "GET":
+            results = {i: {"id": i} for i in ids if i not in missing}
+        else:
+            results = {i: {"status": 204} for i in ids if i not in missing}
+        errors = {i: {"status": 404} for i in missing}
+        return httpx.Response(200, json={"results": results, "errors": errors})
+
+    client = LinkedInClient(access_token="tok", person_id="abc")
+    client._http = httpx.Client(
+        base_url="https://api.linkedin.com/rest", transport=httpx.MockTransport(handler)
+    )
+    urns = [f"urn:li:share:{i}" for i in range(5)] + ["urn:li:share:0", "urn:li:share:404"]
+
+    fetched = client.get_posts(urns, batch_size=2)
+    assert sorted(fetched["results"]) == sorted(set(urns) - {"urn:li:share:404"})
+    assert fetched["errors"] == {"urn:li:share:404": {"status": 404}}
+    assert len(requests) == 3
+
+    deleted = client.delete_posts(urns, batch_size=10)
+    assert deleted["results"]["urn:li:share:3"] == 204
+    assert "urn:li:share:404" in deleted["errors"]
+    assert requests[-1].method == "DELETE"
+    assert requests[-1].headers["X-RestLi-Method"] == "BATCH_DELETE"
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_my_posts_continues_past_short_pages_with_total(prefetch: bool):
+    posts = [{"id": f"urn:li:share:{i}"} for i in range(30)]
+    calls = []
+
+    class FakeClient(LinkedInClient):
+        def get_my_posts(self, limit=10, offset=0, sort_by=None):
+            calls.append(offset)
+            # The API may return fewer elements than requested mid-listing.
+            served = posts[offset:offset + limit - 1 if offset == 0 else offset + limit]
+            return {"elements": served, "paging": {"start": offset, "count": limit, "total": 30}}
+
+    client = FakeClient(access_token="tok", person_id="abc")
+    assert list(client.iter_my_posts(page_size=10, prefetch=prefetch)) == posts
+    assert sorted(calls) == [0, 9, 19, 29]
+
+
+def test_iter_my_posts_follows_next_link_without_total():
+    posts = [{"id": f"urn:li:share:{i}"} for i in range(12)]
+
+    class FakeClient(LinkedInClient):
+        def get_my_posts(self, limit=10, offset=0, sort_by=None):
+            served = posts[offset:offset + 5]
+            links = []
+            if offset + 5 < len(posts):
+                links.append({"rel": "next", "href": f"/rest/posts?q=author&start={offset + 5}&count=10"})
+            return {"elements": served, "paging": {"start": offset, "count": limit, "links": links}}
+
+    client = FakeClient(access_token="tok", person_id="abc")
+    assert list(client.iter_my_posts(page_size=10, prefetch=False)) == posts
@@ -0,0 +1,94 @@
+"""Unit tests for the rate limiter and 429 handling (mock transport, no network needed)."""
+
+import time
+
+import httpx
+import pytest
+
+from linkedin_sdk import LinkedInClient, RateLimiter, TokenBucket
+from linkedin_sdk.ratelimit import _endpoint_family, _parse_retry_after
+
+
+def test_endpoint_family():
+    assert _endpoint_family("/posts?author=x&q=author") == "posts"
+    assert _endpoint_family("/posts/urn%3Ali%3Ashare%3A1") == "posts"
+    assert _endpoint_family("/socialActions/urn%3A1/comments") == "socialActions"
+    assert _endpoint_family("/images?action=initializeUpload") == "images"
+    assert _endpoint_family("/userinfo") == "userinfo"
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after("3") == 3.0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("garbage") is None
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    bucket = TokenBucket(rate=50.0, burst=5)
+    start = time.monotonic()
+    for _ in range(10):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    # 5 immediate, 5 more at 50/s -> ~0.1s
+    assert 0.07 < elapsed < 0.5
+
+
+def test_unlisted_family_is_unlimited_without_default():
+    limiter = RateLimiter({"posts": (1.0, 1)})
+    assert limiter.bucket_for("/posts") is not None
+    assert limiter.bucket_for("/reactions?actor=x") is None
+    limiter = RateLimiter(default=(1.0, 1))
+    assert limiter.bucket_for("/reactions") is limiter.bucket_for("/reactions?actor=y")
+
+
+def test_retry_delay_prefers_retry_after():
+    limiter = RateLimiter(max_backoff=30)
+    resp = httpx.Response(429, headers={"Retry-After": "2"})
+    assert 2.0 <= limiter.retry_delay(resp, 0) <= 2.2
+    resp = httpx.Response(429)
+    assert 0 <= limiter.retry_delay(resp, 3) <= 8
+
+
+def _mock_client(handler, limiter) -> LinkedInClient:
+    client = LinkedInClient(access_token="tok", person_id="abc", rate_limiter=limiter)
+    client._http = httpx.Client(
+        base_url="https://api.linkedin.com/rest", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_429_is_retried_after_retry_after():
+    statuses = iter([429, 429, 204])
+
+    def handler(request):
+        return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+    client = _mock_client(handler, RateLimiter(max_retries=3))
+    assert client.delete_post("urn:li:share:1") == 204
+
+
+def test_429_raised_once_retries_exhausted():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    client = _mock_client(handler, RateLimiter(max_retries=2))
+    with pytest.raises(httpx.HTTPStatusError):
+        client.delete_post("urn:li:share:1")
+    assert len(calls) == 3
+
+
+def test_429_not_retried_without_limiter():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429)
+
+    client = _mock_client(handler, None)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.delete_post("urn:li:share:1")
+    assert len(calls) == 1
@@ -0,0 +1,155 @@
+"""Unit tests for TokenManager (mock transport, no network needed)."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient, TokenManager
+
+
+def _refresher(tokens, delay=0.0):
+    """Fake refresh_token call issuing tok-1, tok-2, ... and counting calls."""
+    calls = []
+
+    def refresh(refresh_token, client_id, client_secret):
+        calls.append(refresh_token)
+        time.sleep(delay)
+        return {
+            "access_token": f"tok-{len(calls)}",
+            "expires_in": tokens.get("expires_in", 3600),
+            "refresh_token": f"refresh-{len(calls)}",
+        }
+
+    return refresh, calls
+
+
+def _echo_auth_transport(seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"sub": "abc"})
+
+    return httpx.MockTransport(handler)
+
+
+def test_from_token_response_tracks_expiry():
+    manager = TokenManager.from_token_response(
+        {"access_token": "a", "expires_in": 600, "refresh_token": "r"},
+        "id",
+        "secret",
+        refresh_margin=60,
+        background=False,
+    )
+    assert manager.access_token == "a"
+    assert manager.refresh_token == "r"
+    assert 530 < manager.refresh_due() - time.time() <= 540
+    assert not manager.needs_refresh()
+
+
+def test_request_refreshes_expiring_token_and_swaps_headers():
+    refresh, calls = _refresher({})
+    manager = TokenManager(
+        "id",
+        "secret",
+        "refresh-0",
+        access_token="old",
+        expires_at=time.time() + 10,
+        refresh_margin=60,
+        background=False,
+        refresh=refresh,
+    )
+    seen = []
+    client = LinkedInClient(
+        person_id="abc", token_manager=manager, transport=_echo_auth_transport(seen)
+    )
+    assert client.access_token == "old"
+
+    client.get_user_info()
+    client._get("/posts")
+    assert calls == ["refresh-0"]
+    assert seen == ["Bearer tok-1", "Bearer tok-1"]
+    assert client.access_token == "tok-1"
+    assert manager.refresh_token == "refresh-1"
+    client.close()
+
+
+def test_concurrent_refreshes_are_single_flighted():
+    refresh, calls = _refresher({}, delay=0.05)
+    manager = TokenManager(
+        "id",
+        "secret",
+        "refresh-0",
+        access_token="old",
+        expires_at=time.time() - 1,
+        background=False,
+        refresh=refresh,
+    )
+    seen = []
+    client = LinkedInClient(
+        person_id="abc",
+        token_manager=manager,
+        transport=_echo_auth_transport(seen),
+        coalesce=False,
+    )
+    threads = [threading.Thread(target=client.get_user_info) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == ["refresh-0"]
+    assert seen == ["Bearer tok-1"] * 8
+    client.close()
+
+
+def test_background_refresh_before_expiry():
+    refresh, calls = _refresher({"expires_in": 3600})
+    refreshed = threading.Event()
+    manager = TokenManager(
+        "id",
+        "secret",
+        "refresh-0",
+        access_token="old",
+        expires_at=time.time() + 0.1,
+        refresh_margin=0.05,
+        refresh=refresh,
+        on_refresh=lambda response: refreshed.set(),
+    )
+    client = LinkedInClient(person_id="abc", token_manager=manager)
+    _ = client._http_v2
+    assert refreshed.wait(2)
+    assert client.access_token == "tok-1"
+    assert client._http_v2.headers["Authorization"] == "Bearer tok-1"
+    client.close()
+    assert manager._thread is None
+
+
+def test_async_client_refreshes_off_loop():
+    refresh, calls = _refresher({})
+    manager = TokenManager(
+        "id",
+        "secret",
+        "refresh-0",
+        access_token="old",
+        expires_at=time.time() - 1,
+        background=False,
+        refresh=refresh,
+    )
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"sub": "abc"})
+
+    async def main():
+        async with AsyncLinkedInClient(
+            person_id="abc",
+            token_manager=manager,
+            transport=httpx.MockTransport(handler),
+            coalesce=False,
+        ) as client:
+            await asyncio.gather(*(client.get_user_info() for _ in range(5)))
+
+    asyncio.run(main())
+    assert calls == ["refresh-0"]
+    assert seen == ["Bearer tok-1"] * 5
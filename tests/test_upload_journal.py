@@ -0,0 +1,147 @@
+"""Unit tests for resumable video uploads (no network needed)."""
+
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from linkedin_sdk import AsyncLinkedInClient, LinkedInClient, UploadJournal
+from linkedin_sdk.upload_journal import _journal_key
+
+PARTS = 4
+
+
+def _instructions():
+    return [
+        {"uploadUrl": f"https://upload.example/part/{i}", "firstByte": i * 4, "lastByte": i * 4 + 3}
+        for i in range(PARTS)
+    ]
+
+
+def _video(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"v" * 4 * PARTS)
+    return str(path)
+
+
+def _fake_client(journal, fail_part=None, fail_status=None):
+    calls = {"init": 0, "parts": [], "finalize": []}
+
+    class FakeClient(LinkedInClient):
+        def init_video_upload(self, file_size):
+            calls["init"] += 1
+            return {
+                "videoUrn": f"urn:li:video:{calls['init']}",
+                "uploadToken": "tok",
+                "uploadInstructions": _instructions(),
+            }
+
+        def _put_binary(self, url, content, content_type, content_length=None):
+            index = int(url.rsplit("/", 1)[1])
+            if index == fail_part:
+                if fail_status is not None:
+                    request = httpx.Request("PUT", url)
+                    raise httpx.HTTPStatusError(
+                        "rejected", request=request, response=httpx.Response(fail_status, request=request)
+                    )
+                raise httpx.ConnectError("connection reset")
+            calls["parts"].append(index)
+            return httpx.Response(200, headers={"etag": f"etag-{index}"})
+
+        def finalize_video(self, video_urn, etags, upload_token=""):
+            calls["finalize"].append((video_urn, etags))
+            return {}
+
+    client = FakeClient(access_token="tok", person_id="abc", upload_journal=journal)
+    return client, calls
+
+
+def test_retry_skips_finished_parts(tmp_path):
+    journal = UploadJournal(str(tmp_path / "journal"))
+    video = _video(tmp_path)
+
+    client, calls = _fake_client(journal, fail_part=2)
+    with pytest.raises(httpx.ConnectError):
+        client._upload_video(video, concurrency=1)
+    assert calls["finalize"] == []
+    state = journal.load(_journal_key(client.person_urn, video))
+    assert state["etags"] == {0: "etag-0", 1: "etag-1"}
+
+    client, calls = _fake_client(journal)
+    assert client._upload_video(video, concurrency=2) == "urn:li:video:1"
+    assert calls["init"] == 0
+    assert sorted(calls["parts"]) == [2, 3]
+    assert calls["finalize"] == [
+        ("urn:li:video:1", ["etag-0", "etag-1", "etag-2", "etag-3"])
+    ]
+    assert os.listdir(journal.directory) == []
+
+
+def test_client_error_discards_journal(tmp_path):
+    journal = UploadJournal(str(tmp_path / "journal"))
+    video = _video(tmp_path)
+
+    client, _ = _fake_client(journal, fail_part=1, fail_status=403)
+    with pytest.raises(httpx.HTTPStatusError):
+        client._upload_video(video, concurrency=1)
+    assert os.listdir(journal.directory) == []
+
+
+def test_changed_file_or_expired_journal_starts_over(tmp_path):
+    journal = UploadJournal(str(tmp_path / "journal"), max_age=60)
+    video = _video(tmp_path)
+    key = _journal_key("urn:li:person:abc", video)
+    journal.start(key, {"videoUrn": "urn:li:video:9", "uploadToken": "", "uploadInstructions": []})
+    assert journal.load(key) is not None
+
+    with open(video, "ab") as f:
+        f.write(b"more")
+    assert _journal_key("urn:li:person:abc", video) != key
+
+    expired = UploadJournal(journal.directory, max_age=0.01)
+    time.sleep(0.02)
+    assert expired.load(key) is None
+    assert os.listdir(journal.directory) == []
+
+
+def test_async_retry_skips_finished_parts(tmp_path):
+    journal = UploadJournal(str(tmp_path / "journal"))
+    video = _video(tmp_path)
+    calls = {"init": 0, "parts": [], "finalize": []}
+    fail = {"part": 3}
+
+    class FakeClient(AsyncLinkedInClient):
+        async def init_video_upload(self, file_size):
+            calls["init"] += 1
+            return {
+                "videoUrn": "urn:li:video:1",
+                "uploadToken": "tok",
+                "uploadInstructions": _instructions(),
+            }
+
+        async def _put_binary(self, url, content, content_type, content_length=None):
+            index = int(url.rsplit("/", 1)[1])
+            if index == fail["part"]:
+                raise httpx.ConnectError("connection reset")
+            calls["parts"].append(index)
+            return httpx.Response(200, headers={"etag": f"etag-{index}"})
+
+        async def finalize_video(self, video_urn, etags, upload_token=""):
+            calls["finalize"].append((video_urn, etags))
+            return {}
+
+    async def run():
+        client = FakeClient(access_token="tok", person_id="abc", upload_journal=journal)
+        with pytest.raises(httpx.ConnectError):
+            await client._upload_video(video, concurrency=1)
+        fail["part"] = None
+        return await client._upload_video(video, concurrency=2)
+
+    assert asyncio.run(run()) == "urn:li:video:1"
+    assert calls["init"] == 1
+    assert calls["parts"] == [0, 1, 2, 3]
+    assert calls["finalize"] == [
+        ("urn:li:video:1", ["etag-0", "etag-1", "etag-2", "etag-3"])
+    ]